@@ -0,0 +1 @@
+"""Standard blank module __init__."""
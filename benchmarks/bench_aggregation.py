@@ -0,0 +1,97 @@
+"""
+Benchmark for totalling spending by category.
+
+Compares a loop over Transaction properties with monzo.aggregation on a list of Transaction and on a
+TransactionBatch, with and without NumPy.
+
+    python -m benchmarks.bench_aggregation --count 200000
+"""
+
+import argparse
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from monzo import aggregation
+from monzo.authentication import Authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.transaction_batch import TransactionBatch
+from tests.helpers import load_data
+
+CATEGORIES = ("bills", "eating_out", "entertainment", "general", "groceries", "shopping", "transport")
+
+
+def loop_by_category(transactions: list[Transaction]) -> dict[str, int]:
+    """
+    Total spending by category with a loop over each transaction.
+
+    Args:
+        transactions: Transactions to total
+
+    Returns:
+        Dictionary of category to total
+    """
+    result: dict[str, int] = {}
+    for transaction in transactions:
+        if transaction.include_in_spending and not transaction.decline_reason and not transaction.amount_is_pending:
+            result[transaction.category] = result.get(transaction.category, 0) + transaction.amount
+    return result
+
+
+def timed(function, **kwargs) -> float:
+    """
+    Time a single call.
+
+    Args:
+        function: Function to call
+        kwargs: Arguments for the function
+
+    Returns:
+        Seconds taken
+    """
+    start = perf_counter()
+    function(**kwargs)
+    return perf_counter() - start
+
+
+def run(count: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        count: Number of transactions to total
+    """
+    auth = Authentication(client_id="client_id", client_secret="client_secret", redirect_url="", access_token="token")
+    template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+    base = datetime(year=2022, month=8, day=9, tzinfo=UTC)
+    transactions_data = [
+        {
+            **template,
+            "id": f"tx_{index:010d}",
+            "amount": -(index % 5000),
+            "category": CATEGORIES[index % len(CATEGORIES)],
+            "created": f"{base - timedelta(minutes=index):%Y-%m-%dT%H:%M:%S}.000Z",
+            "decline_reason": "INSUFFICIENT_FUNDS" if index % 50 == 0 else "",
+        }
+        for index in range(count)
+    ]
+    transactions = [Transaction(auth=auth, transaction_data=data) for data in transactions_data]
+    batch = TransactionBatch(auth=auth)
+    batch.extend(transactions_data=transactions_data)
+    numpy = aggregation.numpy
+
+    baseline = timed(loop_by_category, transactions=transactions)
+    print(f"loop over Transaction:      {baseline * 1000:8.1f}ms")
+    for name, use_numpy in (("numpy", True), ("python", False)):
+        if use_numpy and numpy is None:
+            continue
+        aggregation.numpy = numpy if use_numpy else None
+        for source, value in (("list", transactions), ("batch", batch)):
+            taken = timed(aggregation.spend_by_category, transactions=value)
+            print(f"{name:<6} {source:<5} aggregation:   {taken * 1000:8.1f}ms ({baseline / taken:.1f}x)")
+    aggregation.numpy = numpy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000, help="transactions to total")
+    run(count=parser.parse_args().count)
@@ -0,0 +1,123 @@
+"""
+Benchmark pooled keep-alive connections against a connection per request.
+
+Starts a local TLS server standing in for the Monzo API and reports requests per second when every request opens a
+new connection with urlopen (the previous behaviour) and when requests share HttpIO's connection pool.
+
+Requires the openssl command line tool to create a throwaway certificate.
+
+    python -m benchmarks.bench_connection_pool --requests 500
+"""
+
+import argparse
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from urllib.request import Request, urlopen
+
+from monzo.httpio import ConnectionPool, HttpIO
+
+BODY = b'{"authenticated": true, "client_id": "client123", "user_id": "user123"}'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler returning a whoami style payload over HTTP/1.1."""
+
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Respond to a GET request."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+
+def create_certificate(directory: Path) -> tuple[Path, Path]:
+    """
+    Create a self-signed certificate for localhost.
+
+    Args:
+        directory: Directory to write the certificate and key to
+
+    Returns:
+        Tuple of the certificate and key paths
+    """
+    cert = directory / "cert.pem"
+    key = directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def run(requests: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        requests: Number of sequential requests to make for each strategy
+    """
+    with TemporaryDirectory() as directory:
+        cert, key = create_certificate(Path(directory))
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(certfile=cert, keyfile=key)
+        client_context = ssl.create_default_context(cafile=str(cert))
+
+        server = ThreadingHTTPServer(("localhost", 0), StandInHandler)
+        server.socket = server_context.wrap_socket(server.socket, server_side=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"https://localhost:{server.server_address[1]}"
+
+        start = perf_counter()
+        for _ in range(requests):
+            with urlopen(Request(f"{url}/ping/whoami"), timeout=10, context=client_context) as fh:
+                fh.read()
+        before = requests / (perf_counter() - start)
+
+        pool = ConnectionPool(ssl_context=client_context)
+        http = HttpIO(url=url, pool=pool)
+        start = perf_counter()
+        for _ in range(requests):
+            http.get(path="/ping/whoami")
+        after = requests / (perf_counter() - start)
+
+        pool.close()
+        server.shutdown()
+
+    print(f"urlopen per request: {before:8.1f} req/s")
+    print(f"pooled keep-alive:   {after:8.1f} req/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="requests per strategy")
+    run(requests=parser.parse_args().requests)
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for parsing Monzo timestamps.
+
+Compares the previous strptime based parser with monzo.helpers.create_date for unique timestamps and for repeated
+timestamps, where create_date is served from its memo.
+
+    python -m benchmarks.bench_create_date --count 100000
+"""
+
+import argparse
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from monzo.helpers import create_date
+
+
+def strptime_date(date_str: str) -> datetime:
+    """
+    Parse a timestamp the way create_date previously did.
+
+    Args:
+        date_str: Date and time as a string
+
+    Returns:
+        Converted date and time
+    """
+    return datetime.strptime(date_str[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
+
+
+def time_parser(parser, values: list[str]) -> float:
+    """
+    Time parsing every value.
+
+    Args:
+        parser: Function parsing a single timestamp
+        values: Timestamps to parse
+
+    Returns:
+        Timestamps parsed per second
+    """
+    start = perf_counter()
+    for value in values:
+        parser(value)
+    return len(values) / (perf_counter() - start)
+
+
+def run(count: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        count: Number of timestamps to parse for each case
+    """
+    base = datetime(year=2022, month=8, day=9, tzinfo=UTC)
+    dates = [base + timedelta(milliseconds=index * 1001) for index in range(count)]
+    unique = [f"{date:%Y-%m-%dT%H:%M:%S}.{date.microsecond // 1000:03d}Z" for date in dates]
+    repeated = [unique[index % 100] for index in range(count)]
+
+    for name, values in (("unique", unique), ("repeated", repeated)):
+        create_date.cache_clear()
+        before = time_parser(strptime_date, values)
+        after = time_parser(create_date, values)
+        print(f"{name:<9} strptime: {before:12,.0f}/s  create_date: {after:12,.0f}/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000, help="timestamps per case")
+    run(count=parser.parse_args().count)
@@ -0,0 +1,235 @@
+"""Functions to total spending across many transactions."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Hashable, Iterable
+from datetime import date, timedelta
+from itertools import compress
+from typing import Any
+
+from monzo.endpoints.transaction import Transaction
+from monzo.transaction_batch import EPOCH, CodedColumn, TransactionBatch
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+PERIODS = ("day", "week", "month")
+
+_EPOCH_DATE = EPOCH.date()
+
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+TRANSACTIONS_TYPE = TransactionBatch | Iterable[Transaction]
+
+
+def _merchant_id(transaction: Transaction) -> str:
+    """
+    Fetch the merchant ID of a transaction whether or not the merchant was expanded.
+
+    Args:
+        transaction: Transaction to read
+
+    Returns:
+        Merchant ID or an empty string
+    """
+    merchant: Any = transaction.merchant
+    if isinstance(merchant, dict):
+        merchant = merchant.get("id")
+    return merchant or ""
+
+
+def _total_batch(
+    column: str,
+    amounts: array[int],
+    batch: TransactionBatch,
+    include_pending: bool,
+) -> dict[Any, int]:
+    """
+    Total amounts grouped by a column for the transactions in a batch that count as spending.
+
+    With NumPy the integer codes of the column are used as they are, days are numbered with a single unique, and the
+    amounts are summed into int64 totals, otherwise the included rows are totalled in one loop.
+
+    Args:
+        column: One of "category", "currency", "day" or "merchant"
+        amounts: Amount for each row
+        batch: Batch to total
+        include_pending: True to count transactions whose amount is pending
+
+    Returns:
+        Dictionary of key to total
+    """
+    coded: CodedColumn | None = None
+    if column != "day":
+        coded = {
+            "category": batch.categories,
+            "currency": batch.local_currencies,
+            "merchant": batch.merchants,
+        }[column]
+    not_declined = batch.decline_reasons.code(value="")
+    if not_declined is None:
+        # Every transaction was declined
+        return {}
+    if numpy is None:
+        keys: Iterable[Hashable]
+        if coded is None:
+            keys = [created // _MICROSECONDS_PER_DAY for created in batch.created]
+        else:
+            keys = coded
+        mask = [
+            included and decline == not_declined and (include_pending or not pending)
+            for included, pending, decline in zip(
+                batch.include_in_spending, batch.amount_is_pending, batch.decline_reasons.codes, strict=True
+            )
+        ]
+        result: dict[Any, int] = {}
+        for key, amount in zip(compress(keys, mask), compress(amounts, mask), strict=True):
+            result[key] = result.get(key, 0) + amount
+        return result
+    selected = numpy.frombuffer(batch.include_in_spending, dtype=numpy.int8) != 0
+    selected &= numpy.frombuffer(batch.decline_reasons.codes, dtype=numpy.uintc) == not_declined
+    if not include_pending:
+        selected &= numpy.frombuffer(batch.amount_is_pending, dtype=numpy.int8) == 0
+    values: list[Any]
+    if coded is None:
+        days = numpy.frombuffer(batch.created, dtype=numpy.int64)[selected] // _MICROSECONDS_PER_DAY
+        unique, codes = numpy.unique(days, return_inverse=True)
+        values = unique.tolist()
+    else:
+        codes = numpy.frombuffer(coded.codes, dtype=numpy.uintc)[selected].astype(numpy.intp)
+        values = coded.values
+    totals = numpy.zeros(len(values), dtype=numpy.int64)
+    numpy.add.at(totals, codes, numpy.frombuffer(amounts, dtype=numpy.int64)[selected])
+    counts = numpy.bincount(codes, minlength=len(values))
+    return {values[index]: int(totals[index]) for index in numpy.flatnonzero(counts)}
+
+
+def _total(
+    transactions: TRANSACTIONS_TYPE,
+    column: str,
+    include_pending: bool,
+    local: bool = False,
+) -> dict[Any, int]:
+    """
+    Total spending grouped by a column.
+
+    Only transactions included in spending that were not declined are counted. A collection of Transaction is totalled
+    in a single loop, a TransactionBatch is totalled column by column.
+
+    Args:
+        transactions: Batch or collection of transactions
+        column: One of "category", "currency", "day" or "merchant"
+        include_pending: True to count transactions whose amount is pending
+        local: True to total the local amount rather than the amount
+
+    Returns:
+        Dictionary of key to total amount in pence/cents, days are numbered from the epoch
+    """
+    if isinstance(transactions, TransactionBatch):
+        return _total_batch(
+            column=column,
+            amounts=transactions.local_amounts if local else transactions.amounts,
+            batch=transactions,
+            include_pending=include_pending,
+        )
+    key: Callable[[Transaction], Hashable] = {
+        "category": lambda transaction: transaction.category,
+        "currency": lambda transaction: transaction.local_currency,
+        "day": lambda transaction: (transaction.created.date() - _EPOCH_DATE).days,
+        "merchant": _merchant_id,
+    }[column]
+    result: dict[Any, int] = {}
+    for transaction in transactions:
+        if transaction.decline_reason or not transaction.include_in_spending:
+            continue
+        if transaction.amount_is_pending and not include_pending:
+            continue
+        group = key(transaction)
+        result[group] = result.get(group, 0) + (transaction.local_amount if local else transaction.amount)
+    return result
+
+
+def spend_by_category(transactions: TRANSACTIONS_TYPE, include_pending: bool = False) -> dict[str, int]:
+    """
+    Total spending grouped by category.
+
+    Only transactions included in spending that were not declined are counted.
+
+    Args:
+        transactions: Batch or collection of transactions
+        include_pending: True to count transactions whose amount is pending
+
+    Returns:
+        Dictionary of category to total amount in pence/cents
+    """
+    return _total(transactions=transactions, column="category", include_pending=include_pending)
+
+
+def spend_by_currency(transactions: TRANSACTIONS_TYPE, include_pending: bool = False) -> dict[str, int]:
+    """
+    Total spending grouped by the local currency of each transaction.
+
+    Only transactions included in spending that were not declined are counted.
+
+    Args:
+        transactions: Batch or collection of transactions
+        include_pending: True to count transactions whose amount is pending
+
+    Returns:
+        Dictionary of currency to total local amount in pence/cents
+    """
+    return _total(transactions=transactions, column="currency", include_pending=include_pending, local=True)
+
+
+def spend_by_merchant(transactions: TRANSACTIONS_TYPE, include_pending: bool = False) -> dict[str, int]:
+    """
+    Total spending grouped by merchant.
+
+    Only transactions included in spending that were not declined are counted, transactions without a merchant are
+    grouped under an empty string.
+
+    Args:
+        transactions: Batch or collection of transactions
+        include_pending: True to count transactions whose amount is pending
+
+    Returns:
+        Dictionary of merchant ID to total amount in pence/cents
+    """
+    return _total(transactions=transactions, column="merchant", include_pending=include_pending)
+
+
+def spend_by_period(
+    transactions: TRANSACTIONS_TYPE,
+    period: str = "day",
+    include_pending: bool = False,
+) -> dict[date, int]:
+    """
+    Total spending grouped by the day, week or month a transaction was created in UTC.
+
+    Only transactions included in spending that were not declined are counted.
+
+    Args:
+        transactions: Batch or collection of transactions
+        period: One of "day", "week" (starting Monday) or "month"
+        include_pending: True to count transactions whose amount is pending
+
+    Returns:
+        Dictionary of the first day of each period to total amount in pence/cents, in date order
+
+    Raises:
+        ValueError: If the period is not valid
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Period must be one of {', '.join(PERIODS)}")
+    result: dict[date, int] = {}
+    for day, total in sorted(_total(transactions=transactions, column="day", include_pending=include_pending).items()):
+        start = _EPOCH_DATE + timedelta(days=day)
+        if period == "week":
+            start -= timedelta(days=start.weekday())
+        elif period == "month":
+            start = start.replace(day=1)
+        result[start] = result.get(start, 0) + total
+    return result
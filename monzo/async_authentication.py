@@ -0,0 +1,219 @@
+"""Class to allow authentication on the Monzo API using asyncio."""
+
+import asyncio
+import logging
+
+from monzo.async_httpio import AsyncHttpIO
+from monzo.authentication import MONZO_API_URL, REFRESH_MARGIN, Authentication
+from monzo.codec import JsonCodec
+from monzo.exceptions import MonzoArgumentError, MonzoAuthenticationError, MonzoError, MonzoHTTPError
+from monzo.httpio import DEFAULT_TIMEOUT, REQUEST_RESPONSE_TYPE, HttpIO
+from monzo.rate_limit import RateLimiter
+from monzo.response_cache import ResponseCache
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class AsyncAuthentication(Authentication):
+    """
+    Class to manage authentication using asyncio.
+
+    Behaves as Authentication except that requests are made on an event loop, make_request and the methods that
+    call the API are coroutines. An instantiated copy of this class is passed to the fetch_async class methods of
+    each endpoint, the synchronous endpoint methods raise MonzoAuthenticationError if given one.
+    """
+
+    __slots__ = ["_async_http", "_async_refresh_lock"]
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_url: str,
+        access_token: str = "",
+        access_token_expiry: int = 0,
+        refresh_token: str = "",
+        http: HttpIO | None = None,
+        async_http: AsyncHttpIO | None = None,
+        rate_limiter: RateLimiter | None = None,
+        flow_id: str = "",
+        response_cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        """
+        Initialize AsyncAuthentication.
+
+        Args:
+            client_id: Client ID generated at https://developers.monzo.com
+            client_secret: Client Secret generated at https://developers.monzo.com
+            redirect_url: Redirect URL for authentication
+            access_token: Pre existing access token
+            access_token_expiry: Token expiry as a unix timestamp
+            refresh_token: Refresh token to renew access tokens
+            http: HttpIO instance to share, by default a new one with its own connection pool is created
+            async_http: AsyncHttpIO instance to share, by default a new one with its own connection pool is created
+            rate_limiter: Rate limiter to pace requests, may be shared between Authentication objects
+            flow_id: Identifier for the authentication flow, concurrent flows with different IDs keep separate state
+                tokens. Letters, digits, hyphens and underscores only.
+            response_cache: Cache for responses from read endpoints, may be shared between Authentication objects
+            codec: JSON codec for request and response bodies, by default the codec of http or the fastest installed.
+                When http or async_http is shared it must already use this codec.
+        """
+        if codec is None and http is None and async_http is not None:
+            codec = async_http.codec
+        super().__init__(
+            client_id=client_id,
+            client_secret=client_secret,
+            redirect_url=redirect_url,
+            access_token=access_token,
+            access_token_expiry=access_token_expiry,
+            refresh_token=refresh_token,
+            http=http,
+            rate_limiter=rate_limiter,
+            flow_id=flow_id,
+            response_cache=response_cache,
+            codec=codec,
+        )
+        if async_http is not None and async_http.codec.name != self._codec.name:
+            raise MonzoArgumentError("async_http must use the same codec as http")
+        self._async_http: AsyncHttpIO = async_http or AsyncHttpIO(MONZO_API_URL, codec=self._codec)
+        self._async_refresh_lock: asyncio.Lock = asyncio.Lock()
+
+    async def authenticate(self, authorization_token: str, state_token: str) -> None:  # type: ignore[override]
+        """
+        Completes authentication once the authentication URL has been visited.
+
+        Args:
+            authorization_token: Authorization code provided by Monzo
+            state_token: Pre-agreed state token to validate against
+
+        Raises:
+            MonzoAuthenticationError On missing authorization token or mismatching state tokens
+        """
+        self._validate_state(authorization_token=authorization_token, state_token=state_token)
+        await self._exchange_token(authorization_token=authorization_token)
+
+    async def logout(self) -> None:  # type: ignore[override]
+        """Invalidate the access token."""
+        logger.info(msg="Invalidating token")
+        await self.make_request(path="/oauth2/logout", method="post")
+
+    async def make_request(  # type: ignore[override]
+        self,
+        path: str,
+        authenticated: bool = True,
+        method: str = "GET",
+        data=None,
+        headers=None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> REQUEST_RESPONSE_TYPE:
+        """
+        Make an API call to Monzo.
+
+        Args:
+            path: Path for the API call
+            authenticated: True if authenticated request should be made otherwise False
+            method: Method for the API call (DELETE, GET, POST, PUT)
+            data: Dictionary of data to be posted as form data or URL parameters
+            headers: Dictionary of headers for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+            Dictionary containing headers and data from a query response
+
+        Raises:
+            MonzoHTTPError: On using an invalid method
+            MonzoRateError: If the rate limiter timed out waiting for capacity
+        """
+        if self._token_expiring():
+            await self.refresh_if_expiring()
+        if data is None:
+            data = {}
+        if headers is None:
+            headers = {}
+        if authenticated:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+        method = method.lower()
+        try:
+            connection = getattr(self._async_http, method)
+        except AttributeError as exc:
+            raise MonzoHTTPError("Specified HTTP method is not supported") from exc
+        cache_key, generation, cached = self._cache_lookup(path=path, method=method, data=data, headers=headers)
+        if cached is not None:
+            return cached
+        if self._rate_limiter:
+            await self._rate_limiter.acquire_async(path=path)
+        response = await connection(path=path, data=data, headers=headers, timeout=timeout)
+        self._cache_store(path=path, method=method, key=cache_key, generation=generation, response=response)
+        return response
+
+    async def refresh_access(self) -> None:  # type: ignore[override]
+        """
+        Fetch a new access token using a refresh token.
+
+        Does not use make_request to avoid circular calls.
+
+        Raises:
+            MonzoAuthenticationError: On lack of refresh token or failure to refresh a token
+        """
+        logger.info(msg="Fetching new token")
+        if not self.refresh_token:
+            logger.warning(msg="Token refresh failed: no refresh token available")
+            raise MonzoAuthenticationError("Unable to refresh without a refresh token")
+        try:
+            res = await self._async_http.post(path="/oauth2/token", data=self._refresh_data())
+            self._populate_tokens(response=res)
+        except MonzoError as exc:
+            logger.warning(msg="Token refresh failed")
+            raise MonzoAuthenticationError("Could not refresh the access token") from exc
+
+    async def refresh_if_expiring(self, margin: int = REFRESH_MARGIN) -> bool:  # type: ignore[override]
+        """
+        Refresh the access token if it expires within the margin, unless another task is already doing so.
+
+        Tasks that find the token expiring queue on the refresh lock, the first refreshes and the rest find a renewed
+        token once they acquire it, so only a single token request is made. Should the refresh fail, the tasks that
+        were waiting on it raise its error rather than sending the same refresh token again.
+
+        Args:
+            margin: Seconds before expiry that a token is due to be refreshed
+
+        Returns:
+            True if this call refreshed the token
+
+        Raises:
+            MonzoAuthenticationError: On lack of refresh token or failure to refresh a token
+        """
+        generation = self._refresh_generation
+        async with self._async_refresh_lock:
+            self._raise_refresh_error(generation=generation)
+            if not self._token_expiring(margin=margin):
+                return False
+            self._refresh_error = None
+            try:
+                await self.refresh_access()
+            except MonzoAuthenticationError as exc:
+                self._refresh_error = exc
+                raise
+            finally:
+                self._refresh_generation += 1
+            return True
+
+    async def _exchange_token(self, authorization_token: str) -> None:  # type: ignore[override]
+        """
+        Exchange an authorization code for an access token.
+
+        Args:
+            authorization_token: Authorization token as received from Monzo
+
+        Raises:
+            MonzoAuthenticationError On failure to create a token
+        """
+        logger.info(msg="Exchanging authorization token for access token")
+        data = self._exchange_data(authorization_token=authorization_token)
+        try:
+            res = await self.make_request(path="/oauth2/token", authenticated=False, method="post", data=data)
+            self._populate_tokens(response=res)
+        except MonzoError as exc:
+            logger.warning(msg="Token exchange failed")
+            raise MonzoAuthenticationError("Could not fetch a valid access token") from exc
@@ -0,0 +1,562 @@
+"""Class that handles HTTP requests using asyncio."""
+
+import asyncio
+import ssl
+import zlib
+from collections import deque
+from copy import deepcopy
+from http.client import HTTPMessage, parse_headers
+from io import BytesIO
+from time import monotonic
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from monzo.codec import JsonCodec, default_codec
+from monzo.exceptions import MonzoGeneralError
+from monzo.httpio import (
+    _SSL_CONTEXT,
+    ACCEPT_ENCODING,
+    CONNECTION_KEY_TYPE,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    READ_SIZE,
+    REQUEST_RESPONSE_TYPE,
+    BodyDecoder,
+    ConditionalCache,
+    error_for_status,
+)
+from monzo.retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
+
+_NO_BODY_STATUSES = (204, 304)
+
+
+class AsyncConnection:
+    """
+    Class wrapping a single HTTP/1.1 connection on asyncio streams.
+
+    Only the subset of HTTP/1.1 used by the Monzo API is supported, responses may be delimited by a content length,
+    chunked encoding or the server closing the connection.
+    """
+
+    __slots__ = ["_host", "_reader", "_writer"]
+
+    def __init__(self, host: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Initialize AsyncConnection.
+
+        Args:
+            host: Host name sent in the Host header
+            reader: Stream reader for the connection
+            writer: Stream writer for the connection
+        """
+        self._host: str = host
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+
+    @classmethod
+    async def open(cls, key: CONNECTION_KEY_TYPE, ssl_context: ssl.SSLContext) -> "AsyncConnection":
+        """
+        Open a new connection.
+
+        Args:
+            key: Tuple of scheme, host and port to connect to
+            ssl_context: SSL context used for HTTPS connections
+
+        Returns:
+            Connected AsyncConnection
+        """
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host=host,
+            port=port,
+            ssl=ssl_context if scheme == "https" else None,
+        )
+        default_port = 443 if scheme == "https" else 80
+        return cls(host=host if port == default_port else f"{host}:{port}", reader=reader, writer=writer)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+
+    async def request(
+        self,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, Any],
+    ) -> tuple[int, HTTPMessage, bytes, dict[str, Any], bool]:
+        """
+        Send a request and read the complete response.
+
+        Args:
+            method: HTTP method to use
+            target: Path and query string for the request
+            body: Body of the request
+            headers: Headers as a dictionary for the request
+
+        Returns:
+            Tuple of the status code, response headers, decompressed body, metadata describing the body and True if
+            the connection can be reused
+
+        Raises:
+            zlib.error: If the body cannot be decompressed
+            MonzoGeneralError: If a compressed body ends part way through
+        """
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self._host}"]
+        if "Accept-Encoding" not in headers:
+            lines.append("Accept-Encoding: identity")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None or method in ("PATCH", "POST", "PUT"):
+            lines.append(f"Content-Length: {len(body or b'')}")
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection without response")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        header_lines: list[bytes] = []
+        while (line := await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+            header_lines.append(line)
+        response_headers = parse_headers(BytesIO(b"".join(header_lines) + b"\r\n"))
+        keep_alive = version == "HTTP/1.1" and response_headers.get("Connection", "").lower() != "close"
+
+        code = int(status)
+        decoder = BodyDecoder(content_encoding=response_headers.get("Content-Encoding"))
+        if method == "HEAD" or code in _NO_BODY_STATUSES or 100 <= code < 200:
+            pass
+        elif response_headers.get("Transfer-Encoding", "").lower() == "chunked":
+            await self._read_chunked(decoder=decoder)
+        elif "Content-Length" in response_headers:
+            remaining = int(response_headers["Content-Length"])
+            while remaining:
+                chunk = await self._reader.readexactly(min(remaining, READ_SIZE))
+                remaining -= len(chunk)
+                decoder.feed(chunk=chunk)
+        else:
+            while chunk := await self._reader.read(READ_SIZE):
+                decoder.feed(chunk=chunk)
+            keep_alive = False
+        return code, response_headers, decoder.finish(), decoder.metadata, keep_alive
+
+    async def _read_chunked(self, decoder: BodyDecoder) -> None:
+        """
+        Read a body sent with chunked transfer encoding.
+
+        Args:
+            decoder: Decoder each chunk is fed to
+        """
+        while True:
+            size_line = await self._reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                break
+            decoder.feed(chunk=await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
+        while await self._reader.readuntil(b"\r\n") != b"\r\n":
+            continue
+
+
+class AsyncConnectionPool:
+    """
+    Class to manage persistent asyncio HTTP connections.
+
+    The asyncio counterpart of ConnectionPool. A pool must only be used from the event loop it was first used on.
+    """
+
+    __slots__ = ["_idle", "_idle_timeout", "_max_size", "_semaphores", "_ssl_context"]
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """
+        Initialize AsyncConnectionPool.
+
+        Args:
+            max_size: Maximum number of connections per host that may be checked out at once
+            idle_timeout: Seconds an idle connection is kept before being discarded
+            ssl_context: SSL context for HTTPS connections, defaults to the system trust store
+        """
+        self._idle: dict[CONNECTION_KEY_TYPE, deque[tuple[AsyncConnection, float]]] = {}
+        self._idle_timeout: float = idle_timeout
+        self._max_size: int = max_size
+        self._semaphores: dict[CONNECTION_KEY_TYPE, asyncio.Semaphore] = {}
+        self._ssl_context: ssl.SSLContext = ssl_context or _SSL_CONTEXT
+
+    async def acquire(self, key: CONNECTION_KEY_TYPE) -> tuple[AsyncConnection, bool]:
+        """
+        Check out a connection for the given host.
+
+        Args:
+            key: Tuple of scheme, host and port identifying the connection
+
+        Returns:
+            Tuple of the connection and True if it is a reused connection, otherwise False
+        """
+        semaphore = self._semaphores.setdefault(key, asyncio.Semaphore(self._max_size))
+        await semaphore.acquire()
+        cutoff = monotonic() - self._idle_timeout
+        connections = self._idle.get(key)
+        while connections:
+            connection, last_used = connections.pop()
+            if last_used >= cutoff:
+                return connection, True
+            connection.close()
+        try:
+            return await AsyncConnection.open(key=key, ssl_context=self._ssl_context), False
+        except BaseException:
+            semaphore.release()
+            raise
+
+    def close(self) -> None:
+        """Close all idle connections held by the pool."""
+        idle = self._idle
+        self._idle = {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def release(self, key: CONNECTION_KEY_TYPE, connection: AsyncConnection, reusable: bool) -> None:
+        """
+        Return a previously acquired connection to the pool.
+
+        Args:
+            key: Tuple of scheme, host and port the connection was acquired with
+            connection: Connection being returned
+            reusable: True if the connection can serve another request, otherwise it is closed
+        """
+        if reusable:
+            self._idle.setdefault(key, deque()).append((connection, monotonic()))
+        else:
+            connection.close()
+        self._semaphores[key].release()
+
+
+class AsyncHttpIO:
+    """
+    Class to facilitate http requests using asyncio.
+
+    Provides the same interface as HttpIO with coroutine methods. This class should not be used directly, instead the
+    AsyncAuthentication make_request method should be used
+    """
+
+    __slots__ = ["_base_path", "_codec", "_conditional_cache", "_key", "_pool", "_retry_policy", "_url"]
+
+    def __init__(
+        self,
+        url: str,
+        pool: AsyncConnectionPool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        """
+        Initialize AsyncHttpIO.
+
+        Args:
+            url: Base URL for requests
+            pool: Connection pool to share, a new pool is created if one is not provided
+            retry_policy: Policy for retrying rate limited and failed requests, by default requests are not retried
+            conditional_cache: Cache of response validators for conditional GET requests, by default GET requests are
+                not conditional
+            codec: JSON codec for response bodies, by default the fastest installed codec
+        """
+        parsed = urlsplit(url)
+        scheme = parsed.scheme or "https"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        self._base_path: str = parsed.path.rstrip("/")
+        self._codec: JsonCodec = codec or default_codec()
+        self._conditional_cache: ConditionalCache | None = conditional_cache
+        self._key: CONNECTION_KEY_TYPE = (scheme, parsed.hostname or "", port)
+        self._pool: AsyncConnectionPool = pool or AsyncConnectionPool()
+        self._retry_policy: RetryPolicy | None = retry_policy
+        self._url = url
+
+    @property
+    def pool(self) -> AsyncConnectionPool:
+        """
+        Property for the connection pool.
+
+        Returns:
+            Connection pool used for requests
+        """
+        return self._pool
+
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Property for the JSON codec.
+
+        Returns:
+            Codec used to decode response bodies
+        """
+        return self._codec
+
+    @property
+    def conditional_cache(self) -> ConditionalCache | None:
+        """
+        Property for the conditional request cache.
+
+        Returns:
+            Cache of response validators, None if GET requests are not conditional
+        """
+        return self._conditional_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """
+        Property for the retry policy.
+
+        Returns:
+            Policy used to retry failed requests, None if requests are not retried
+        """
+        return self._retry_policy
+
+    async def delete(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a DELETE request.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as URL parameters
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+             Dictionary containing the response code, headers and content
+        """
+        parameters = urlencode(data).encode() if data else None
+        return await self._perform_request(
+            method="DELETE",
+            path=path,
+            data=parameters,
+            headers=headers or {},
+            timeout=timeout,
+        )
+
+    async def get(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a GET request.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as URL parameters
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+             Dictionary containing the response code, headers and content
+        """
+        parameters = urlencode(data) if data else None
+        if parameters:
+            path += f"?{parameters}"
+        return await self._perform_request(method="GET", path=path, data=None, headers=headers or {}, timeout=timeout)
+
+    async def patch(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a PATCH request.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as form data
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+             Dictionary containing the response code, headers and content
+        """
+        parameters = urlencode(data).encode() if data else None
+        return await self._perform_request(
+            method="PATCH",
+            path=path,
+            data=parameters,
+            headers=headers or {},
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
+
+    async def post(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a POST request.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as form data
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+             Dictionary containing the response code, headers and content
+        """
+        parameters = urlencode(data).encode() if data else None
+        return await self._perform_request(
+            method="POST",
+            path=path,
+            data=parameters,
+            headers=headers or {},
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
+
+    async def put(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a PUT request.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as form data, or an encoded body
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+             Dictionary containing the response code, headers and content
+        """
+        if data is None:
+            data = {}
+        if type(data) is dict:
+            parameters = urlencode(data).encode() if data else None
+        else:
+            parameters = data if isinstance(data, bytes) else data.encode("utf8")
+        return await self._perform_request(
+            method="PUT",
+            path=path,
+            data=parameters,
+            headers=headers or {},
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
+
+    async def _perform_request(
+        self,
+        method: str,
+        path: str,
+        data: bytes | None,
+        headers: dict[str, Any],
+        timeout,
+        dedupe: bool = False,
+    ) -> REQUEST_RESPONSE_TYPE:
+        """
+        Perform a given request.
+
+        Args:
+            method: HTTP method to use (DELETE, GET, POST, PUT)
+            path: Path for the HTTP call
+            data: Data for the request to be passed as form data
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for each attempt
+            dedupe: True if the request carries a dedupe_id and may be retried when the policy allows it
+
+        Returns:
+             Dictionary containing the response code, headers, content and metadata recording the content encoding
+             with the compressed and decompressed sizes of the body
+        """
+        if data is not None and "Content-Type" not in headers:
+            headers = {**headers, "Content-Type": "application/x-www-form-urlencoded"}
+        if "Accept-Encoding" not in headers:
+            headers = {**headers, "Accept-Encoding": ACCEPT_ENCODING}
+        target = f"{self._base_path}{path}"
+        conditional = self._conditional_cache if method == "GET" else None
+        validated = conditional.get(target=target, headers=headers) if conditional is not None else None
+        request_headers = {**headers, **validated.request_headers} if validated else headers
+        attempt = 1
+        while True:
+            try:
+                async with asyncio.timeout(timeout):
+                    code, response_headers, content, metadata = await self._send(
+                        method=method,
+                        target=target,
+                        data=data,
+                        headers=request_headers,
+                        resend=method in IDEMPOTENT_METHODS or dedupe,
+                    )
+            except TimeoutError as error:
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+            if code < 400:
+                break
+            retry_after = parse_retry_after(response_headers.get("Retry-After"))
+            policy = self._retry_policy
+            if not policy or not policy.should_retry(
+                method=method,
+                status=code,
+                attempt=attempt,
+                dedupe=dedupe,
+                retry_after=retry_after,
+            ):
+                raise error_for_status(code=code, retry_after=retry_after)
+            await asyncio.sleep(policy.delay(attempt=attempt, retry_after=retry_after))
+            attempt += 1
+        if validated and code == 304:
+            # Not modified, serve a copy of the body decoded for the earlier response
+            code = validated.status
+            decoded = deepcopy(validated.data)
+        else:
+            decoded = self._codec.loads(content) if len(content) > 0 else ""
+            if conditional is not None and code == 200:
+                conditional.put(
+                    target=target,
+                    headers=headers,
+                    response_headers=response_headers,
+                    data=deepcopy(decoded),
+                    status=code,
+                )
+        return {"code": code, "headers": response_headers, "data": decoded, "metadata": metadata}
+
+    async def _send(
+        self,
+        method: str,
+        target: str,
+        data: bytes | None,
+        headers: dict[str, Any],
+        resend: bool,
+    ) -> tuple[int, HTTPMessage, bytes, dict[str, Any]]:
+        """
+        Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method to use
+            target: Path and query string for the request
+            data: Body of the request
+            headers: Headers as a dictionary for the request
+            resend: True if the request is safe to send again when a kept alive connection turns out to be closed
+
+        Returns:
+            Tuple of the status code, response headers, decompressed body and metadata describing the body
+
+        Raises:
+            MonzoGeneralError: On a network error or a body that cannot be decompressed
+        """
+        for attempt in range(2):
+            try:
+                connection, reused = await self._pool.acquire(key=self._key)
+            except OSError as error:
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+            try:
+                code, response_headers, content, metadata, keep_alive = await connection.request(
+                    method=method,
+                    target=target,
+                    body=data,
+                    headers=headers,
+                )
+            except zlib.error as error:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                raise MonzoGeneralError("Unable to decompress response from Monzo API") from error
+            except (ConnectionError, asyncio.IncompleteReadError) as error:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                if resend and reused and attempt == 0:
+                    # The server may have closed a kept alive connection, try once more on a fresh one. Other requests
+                    # may already have reached the server so are not sent twice.
+                    continue
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+            except (OSError, ValueError) as error:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+            except BaseException:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                raise
+            self._pool.release(key=self._key, connection=connection, reusable=keep_alive)
+            return code, response_headers, content, metadata
+        raise MonzoGeneralError("Network error communicating with Monzo API")
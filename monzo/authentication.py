@@ -3,18 +3,28 @@
 import logging
 import os
 import secrets
-from pathlib import Path, PurePath
-from tempfile import gettempdir
+from collections.abc import Iterator
+from contextlib import suppress
+from pathlib import PurePath
+from tempfile import gettempdir, mkstemp
+from threading import Lock
 from time import time
+from typing import Any
 from urllib.parse import urlparse
 
+from monzo.codec import JsonCodec
 from monzo.exceptions import MonzoArgumentError, MonzoAuthenticationError, MonzoError, MonzoHTTPError
 from monzo.handlers.storage import Storage
+from monzo.handlers.write_behind import WriteBehindStorage
 from monzo.httpio import DEFAULT_TIMEOUT, REQUEST_RESPONSE_TYPE, HttpIO
+from monzo.rate_limit import RateLimiter
+from monzo.response_cache import CACHE_KEY_TYPE, ResponseCache
 
 MONZO_AUTH_URL = "https://auth.monzo.com"
 MONZO_API_URL = "https://api.monzo.com"
 
+REFRESH_MARGIN = 60
+
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 
@@ -27,13 +37,23 @@ class Authentication:
     """
 
     __slots__ = [
+        "__weakref__",
         "_access_token",
         "_access_token_expiry",
         "_client_id",
         "_client_secret",
+        "_codec",
+        "_flow_id",
         "_handlers",
+        "_http",
+        "_rate_limiter",
         "_redirect_url",
+        "_refresh_error",
+        "_refresh_generation",
+        "_refresh_lock",
         "_refresh_token",
+        "_response_cache",
+        "_state_token",
     ]
 
     def __init__(
@@ -44,6 +64,11 @@ class Authentication:
         access_token: str = "",
         access_token_expiry: int = 0,
         refresh_token: str = "",
+        http: HttpIO | None = None,
+        rate_limiter: RateLimiter | None = None,
+        flow_id: str = "",
+        response_cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
     ):
         """
         Initialize Authentication.
@@ -55,7 +80,16 @@ class Authentication:
             access_token: Pre existing access token
             access_token_expiry: Token expiry as a unix timestamp
             refresh_token: Refresh token to renew access tokens
+            http: HttpIO instance to share, by default a new one with its own connection pool is created
+            rate_limiter: Rate limiter to pace requests, may be shared between Authentication objects
+            flow_id: Identifier for the authentication flow, concurrent flows with different IDs keep separate state
+                tokens. Letters, digits, hyphens and underscores only.
+            response_cache: Cache for responses from read endpoints, may be shared between Authentication objects
+            codec: JSON codec for request and response bodies, by default the codec of http or the fastest installed.
+                When http is shared it must already use this codec.
         """
+        if flow_id and not flow_id.replace("-", "").replace("_", "").isalnum():
+            raise MonzoArgumentError("flow_id may only contain letters, digits, hyphens and underscores")
         if redirect_url:
             parsed = urlparse(redirect_url)
             is_localhost: bool = parsed.hostname in ("localhost", "127.0.0.1")
@@ -63,13 +97,24 @@ class Authentication:
                 raise MonzoArgumentError("redirect_url must be a valid URL")
             if parsed.scheme == "http" and not is_localhost:
                 raise MonzoArgumentError("HTTP redirect URLs are only permitted for localhost")
+        if http is not None and codec is not None and http.codec.name != codec.name:
+            raise MonzoArgumentError("codec must be the codec used by http")
         self._access_token: str = access_token
         self._access_token_expiry: int = access_token_expiry
         self._client_id: str = client_id
         self._client_secret: str = client_secret
+        self._flow_id: str = flow_id
         self._handlers: list[Storage] = []
+        self._http: HttpIO = http or HttpIO(MONZO_API_URL, codec=codec)
+        self._codec: JsonCodec = self._http.codec
+        self._rate_limiter: RateLimiter | None = rate_limiter
         self._redirect_url: str = redirect_url
+        self._refresh_error: MonzoAuthenticationError | None = None
+        self._refresh_generation: int = 0
+        self._refresh_lock: Lock = Lock()
         self._refresh_token: str = refresh_token
+        self._response_cache: ResponseCache | None = response_cache
+        self._state_token: str = ""
 
     def authenticate(self, authorization_token: str, state_token: str) -> None:
         """
@@ -82,16 +127,7 @@ class Authentication:
         Raises:
             MonzoAuthenticationError On missing authorization token or mismatching state tokens
         """
-        logger.info(msg="Attempting authentication")
-        if not authorization_token:
-            logger.warning(msg="Authentication failed: authorization token missing")
-            raise MonzoAuthenticationError("Code missing from response")
-        if state_token != self.state_token:
-            logger.warning(msg="Authentication failed: state token mismatch")
-            raise MonzoAuthenticationError("State tokens do not match")
-        tmp_file_name = "monzo"
-        tmp_file_path = PurePath(gettempdir(), tmp_file_name)
-        os.remove(tmp_file_path)
+        self._validate_state(authorization_token=authorization_token, state_token=state_token)
         self._exchange_token(authorization_token=authorization_token)
 
     def logout(self) -> None:
@@ -124,22 +160,29 @@ class Authentication:
 
         Raises:
             MonzoHTTPError: On using an invalid method
+            MonzoRateError: If the rate limiter timed out waiting for capacity
         """
-        if self._access_token and self._access_token_expiry - time() < 60:
-            self.refresh_access()
+        if self._token_expiring():
+            self.refresh_if_expiring()
         if data is None:
             data = {}
         if headers is None:
             headers = {}
         if authenticated:
             headers["Authorization"] = f"Bearer {self.access_token}"
-        conn = HttpIO(MONZO_API_URL)
         method = method.lower()
         try:
-            connection = getattr(conn, method)
+            connection = getattr(self._http, method)
         except AttributeError as exc:
             raise MonzoHTTPError("Specified HTTP method is not supported") from exc
-        return connection(path=path, data=data, headers=headers, timeout=timeout)
+        cache_key, generation, cached = self._cache_lookup(path=path, method=method, data=data, headers=headers)
+        if cached is not None:
+            return cached
+        if self._rate_limiter:
+            self._rate_limiter.acquire(path=path)
+        response = connection(path=path, data=data, headers=headers, timeout=timeout)
+        self._cache_store(path=path, method=method, key=cache_key, generation=generation, response=response)
+        return response
 
     def refresh_access(self) -> None:
         """
@@ -154,20 +197,76 @@ class Authentication:
         if not self.refresh_token:
             logger.warning(msg="Token refresh failed: no refresh token available")
             raise MonzoAuthenticationError("Unable to refresh without a refresh token")
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "refresh_token": self.refresh_token,
-        }
-        conn = HttpIO(MONZO_API_URL)
         try:
-            res = conn.post(path="/oauth2/token", data=data)
+            res = self._http.post(path="/oauth2/token", data=self._refresh_data())
             self._populate_tokens(response=res)
         except MonzoError as exc:
             logger.warning(msg="Token refresh failed")
             raise MonzoAuthenticationError("Could not refresh the access token") from exc
 
+    def refresh_if_expiring(self, margin: int = REFRESH_MARGIN) -> bool:
+        """
+        Refresh the access token if it expires within the margin, unless another thread is already doing so.
+
+        Threads that find the token expiring queue on the refresh lock, the first refreshes and the rest find a
+        renewed token once they acquire it, so only a single token request is made. Should the refresh fail, the
+        threads that were waiting on it raise its error rather than sending the same refresh token again.
+
+        Args:
+            margin: Seconds before expiry that a token is due to be refreshed
+
+        Returns:
+            True if this call refreshed the token
+
+        Raises:
+            MonzoAuthenticationError: On lack of refresh token or failure to refresh a token
+        """
+        generation = self._refresh_generation
+        with self._refresh_lock:
+            self._raise_refresh_error(generation=generation)
+            if not self._token_expiring(margin=margin):
+                return False
+            self._refresh_error = None
+            try:
+                self.refresh_access()
+            except MonzoAuthenticationError as exc:
+                self._refresh_error = exc
+                raise
+            finally:
+                self._refresh_generation += 1
+            return True
+
+    def stream_request(
+        self,
+        path: str,
+        data=None,
+        headers=None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Iterator[bytes]:
+        """
+        Make an authenticated GET call to Monzo, yielding the body as it arrives.
+
+        Responses bypass the response cache.
+
+        Args:
+            path: Path for the API call
+            data: Dictionary of data to be passed as URL parameters
+            headers: Dictionary of headers for the request
+            timeout: Timeout in seconds for the request
+
+        Returns:
+            Iterator over decompressed chunks of the body, the request is sent when iteration starts
+
+        Raises:
+            MonzoRateError: If the rate limiter timed out waiting for capacity
+        """
+        if self._token_expiring():
+            self.refresh_if_expiring()
+        headers = {**(headers or {}), "Authorization": f"Bearer {self.access_token}"}
+        if self._rate_limiter:
+            self._rate_limiter.acquire(path=path)
+        return self._http.stream(path=path, data=data or {}, headers=headers, timeout=timeout)
+
     @property
     def access_token(self) -> str:
         """
@@ -211,6 +310,16 @@ class Authentication:
             f"&response_type=code&state={self.state_token}"
         )
 
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Property for the JSON codec.
+
+        Returns:
+            Codec used for request and response bodies
+        """
+        return self._codec
+
     @property
     def is_authenticated(self) -> bool:
         """
@@ -236,21 +345,83 @@ class Authentication:
         """
         Generate or returns a previously generated state token.
 
+        The token is held in memory once generated or loaded, the file in the temp directory only lets another
+        process handling the same flow find it. The file is written in full under a temporary name and then linked
+        into place, so another process never reads a partly written token.
+
         Returns:
             A state token used for authentication requests.
         """
-        tmp_file_name = "monzo"
-        tmp_file_path = PurePath(gettempdir(), tmp_file_name)
-        if not Path(tmp_file_path).is_file():
-            fd: int = os.open(path=tmp_file_path, flags=os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode=0o600)
+        if self._state_token:
+            return self._state_token
+        tmp_file_path = self._state_file()
+        state_token: str = secrets.token_urlsafe(64)
+        fd, temp_file = mkstemp(dir=tmp_file_path.parent, prefix=f".{tmp_file_path.name}.", suffix=".tmp")
+        try:
             with os.fdopen(fd, mode="w") as handler:
-                state_token: str = secrets.token_urlsafe(64)
                 handler.write(state_token)
-                handler.flush()
-            os.chmod(path=tmp_file_path, mode=0o600)
-        with open(file=tmp_file_path, mode="r") as fh:
-            state_token: str = fh.read()
-        return state_token
+            os.chmod(path=temp_file, mode=0o600)
+            try:
+                os.link(src=temp_file, dst=tmp_file_path)
+            except FileExistsError:
+                with open(file=tmp_file_path, mode="r") as fh:
+                    state_token = fh.read()
+        finally:
+            os.unlink(temp_file)
+        self._state_token = state_token
+        return self._state_token
+
+    def _cache_lookup(
+        self,
+        path: str,
+        method: str,
+        data: dict[str, Any],
+        headers: dict[str, str],
+    ) -> tuple[CACHE_KEY_TYPE | None, int, REQUEST_RESPONSE_TYPE | None]:
+        """
+        Look up a request in the response cache.
+
+        Args:
+            path: Path for the API call
+            method: Lower case method for the API call
+            data: Dictionary of data to be posted as form data or URL parameters
+            headers: Dictionary of headers for the request
+
+        Returns:
+            Tuple of cache key or None if the response is not cacheable, cache generation and cached response or None
+        """
+        if self._response_cache is None:
+            return None, 0, None
+        generation = self._response_cache.generation
+        if method != "get":
+            return None, generation, None
+        key = self._response_cache.key(path=path, data=data, authorization=headers.get("Authorization", ""))
+        return key, generation, self._response_cache.get(key=key) if key else None
+
+    def _cache_store(
+        self,
+        path: str,
+        method: str,
+        key: CACHE_KEY_TYPE | None,
+        generation: int,
+        response: REQUEST_RESPONSE_TYPE,
+    ) -> None:
+        """
+        Cache a response or invalidate the responses a mutating request made stale.
+
+        Args:
+            path: Path for the API call
+            method: Lower case method for the API call
+            key: Cache key from _cache_lookup
+            generation: Cache generation from _cache_lookup
+            response: Response from the API call
+        """
+        if self._response_cache is None:
+            return
+        if key:
+            self._response_cache.put(key=key, response=response, generation=generation)
+        elif method != "get":
+            self._response_cache.invalidate_related(path=path)
 
     def _exchange_token(self, authorization_token: str) -> None:
         """
@@ -263,13 +434,7 @@ class Authentication:
             MonzoAuthenticationError On failure to create a token
         """
         logger.info(msg="Exchanging authorization token for access token")
-        data: dict[str, str] = {
-            "grant_type": "authorization_code",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "redirect_uri": self._redirect_url,
-            "code": authorization_token,
-        }
+        data = self._exchange_data(authorization_token=authorization_token)
         try:
             res = self.make_request(path="/oauth2/token", authenticated=False, method="post", data=data)
             self._populate_tokens(response=res)
@@ -277,6 +442,38 @@ class Authentication:
             logger.warning(msg="Token exchange failed")
             raise MonzoAuthenticationError("Could not fetch a valid access token") from exc
 
+    def _exchange_data(self, authorization_token: str) -> dict[str, str]:
+        """
+        Build the form data for exchanging an authorization code.
+
+        Args:
+            authorization_token: Authorization token as received from Monzo
+
+        Returns:
+            Dictionary of form data for the token request
+        """
+        return {
+            "grant_type": "authorization_code",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "redirect_uri": self._redirect_url,
+            "code": authorization_token,
+        }
+
+    def _refresh_data(self) -> dict[str, str]:
+        """
+        Build the form data for refreshing an access token.
+
+        Returns:
+            Dictionary of form data for the token request
+        """
+        return {
+            "grant_type": "refresh_token",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "refresh_token": self.refresh_token,
+        }
+
     def _populate_tokens(self, response: REQUEST_RESPONSE_TYPE) -> None:
         """
         Populate tokens after a token request.
@@ -300,12 +497,74 @@ class Authentication:
                 refresh_token=self._refresh_token,
             )
 
-    def register_callback_handler(self, handler: Storage) -> None:
+    def _raise_refresh_error(self, generation: int) -> None:
+        """
+        Raise the error of a refresh attempted while waiting for the refresh lock.
+
+        Must be called holding the refresh lock.
+
+        Args:
+            generation: Refresh generation read before waiting for the lock
+
+        Raises:
+            MonzoAuthenticationError: If a refresh was attempted while waiting and failed
+        """
+        if self._refresh_generation != generation and self._refresh_error is not None:
+            raise MonzoAuthenticationError("Could not refresh the access token") from self._refresh_error
+
+    def _state_file(self) -> PurePath:
+        """
+        Path of the file holding the state token for this flow.
+
+        Returns:
+            Path in the temp directory
+        """
+        tmp_file_name = f"monzo_{self._flow_id}" if self._flow_id else "monzo"
+        return PurePath(gettempdir(), tmp_file_name)
+
+    def _token_expiring(self, margin: int = REFRESH_MARGIN) -> bool:
+        """
+        Identify if the access token is due to be refreshed.
+
+        Args:
+            margin: Seconds before expiry that a token is due to be refreshed
+
+        Returns:
+            True if there is an access token that expires within the margin
+        """
+        return bool(self._access_token) and self._access_token_expiry - time() < margin
+
+    def _validate_state(self, authorization_token: str, state_token: str) -> None:
+        """
+        Validate the response from the authentication URL and clear the state token.
+
+        Args:
+            authorization_token: Authorization code provided by Monzo
+            state_token: Pre-agreed state token to validate against
+
+        Raises:
+            MonzoAuthenticationError On missing authorization token or mismatching state tokens
+        """
+        logger.info(msg="Attempting authentication")
+        if not authorization_token:
+            logger.warning(msg="Authentication failed: authorization token missing")
+            raise MonzoAuthenticationError("Code missing from response")
+        if state_token != self.state_token:
+            logger.warning(msg="Authentication failed: state token mismatch")
+            raise MonzoAuthenticationError("State tokens do not match")
+        self._state_token = ""
+        with suppress(FileNotFoundError):
+            os.remove(self._state_file())
+
+    def register_callback_handler(self, handler: Storage, background: bool = False) -> None:
         """
         Register a new callback handler for handling new token details.
 
         Args:
             handler: Credential handler implementing Storage
+            background: True to store new token details on a background thread rather than during the request
         """
         logger.info(msg="Registered a new callback handler")
+        if background:
+            handler = WriteBehindStorage(handler=handler)
         self._handlers.append(handler)
@@ -0,0 +1,220 @@
+"""Class to manage Authentication objects for many users."""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from weakref import WeakValueDictionary
+
+from monzo.authentication import MONZO_API_URL, Authentication
+from monzo.exceptions import MonzoAuthenticationError
+from monzo.handlers.storage import Storage
+from monzo.httpio import HttpIO
+from monzo.rate_limit import RateLimiter
+from monzo.refresher import TokenRefresher
+from monzo.response_cache import ResponseCache
+
+DEFAULT_MAX_TENANTS = 1000
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class AuthenticationPool:
+    """
+    Class to manage Authentication objects for many users.
+
+    Authentication objects are created on first use from credentials held by a Storage backend for each key and share
+    a single HttpIO, rate limiter and token refresher. Only the most recently used tenants are kept in memory, the
+    least recently used are evicted once the pool is full and loaded again from storage when next needed. A tenant
+    still referenced elsewhere when it is evicted is reused rather than loaded again, so there is never more than one
+    Authentication, and so one refresh lock, spending the refresh token of a tenant.
+    """
+
+    __slots__ = [
+        "_evicted",
+        "_http",
+        "_lock",
+        "_max_tenants",
+        "_rate_limiter",
+        "_redirect_url",
+        "_refresher",
+        "_response_cache",
+        "_storage_factory",
+        "_tenants",
+    ]
+
+    def __init__(
+        self,
+        storage_factory: Callable[[str], Storage],
+        redirect_url: str = "",
+        max_tenants: int = DEFAULT_MAX_TENANTS,
+        http: HttpIO | None = None,
+        rate_limiter: RateLimiter | None = None,
+        refresher: TokenRefresher | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        """
+        Initialize AuthenticationPool.
+
+        Args:
+            storage_factory: Callable returning the Storage holding the credentials for a key
+            redirect_url: Redirect URL for authentication
+            max_tenants: Maximum number of Authentication objects kept in memory
+            http: HttpIO instance shared by every tenant, by default a new one is created
+            rate_limiter: Rate limiter shared by every tenant
+            refresher: Token refresher every tenant is registered with while in memory
+            response_cache: Response cache shared by every tenant, responses are keyed on each tenant's access token
+        """
+        self._evicted: WeakValueDictionary[str, Authentication] = WeakValueDictionary()
+        self._http: HttpIO = http or HttpIO(MONZO_API_URL)
+        self._lock: Lock = Lock()
+        self._max_tenants: int = max_tenants
+        self._rate_limiter: RateLimiter | None = rate_limiter
+        self._redirect_url: str = redirect_url
+        self._refresher: TokenRefresher | None = refresher
+        self._response_cache: ResponseCache | None = response_cache
+        self._storage_factory: Callable[[str], Storage] = storage_factory
+        self._tenants: OrderedDict[str, Authentication] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Identify if a tenant is held in memory.
+
+        Args:
+            key: Key of the tenant
+
+        Returns:
+            True if the tenant is held in memory
+        """
+        with self._lock:
+            return key in self._tenants
+
+    def __len__(self) -> int:
+        """
+        Number of tenants held in memory.
+
+        Returns:
+            Number of tenants
+        """
+        with self._lock:
+            return len(self._tenants)
+
+    def clear(self) -> None:
+        """Remove every tenant from memory."""
+        with self._lock:
+            tenants = list(self._tenants.items())
+            self._tenants.clear()
+            self._evicted.update(tenants)
+        for _, auth in tenants:
+            self._release(auth=auth)
+
+    def evict(self, key: str) -> None:
+        """
+        Remove a tenant from memory, its credentials remain in storage.
+
+        Args:
+            key: Key of the tenant
+        """
+        with self._lock:
+            auth = self._tenants.pop(key, None)
+            if auth:
+                self._evicted[key] = auth
+        if auth:
+            self._release(auth=auth)
+
+    def get(self, key: str) -> Authentication:
+        """
+        Fetch the Authentication for a tenant, loading it from storage if it is not held in memory.
+
+        Args:
+            key: Key of the tenant, such as a user or client ID
+
+        Returns:
+            Authentication for the tenant
+
+        Raises:
+            MonzoAuthenticationError: If no credentials are stored for the tenant
+        """
+        with self._lock:
+            auth = self._tenants.get(key)
+            if auth:
+                self._tenants.move_to_end(key)
+                return auth
+            auth = self._evicted.pop(key, None)
+            if auth:
+                # Evicted while still in use, keep using the same object rather than loading a second one
+                self._add(key=key, auth=auth)
+                return auth
+        loaded = self._load(key=key)
+        with self._lock:
+            auth = self._tenants.get(key) or self._evicted.pop(key, None)
+            if auth:
+                # Another thread loaded the tenant first
+                if key not in self._tenants:
+                    self._add(key=key, auth=auth)
+                self._tenants.move_to_end(key)
+                return auth
+            self._add(key=key, auth=loaded)
+        return loaded
+
+    def _add(self, key: str, auth: Authentication) -> None:
+        """
+        Hold a tenant in memory, evicting the least recently used once the pool is full.
+
+        Must be called holding the lock.
+
+        Args:
+            key: Key of the tenant
+            auth: Authentication for the tenant
+        """
+        self._tenants[key] = auth
+        if self._refresher:
+            self._refresher.add(auth=auth)
+        while len(self._tenants) > self._max_tenants:
+            evicted_key, evicted = self._tenants.popitem(last=False)
+            self._evicted[evicted_key] = evicted
+            self._release(auth=evicted)
+
+    def _load(self, key: str) -> Authentication:
+        """
+        Create an Authentication from stored credentials.
+
+        Args:
+            key: Key of the tenant
+
+        Returns:
+            Authentication for the tenant with its storage registered as a callback handler
+
+        Raises:
+            MonzoAuthenticationError: If no credentials are stored for the tenant
+        """
+        logger.info(msg=f"Loading credentials for {key}")
+        storage = self._storage_factory(key)
+        credentials = storage.fetch()
+        if not credentials:
+            raise MonzoAuthenticationError(f"No credentials stored for {key}")
+        auth = Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url=self._redirect_url,
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials.get("refresh_token", "")),
+            http=self._http,
+            rate_limiter=self._rate_limiter,
+            response_cache=self._response_cache,
+        )
+        auth.register_callback_handler(handler=storage)
+        return auth
+
+    def _release(self, auth: Authentication) -> None:
+        """
+        Stop refreshing an Authentication removed from memory.
+
+        Args:
+            auth: Authentication removed from the pool
+        """
+        if self._refresher:
+            self._refresher.remove(auth=auth)
@@ -0,0 +1,128 @@
+"""Class to backfill transaction history concurrently."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+from monzo.authentication import Authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.exceptions import MonzoArgumentError
+
+DEFAULT_WINDOW = timedelta(days=30)
+
+DEFAULT_WORKERS = 4
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class TransactionBackfill:
+    """
+    Class to backfill transactions.
+
+    Splits a since/before range into time windows and pages through each window concurrently, rather than walking
+    the whole history with a single serial cursor. Results are merged, deduplicated by transaction ID and returned
+    in created order.
+    """
+
+    __slots__ = ["_auth", "_expand", "_max_workers", "_window"]
+
+    def __init__(
+        self,
+        auth: Authentication,
+        window: timedelta = DEFAULT_WINDOW,
+        max_workers: int = DEFAULT_WORKERS,
+        expand=None,
+    ):
+        """
+        Initialize TransactionBackfill.
+
+        Args:
+            auth: Monzo authentication object
+            window: Length of each time window fetched as a unit of work
+            max_workers: Number of windows fetched concurrently
+            expand: List if fields to expand on
+
+        Raises:
+            MonzoArgumentError: On a window that is not positive or fewer than one worker
+        """
+        if window <= timedelta(0):
+            raise MonzoArgumentError("window must be a positive duration")
+        if max_workers < 1:
+            raise MonzoArgumentError("max_workers must be at least 1")
+        self._auth: Authentication = auth
+        self._expand = expand
+        self._max_workers: int = max_workers
+        self._window: timedelta = window
+
+    def run(self, account_id: str, since: datetime, before: datetime | None = None) -> list[Transaction]:
+        """
+        Fetch every transaction for an account in the given range.
+
+        Args:
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before, defaults to now
+
+        Returns:
+            List of unique transactions ordered by when they were created
+        """
+        windows = self.windows(since=since, before=before or datetime.now(tz=UTC))
+        logger.info(msg=f"Backfilling {len(windows)} windows for {account_id}")
+        transactions: dict[str, Transaction] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = executor.map(
+                lambda window: self._fetch_window(account_id=account_id, since=window[0], before=window[1]),
+                windows,
+            )
+            for window_transactions in results:
+                for transaction in window_transactions:
+                    transactions[transaction.transaction_id] = transaction
+        return sorted(transactions.values(), key=lambda transaction: (transaction.created, transaction.transaction_id))
+
+    def windows(self, since: datetime, before: datetime) -> list[tuple[datetime, datetime]]:
+        """
+        Split a range into consecutive time windows.
+
+        Args:
+            since: Start of the range
+            before: End of the range
+
+        Raises:
+            MonzoArgumentError: When since is not before the end of the range
+
+        Returns:
+            List of since/before pairs covering the range
+        """
+        if since >= before:
+            raise MonzoArgumentError("since must be earlier than before")
+        windows: list[tuple[datetime, datetime]] = []
+        start = since
+        while start < before:
+            end = min(start + self._window, before)
+            windows.append((start, end))
+            start = end
+        return windows
+
+    def _fetch_window(self, account_id: str, since: datetime, before: datetime) -> list[Transaction]:
+        """
+        Fetch every transaction within a single window.
+
+        Args:
+            account_id: ID of the account to fetch transactions for
+            since: Start of the window
+            before: End of the window
+
+        Returns:
+            List of transactions in the window
+        """
+        return list(
+            Transaction.iter_all(
+                auth=self._auth,
+                account_id=account_id,
+                since=since,
+                before=before,
+                expand=self._expand,
+            )
+        )
@@ -0,0 +1,184 @@
+"""Classes to encode and decode JSON."""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from monzo.exceptions import MonzoArgumentError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore[assignment]
+
+
+class JsonCodec(ABC):
+    """
+    Abstract class for a JSON codec.
+
+    Codecs decode response bodies straight from bytes and encode request bodies to bytes so a body is never copied
+    into an intermediate string.
+    """
+
+    __slots__ = ()
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as JSON.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            Decoded object
+        """
+
+
+class StdlibCodec(JsonCodec):
+    """JSON codec using the standard library json module."""
+
+    __slots__ = ()
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as JSON.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            Decoded object
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson, which decodes directly from bytes."""
+
+    __slots__ = ()
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Initialize OrjsonCodec.
+
+        Raises:
+            MonzoArgumentError: If orjson is not installed
+        """
+        if orjson is None:
+            raise MonzoArgumentError("orjson is not installed")
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as JSON.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            Decoded object
+        """
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec using ujson."""
+
+    __slots__ = ()
+
+    name = "ujson"
+
+    def __init__(self):
+        """
+        Initialize UjsonCodec.
+
+        Raises:
+            MonzoArgumentError: If ujson is not installed
+        """
+        if ujson is None:
+            raise MonzoArgumentError("ujson is not installed")
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as JSON.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            Decoded object
+        """
+        return ujson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """
+    Pick the fastest JSON codec installed.
+
+    Returns:
+        orjson codec when installed, then ujson, otherwise the standard library codec
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return StdlibCodec()
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.balance import Balance
 from monzo.endpoints.monzo import Monzo
-from monzo.exceptions import MonzoHTTPError, MonzoPermissionsError
+from monzo.exceptions import MonzoAuthenticationError, MonzoHTTPError, MonzoPermissionsError
 from monzo.helpers import create_date
+from monzo.httpio import REQUEST_RESPONSE_TYPE
 
 ACCOUNT_TYPES = [
     "uk_retail",
@@ -111,6 +113,25 @@ class Account(Monzo):
                 self._has_balance = False
         return self._balance
 
+    async def fetch_balance_async(self) -> Balance | None:
+        """
+        Fetch the live balance using asyncio.
+
+        Raises:
+            MonzoAuthenticationError: If the account was not fetched with an AsyncAuthentication object
+
+        Returns:
+            Balance object
+        """
+        if not isinstance(self._auth, AsyncAuthentication):
+            raise MonzoAuthenticationError("An AsyncAuthentication object is required to fetch asynchronously")
+        if self._has_balance:
+            try:
+                self._balance = await Balance.fetch_async(auth=self._auth, account_id=self._account_id)
+            except (MonzoHTTPError, MonzoPermissionsError):
+                self._has_balance = False
+        return self._balance
+
     @property
     def balance(self) -> Balance | None:
         """
@@ -168,12 +189,55 @@ class Account(Monzo):
         Returns:
             List of instantiated Account objects
         """
+        cls._require_sync(auth=auth)
+        res = auth.make_request(path="/accounts", data=cls._fetch_data(account_type=account_type))
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    async def fetch_async(cls, auth: AsyncAuthentication, account_type: str = "") -> list[Account]:
+        """
+        Implement and instantiates an Account object using asyncio.
+
+        Args:
+             auth: Monzo asyncio authentication object
+             account_type: Optional type of account required, must be in ACCOUNT_TYPES
+
+        Returns:
+            List of instantiated Account objects
+        """
+        res = await auth.make_request(path="/accounts", data=cls._fetch_data(account_type=account_type))
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    def _fetch_data(cls, account_type: str) -> dict[str, str]:
+        """
+        Build the parameters for fetching accounts.
+
+        Args:
+             account_type: Optional type of account required, must be in ACCOUNT_TYPES
+
+        Returns:
+            Dictionary of URL parameters
+        """
         data = {}
         if account_type and account_type.lower() in ACCOUNT_TYPES:
             data["account_type"] = account_type.lower()
-        res = auth.make_request(path="/accounts", data=data)
+        return data
+
+    @classmethod
+    def _from_response(cls, auth: Authentication, response: REQUEST_RESPONSE_TYPE) -> list[Account]:
+        """
+        Create Account objects from an accounts response.
+
+        Args:
+             auth: Monzo authentication object
+             response: Response from the accounts endpoint
+
+        Returns:
+            List of instantiated Account objects
+        """
         account_list = []
-        for account_item in res["data"]["accounts"]:
+        for account_item in response["data"]["accounts"]:
             account = Account(
                 auth=auth,
                 account_id=account_item["id"],
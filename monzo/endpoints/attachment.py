@@ -117,6 +117,7 @@ class Attachment(Monzo):
     def delete(self) -> None:
         """Delete the attachment."""
         data: dict[str, str] = {"id": self.attachment_id}
+        self._require_sync(auth=self._monzo_auth)
         self._monzo_auth.make_request(
             path="/attachment/deregister",
             method="POST",
@@ -152,6 +153,7 @@ class Attachment(Monzo):
             "file_type": file_type,
             "file_url": file_url,
         }
+        cls._require_sync(auth=auth)
         response = auth.make_request(path="", method="POST", data=data)
 
         if response["code"] != 200:
@@ -188,6 +190,7 @@ class Attachment(Monzo):
             "file_type": file_type,
             "content_length": content_length,
         }
+        cls._require_sync(auth=auth)
         response = auth.make_request(
             path="",
             method="POST",
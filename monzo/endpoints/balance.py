@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.monzo import Monzo
+from monzo.httpio import REQUEST_RESPONSE_TYPE
 
 
 class Balance(Monzo):
@@ -93,11 +95,42 @@ class Balance(Monzo):
             Balance object for the account
         """
         data = {"account_id": account_id}
+        cls._require_sync(auth=auth)
         res = auth.make_request(path="/balance", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    async def fetch_async(cls, auth: AsyncAuthentication, account_id: str) -> Balance:
+        """
+        Implement and instantiates a Balance object using asyncio.
+
+        Args:
+             auth: Monzo asyncio authentication object
+             account_id: Account to fetch the balance for
+
+        Returns:
+            Balance object for the account
+        """
+        data = {"account_id": account_id}
+        res = await auth.make_request(path="/balance", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    def _from_response(cls, auth: Authentication, response: REQUEST_RESPONSE_TYPE) -> Balance:
+        """
+        Create a Balance object from a balance response.
+
+        Args:
+             auth: Monzo authentication object
+             response: Response from the balance endpoint
+
+        Returns:
+            Balance object for the account
+        """
         return Balance(
             auth=auth,
-            balance=res["data"]["balance"],
-            total_balance=res["data"]["total_balance"],
-            currency=res["data"]["currency"],
-            spend_today=res["data"]["spend_today"],
+            balance=response["data"]["balance"],
+            total_balance=response["data"]["total_balance"],
+            currency=response["data"]["currency"],
+            spend_today=response["data"]["spend_today"],
         )
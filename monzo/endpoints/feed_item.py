@@ -100,6 +100,7 @@ class FeedItem(Monzo):
             data["url"] = self._url
         for parameter in parameters:
             data[f"params[{parameter}]"] = parameters[parameter]
+        self._require_sync(auth=self._monzo_auth)
         self._monzo_auth.make_request(path="/feed", method="POST", data=data)
 
     @classmethod
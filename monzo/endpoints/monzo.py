@@ -1,5 +1,6 @@
 """Base Monzo class."""
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.exceptions import MonzoAuthenticationError
 
@@ -28,3 +29,22 @@ class Monzo:
         if not auth.access_token:
             raise MonzoAuthenticationError("Endpoint cannot be instantiated without a valid access token")
         self._monzo_auth = auth
+
+    @staticmethod
+    def _require_sync(auth: Authentication) -> None:
+        """
+        Check an authentication object makes requests synchronously.
+
+        AsyncAuthentication makes its requests as coroutines, so it can only be used with the async methods.
+
+        Args:
+            auth: Monzo authentication object
+
+        Raises:
+            MonzoAuthenticationError: If an AsyncAuthentication object is used to make a request synchronously
+        """
+        if isinstance(auth, AsyncAuthentication):
+            raise MonzoAuthenticationError(
+                "An Authentication object is required to fetch synchronously, use the async methods with "
+                "AsyncAuthentication"
+            )
@@ -5,11 +5,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.balance import Balance
 from monzo.endpoints.monzo import Monzo
 from monzo.exceptions import MonzoGeneralError
 from monzo.helpers import create_date
+from monzo.httpio import REQUEST_RESPONSE_TYPE
 
 
 class Pot(Monzo):
@@ -266,6 +268,7 @@ class Pot(Monzo):
             "amount": amount,
             "dedupe_id": dedupe_id,
         }
+        cls._require_sync(auth=auth)
         res = auth.make_request(path=path, method="PUT", data=data)
         return cls._update_pot(pot=pot, data=res["data"])
 
@@ -282,9 +285,40 @@ class Pot(Monzo):
             List of pots
         """
         data = {"current_account_id": account_id}
+        cls._require_sync(auth=auth)
         res = auth.make_request(path="/pots", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    async def fetch_async(cls, auth: AsyncAuthentication, account_id: str) -> list[Pot]:
+        """
+        Fetch a list of pots associated with an account using asyncio.
+
+        Args:
+            auth: Monzo asyncio authentication object
+            account_id: Account ID to fetch pots for
+
+        Returns:
+            List of pots
+        """
+        data = {"current_account_id": account_id}
+        res = await auth.make_request(path="/pots", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    def _from_response(cls, auth: Authentication, response: REQUEST_RESPONSE_TYPE) -> list[Pot]:
+        """
+        Create Pot objects from a pots response.
+
+        Args:
+            auth: Monzo authentication object
+            response: Response from the pots endpoint
+
+        Returns:
+            List of pots
+        """
         pot_list = []
-        for pot_item in res["data"]["pots"]:
+        for pot_item in response["data"]["pots"]:
             locked_until = pot_item.get("locked_until", None)
             if locked_until:
                 locked_until = create_date(locked_until)
@@ -357,6 +391,7 @@ class Pot(Monzo):
             "amount": amount,
             "dedupe_id": dedupe_id,
         }
+        cls._require_sync(auth=auth)
         res = auth.make_request(path=path, method="PUT", data=data)
         return cls._update_pot(pot=pot, data=res["data"])
 
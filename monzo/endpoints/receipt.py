@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from json import dumps
 from typing import Any
 
 from monzo.authentication import Authentication
@@ -227,17 +226,19 @@ class Receipt(Monzo):
             "Content-Type": "application/json",
         }
 
+        self._require_sync(auth=self._monzo_auth)
         self._monzo_auth.make_request(
             path=RECEIPTS_PATH,
             authenticated=True,
             method="PUT",
-            data=dumps(data),
+            data=self._monzo_auth.codec.dumps(data),
             headers=headers,
         )
 
     def _delete(self):
         """Delete the current receipt."""
         data = {"external_id": self._external_id}
+        self._require_sync(auth=self._monzo_auth)
         self._monzo_auth.make_request(path=RECEIPTS_PATH, data=data, method="DELETE")
 
     @property
@@ -359,6 +360,7 @@ class Receipt(Monzo):
             List of receipts objects for the external ID
         """
         data = {"external_id": external_id}
+        cls._require_sync(auth=auth)
         res = auth.make_request(path=RECEIPTS_PATH, data=data)
         receipt_data = res["data"]["receipt"]
         receipt_items: list[ReceiptItem] = []
@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.monzo import Monzo
+from monzo.exceptions import MonzoArgumentError
 from monzo.helpers import create_date, format_date
+from monzo.httpio import REQUEST_RESPONSE_TYPE
+from monzo.json_stream import iter_array_items
 
 EXPAND_VALID_VALUES = ["merchant"]
 
+DATE_FIELDS = ("created", "settled", "updated")
+
+MAX_PAGE_SIZE = 100
+
+
+def _check_page_size(page_size: int) -> None:
+    """
+    Validate the number of transactions requested per page.
+
+    Args:
+        page_size: Number of transactions to request per page
+
+    Raises:
+        MonzoArgumentError: If the page size is not between 1 and 100
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise MonzoArgumentError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
 
 class Transaction(Monzo):
     """
@@ -49,6 +72,7 @@ class Transaction(Monzo):
         "_metadata",
         "_notes",
         "_originator",
+        "_raw",
         "_scheme",
         "_settled",
         "_transaction_id",
@@ -56,14 +80,20 @@ class Transaction(Monzo):
         "_user_id",
     ]
 
-    def __init__(self, auth: Authentication, transaction_data: dict[str, Any]):
+    def __init__(self, auth: Authentication, transaction_data: dict[str, Any], lazy: bool = False):
         """
         Initialize Transaction.
 
         Args:
             auth: Monzo authentication object
             transaction_data: Data returned from an API call
+            lazy: If True, keep the data as received and only decode each field when it is first accessed
         """
+        self._raw: dict[str, Any] | None = None
+        if lazy:
+            self._raw = transaction_data
+            super().__init__(auth=auth)
+            return
         self._account_id: str = transaction_data["account_id"]
         self._amount: int = transaction_data["amount"]
         self._amount_is_pending: bool = transaction_data["amount_is_pending"]
@@ -105,6 +135,30 @@ class Transaction(Monzo):
 
         super().__init__(auth=auth)
 
+    def __getattr__(self, name: str) -> Any:
+        """
+        Decode a field of a lazily created transaction and memoize it on first access.
+
+        Only called when an attribute has not been set, which for a lazy transaction is the first access of a field.
+
+        Args:
+            name: Name of the attribute being accessed
+
+        Returns:
+            Decoded value of the field
+
+        Raises:
+            AttributeError: If the attribute is not a transaction field or the transaction is not lazy
+        """
+        key = _LAZY_FIELDS.get(name)
+        if key is None or self._raw is None:
+            raise AttributeError(name)
+        value = self._raw.get(key, "") if key == "decline_reason" else self._raw[key]
+        if key in DATE_FIELDS:
+            value = create_date(value) if value else None
+        setattr(self, name, value)
+        return value
+
     @property
     def account_id(self) -> str:
         """
@@ -472,6 +526,7 @@ class Transaction(Monzo):
         data = {
             f"metadata[{key}]": value,
         }
+        self._require_sync(auth=self._monzo_auth)
         res = self._monzo_auth.make_request(path=path, method="PATCH", data=data)
         self._notes = res["data"]["transaction"]["notes"]
         self._metadata = res["data"]["transaction"]["metadata"]
@@ -495,6 +550,7 @@ class Transaction(Monzo):
                 "expand[]": expand_on,
             }
         path = f"/transactions/{transaction_id}"
+        cls._require_sync(auth=auth)
         res = auth.make_request(path=path, data=data)
         if len(res["data"].get("transaction", {})) == 0:
             return None
@@ -509,6 +565,7 @@ class Transaction(Monzo):
         before: datetime | None = None,
         expand=None,
         limit=30,
+        lazy: bool = False,
     ) -> list[Transaction]:
         """
         Fetch a list of transaction.
@@ -520,10 +577,247 @@ class Transaction(Monzo):
             before: Datetime object to identify when returned transactions should be made before
             expand: List if fields to expand on
             limit: Number of transactions to return per request, max 100, default 30.
+            lazy: If True, transaction fields are only decoded when first accessed
 
         Returns:
             List of transactions
         """
+        data = cls._fetch_data(account_id=account_id, since=since, before=before, expand=expand, limit=limit)
+        cls._require_sync(auth=auth)
+        res = auth.make_request(path="/transactions", data=data)
+        return cls._from_response(auth=auth, response=res, lazy=lazy)
+
+    @classmethod
+    async def fetch_async(
+        cls,
+        auth: AsyncAuthentication,
+        account_id: str,
+        since: datetime | str | None = None,
+        before: datetime | None = None,
+        expand=None,
+        limit=30,
+        lazy: bool = False,
+    ) -> list[Transaction]:
+        """
+        Fetch a list of transaction using asyncio.
+
+        Args:
+            auth: Monzo asyncio authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            limit: Number of transactions to return per request, max 100, default 30.
+            lazy: If True, transaction fields are only decoded when first accessed
+
+        Returns:
+            List of transactions
+        """
+        data = cls._fetch_data(account_id=account_id, since=since, before=before, expand=expand, limit=limit)
+        res = await auth.make_request(path="/transactions", data=data)
+        return cls._from_response(auth=auth, response=res, lazy=lazy)
+
+    @classmethod
+    def iter_all(
+        cls,
+        auth: Authentication,
+        account_id: str,
+        since: datetime | str | None = None,
+        before: datetime | None = None,
+        expand=None,
+        page_size: int = 100,
+        lazy: bool = False,
+        stream: bool = False,
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over every transaction in a time range, fetching further pages as they are needed.
+
+        Pages are requested using the ID of the last transaction received as the cursor for the next page. A page is
+        only requested once the consumer has iterated past the previous one, so stopping early does not fetch the
+        remaining history.
+
+        Args:
+            auth: Monzo authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            page_size: Number of transactions to request per page, max 100, default 100.
+            lazy: If True, transaction fields are only decoded when first accessed
+            stream: If True, each page is streamed as with stream rather than read in full
+
+        Yields:
+            Transactions in the order returned by Monzo
+
+        Raises:
+            MonzoArgumentError: If the page size is not between 1 and 100
+        """
+        if stream:
+            yield from cls._iter_streamed(
+                auth=auth,
+                account_id=account_id,
+                since=since,
+                before=before,
+                expand=expand,
+                page_size=page_size,
+                lazy=lazy,
+            )
+            return
+        for page in cls._iter_pages(
+            auth=auth,
+            account_id=account_id,
+            since=since,
+            before=before,
+            expand=expand,
+            page_size=page_size,
+        ):
+            for transaction_data in page:
+                yield Transaction(auth=auth, transaction_data=transaction_data, lazy=lazy)
+
+    @classmethod
+    def stream(
+        cls,
+        auth: Authentication,
+        account_id: str,
+        since: datetime | str | None = None,
+        before: datetime | None = None,
+        expand=None,
+        limit=100,
+        lazy: bool = False,
+    ) -> Iterator[Transaction]:
+        """
+        Fetch a list of transactions, yielding each one as soon as it has arrived.
+
+        Each transaction is decoded once its closing brace is received, so it can be processed while the rest of the
+        page downloads and only one transaction is held at a time.
+
+        Args:
+            auth: Monzo authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            limit: Number of transactions to return per request, max 100, default 100.
+            lazy: If True, transaction fields are only decoded when first accessed
+
+        Yields:
+            Transactions in the order returned by Monzo
+        """
+        data = cls._fetch_data(account_id=account_id, since=since, before=before, expand=expand, limit=limit)
+        cls._require_sync(auth=auth)
+        chunks = auth.stream_request(path="/transactions", data=data)
+        for item in iter_array_items(chunks=chunks, key="transactions"):
+            yield Transaction(auth=auth, transaction_data=auth.codec.loads(item), lazy=lazy)
+
+    @classmethod
+    def _iter_pages(
+        cls,
+        auth: Authentication,
+        account_id: str,
+        since: datetime | str | None,
+        before: datetime | None,
+        expand,
+        page_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the raw transaction data one page at a time.
+
+        Args:
+            auth: Monzo authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            page_size: Number of transactions to request per page, max 100
+
+        Yields:
+            List of transaction data for each non-empty page
+
+        Raises:
+            MonzoArgumentError: If the page size is not between 1 and 100
+        """
+        _check_page_size(page_size=page_size)
+        cls._require_sync(auth=auth)
+        cursor = since
+        while True:
+            data = cls._fetch_data(account_id=account_id, since=cursor, before=before, expand=expand, limit=page_size)
+            page: list[dict[str, Any]] = auth.make_request(path="/transactions", data=data)["data"]["transactions"]
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            cursor = page[-1]["id"]
+
+    @classmethod
+    def _iter_streamed(
+        cls,
+        auth: Authentication,
+        account_id: str,
+        since: datetime | str | None,
+        before: datetime | None,
+        expand,
+        page_size: int,
+        lazy: bool,
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over every transaction in a time range, streaming one page at a time.
+
+        Args:
+            auth: Monzo authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            page_size: Number of transactions to request per page, max 100
+            lazy: If True, transaction fields are only decoded when first accessed
+
+        Yields:
+            Transactions in the order returned by Monzo
+
+        Raises:
+            MonzoArgumentError: If the page size is not between 1 and 100
+        """
+        _check_page_size(page_size=page_size)
+        cursor = since
+        while True:
+            count = 0
+            for transaction in cls.stream(
+                auth=auth,
+                account_id=account_id,
+                since=cursor,
+                before=before,
+                expand=expand,
+                limit=page_size,
+                lazy=lazy,
+            ):
+                count += 1
+                cursor = transaction.transaction_id
+                yield transaction
+            if count < page_size:
+                return
+
+    @classmethod
+    def _fetch_data(
+        cls,
+        account_id: str,
+        since: datetime | str | None,
+        before: datetime | None,
+        expand,
+        limit,
+    ) -> dict[str, int | str]:
+        """
+        Build the parameters for fetching a list of transactions.
+
+        Args:
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            limit: Number of transactions to return per request, max 100
+
+        Returns:
+            Dictionary of URL parameters
+        """
         if expand is None:
             expand = []
         data: dict[str, int | str] = {
@@ -541,10 +835,36 @@ class Transaction(Monzo):
             data["before"] = format_date(before)
         if limit:
             data["limit"] = min(limit, 100)
-        path = "/transactions"
-        res = auth.make_request(path=path, data=data)
+        return data
+
+    @classmethod
+    def _from_response(
+        cls,
+        auth: Authentication,
+        response: REQUEST_RESPONSE_TYPE,
+        lazy: bool = False,
+    ) -> list[Transaction]:
+        """
+        Create Transaction objects from a transactions response.
+
+        Args:
+            auth: Monzo authentication object
+            response: Response from the transactions endpoint
+            lazy: If True, transaction fields are only decoded when first accessed
+
+        Returns:
+            List of transactions
+        """
         transactions = []
-        for transaction_data in res["data"]["transactions"]:
-            transaction = Transaction(auth=auth, transaction_data=transaction_data)
+        for transaction_data in response["data"]["transactions"]:
+            transaction = Transaction(auth=auth, transaction_data=transaction_data, lazy=lazy)
             transactions.append(transaction)
         return transactions
+
+
+# Maps each attribute of a lazily created transaction to its key in the API response
+_LAZY_FIELDS: dict[str, str] = {
+    attribute: "id" if attribute == "_transaction_id" else attribute[1:]
+    for attribute in Transaction.__slots__
+    if attribute != "_raw"
+}
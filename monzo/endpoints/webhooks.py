@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from urllib.parse import urlparse
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.monzo import Monzo
 from monzo.exceptions import MonzoArgumentError
+from monzo.httpio import REQUEST_RESPONSE_TYPE
 
 
 class Webhook(Monzo):
@@ -39,12 +41,14 @@ class Webhook(Monzo):
             "account_id": self._account_id,
             "url": self._url,
         }
+        self._require_sync(auth=self._monzo_auth)
         res = self._monzo_auth.make_request(path="/webhooks", method="POST", data=data)
         self._webhook_id = res["data"]["webhook"]["id"]
 
     def _delete(self) -> None:
         """Delete the current webhook."""
         path = f"/webhooks/{self._webhook_id}"
+        self._require_sync(auth=self._monzo_auth)
         self._monzo_auth.make_request(path=path, method="DELETE")
 
     @property
@@ -124,9 +128,40 @@ class Webhook(Monzo):
             List of webhook objects for the account
         """
         data: dict[str, str] = {"account_id": account_id}
+        cls._require_sync(auth=auth)
         res = auth.make_request(path="/webhooks", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    async def fetch_async(cls, auth: AsyncAuthentication, account_id: str) -> list[Webhook]:
+        """
+        Fetch webhooks for an account using asyncio.
+
+        Args:
+            auth: Monzo asyncio authentication object
+            account_id: Account to fetch the webhooks for
+
+        Returns:
+            List of webhook objects for the account
+        """
+        data: dict[str, str] = {"account_id": account_id}
+        res = await auth.make_request(path="/webhooks", data=data)
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    def _from_response(cls, auth: Authentication, response: REQUEST_RESPONSE_TYPE) -> list[Webhook]:
+        """
+        Create Webhook objects from a webhooks response.
+
+        Args:
+            auth: Monzo authentication object
+            response: Response from the webhooks endpoint
+
+        Returns:
+            List of webhook objects for the account
+        """
         webhooks: list[Webhook] = []
-        for webhook_item in res["data"]["webhooks"]:
+        for webhook_item in response["data"]["webhooks"]:
             webhook = Webhook(
                 auth=auth,
                 account_id=webhook_item["account_id"],
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from monzo.async_authentication import AsyncAuthentication
 from monzo.authentication import Authentication
 from monzo.endpoints.monzo import Monzo
+from monzo.httpio import REQUEST_RESPONSE_TYPE
 
 
 class WhoAmI(Monzo):
@@ -71,10 +73,39 @@ class WhoAmI(Monzo):
         Returns:
             Instantiated WhoAmI object
         """
+        cls._require_sync(auth=auth)
         res = auth.make_request(path="/ping/whoami")
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    async def fetch_async(cls, auth: AsyncAuthentication) -> WhoAmI:
+        """
+        Implement and instantiates the WhoAmI object using asyncio.
+
+        Args:
+             auth: Monzo asyncio authentication object
+
+        Returns:
+            Instantiated WhoAmI object
+        """
+        res = await auth.make_request(path="/ping/whoami")
+        return cls._from_response(auth=auth, response=res)
+
+    @classmethod
+    def _from_response(cls, auth: Authentication, response: REQUEST_RESPONSE_TYPE) -> WhoAmI:
+        """
+        Create a WhoAmI object from a whoami response.
+
+        Args:
+             auth: Monzo authentication object
+             response: Response from the whoami endpoint
+
+        Returns:
+            Instantiated WhoAmI object
+        """
         return cls(
             auth=auth,
-            authenticated=res["data"]["authenticated"],
-            client_id=res["data"]["client_id"],
-            user_id=res["data"]["user_id"],
+            authenticated=response["data"]["authenticated"],
+            client_id=response["data"]["client_id"],
+            user_id=response["data"]["user_id"],
         )
@@ -40,6 +40,17 @@ class MonzoServerError(MonzoError):
     Exception usually caused by an issue on the Monzo servers
     """
 
+    def __init__(self, *args, retry_after: float | None = None):
+        """
+        Initialize MonzoServerError.
+
+        Args:
+            args: Exception arguments
+            retry_after: Seconds the Retry-After header asked to wait, None if not provided
+        """
+        super().__init__(*args)
+        self.retry_after: float | None = retry_after
+
 
 class MonzoPermissionsError(MonzoError):
     """
@@ -56,6 +67,17 @@ class MonzoRateError(MonzoError):
     Exception to be thrown when a Monzo advises you are exceeding the rate limit for the API
     """
 
+    def __init__(self, *args, retry_after: float | None = None):
+        """
+        Initialize MonzoRateError.
+
+        Args:
+            args: Exception arguments
+            retry_after: Seconds the Retry-After header asked to wait, None if not provided
+        """
+        super().__init__(*args)
+        self.retry_after: float | None = retry_after
+
 
 class MonzoGeneralError(MonzoError):
     """
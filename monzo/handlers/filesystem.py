@@ -2,14 +2,21 @@
 
 import os
 from json import dumps, loads
+from tempfile import mkstemp
 
 from monzo.handlers.storage import Storage
 
 
 class FileSystem(Storage):
-    """Class that will store credentials on the file system."""
+    """
+    Class that will store credentials on the file system.
 
-    __slots__ = ["_file"]
+    Parsed credentials are cached and the file is only read again once its modification time, inode or size changes.
+    Credentials are written to a temporary file that is renamed over the original, so readers never see a partly
+    written file.
+    """
+
+    __slots__ = ["_cache", "_file"]
 
     def __init__(self, file: str):
         """
@@ -18,6 +25,7 @@ class FileSystem(Storage):
         Args:
             file: THe full path (including filename) to the storage file
         """
+        self._cache: tuple[tuple[int, int, int], dict[str, int | str]] | None = None
         self._file = file
 
     def fetch(self) -> dict[str, int | str]:
@@ -28,12 +36,18 @@ class FileSystem(Storage):
             Dictionary containing access token, expiry and refresh token
         """
         try:
+            cache = self._cache
+            if cache and cache[0] == _file_version(os.stat(self._file)):
+                return dict(cache[1])
             with open(self._file, mode="r") as handler:
+                version = _file_version(os.fstat(handler.fileno()))
                 content = loads(handler.read())
         except FileNotFoundError:
-            content: dict[str, int | str] = {}
+            self._cache = None
+            return {}
 
-        return content
+        self._cache = (version, content)
+        return dict(content)
 
     def store(
         self,
@@ -60,7 +74,30 @@ class FileSystem(Storage):
             "expiry": expiry,
             "refresh_token": refresh_token,
         }
-        fd: int = os.open(path=self._file, flags=os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode=0o600)
-        with os.fdopen(fd, mode="w") as handler:
-            handler.write(dumps(obj=content))
-        os.chmod(path=self._file, mode=0o600)
+        directory, name = os.path.split(os.path.abspath(self._file))
+        fd, temp_file = mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="w") as handler:
+                handler.write(dumps(obj=content))
+                handler.flush()
+                os.fsync(handler.fileno())
+                version = _file_version(os.fstat(handler.fileno()))
+            os.chmod(path=temp_file, mode=0o600)
+            os.replace(temp_file, self._file)
+        except BaseException:
+            os.unlink(temp_file)
+            raise
+        self._cache = (version, content)
+
+
+def _file_version(stat: os.stat_result) -> tuple[int, int, int]:
+    """
+    Identify a version of a file.
+
+    Args:
+        stat: Result of stat on the file
+
+    Returns:
+        Tuple of modification time in nanoseconds, inode and size
+    """
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
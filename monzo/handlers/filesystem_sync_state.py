@@ -0,0 +1,77 @@
+"""Class to store transaction sync state on the file system."""
+
+import os
+from json import dumps, loads
+from tempfile import mkstemp
+
+from monzo.handlers.sync_state import SyncState
+
+
+class FileSystemSyncState(SyncState):
+    """
+    Class that will store transaction sync state for every account in a single file.
+
+    The file is replaced in a single step on each store, so a run interrupted part way through leaves the previous
+    state in place.
+    """
+
+    __slots__ = ["_file"]
+
+    def __init__(self, file: str):
+        """
+        Initialize FileSystemSyncState.
+
+        Args:
+            file: The full path (including filename) to the storage file
+        """
+        self._file = file
+
+    def fetch(self, account_id: str) -> dict[str, str]:
+        """
+        Fetch the high-water mark for an account.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            Dictionary containing the created timestamp in ISO 8601 format and transaction ID, empty if none is stored
+        """
+        return self._read().get(account_id, {})
+
+    def store(self, account_id: str, created: str, transaction_id: str) -> None:
+        """
+        Store the high-water mark for an account.
+
+        Args:
+            account_id: ID of the account
+            created: Created timestamp of the newest transaction seen in ISO 8601 format
+            transaction_id: ID of the newest transaction seen
+        """
+        content = self._read()
+        content[account_id] = {"created": created, "transaction_id": transaction_id}
+        directory, name = os.path.split(os.path.abspath(self._file))
+        fd, temp_file = mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="w") as handler:
+                handler.write(dumps(obj=content))
+                handler.flush()
+                os.fsync(handler.fileno())
+            os.chmod(path=temp_file, mode=0o600)
+            os.replace(temp_file, self._file)
+        except BaseException:
+            os.unlink(temp_file)
+            raise
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        """
+        Read the state for all accounts.
+
+        Returns:
+            Dictionary of high-water marks keyed by account ID
+        """
+        try:
+            with open(self._file, mode="r") as handler:
+                content = loads(handler.read())
+        except FileNotFoundError:
+            content: dict[str, dict[str, str]] = {}
+        return content
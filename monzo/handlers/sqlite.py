@@ -0,0 +1,243 @@
+"""Classes to store credentials for many users in SQLite."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import suppress
+from threading import Condition, Lock
+
+from monzo.exceptions import MonzoGeneralError
+from monzo.handlers.storage import Storage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS credentials (
+    key TEXT PRIMARY KEY,
+    client_id TEXT NOT NULL,
+    client_secret TEXT NOT NULL,
+    access_token TEXT NOT NULL,
+    expiry INTEGER NOT NULL,
+    refresh_token TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS credentials_client_id ON credentials (client_id);
+"""
+
+UPSERT = (
+    "INSERT INTO credentials (key, client_id, client_secret, access_token, expiry, refresh_token) "
+    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET client_id = excluded.client_id, "
+    "client_secret = excluded.client_secret, access_token = excluded.access_token, expiry = excluded.expiry, "
+    "refresh_token = excluded.refresh_token"
+)
+
+ROW_TYPE = tuple[str, str, str, str, int, str]
+
+DEFAULT_BATCH_WINDOW = 0.005
+
+
+class _Batch:
+    """Class holding rows waiting to be committed together."""
+
+    __slots__ = ["done", "error", "rows"]
+
+    def __init__(self):
+        """Initialize _Batch."""
+        self.done: bool = False
+        self.error: BaseException | None = None
+        self.rows: dict[str, ROW_TYPE] = {}
+
+
+class CredentialDatabase:
+    """
+    Class holding credentials for many users in a single SQLite database.
+
+    The database uses write-ahead logging and reads are made on their own connection, so reads are not blocked by
+    writes. An in-memory database has a single connection shared by reads and writes. Writes arriving while another is
+    being committed are queued and committed together in the next transaction, so a burst of concurrent refreshes
+    costs a handful of commits rather than one each.
+    """
+
+    __slots__ = [
+        "_batch_window",
+        "_condition",
+        "_connection",
+        "_connection_lock",
+        "_pending",
+        "_reader",
+        "_reader_lock",
+        "_writing",
+    ]
+
+    def __init__(self, database: str, batch_window: float = DEFAULT_BATCH_WINDOW):
+        """
+        Initialize CredentialDatabase.
+
+        Args:
+            database: Path to the SQLite database, created readable by the owner only
+            batch_window: Seconds a writer waits for concurrent writes to join its transaction
+        """
+        if database != ":memory:":
+            # Create the file before SQLite does so it is never readable by others, SQLite gives the -wal and -shm
+            # files the same permissions as the database
+            os.close(os.open(path=database, flags=os.O_RDWR | os.O_CREAT, mode=0o600))
+            os.chmod(path=database, mode=0o600)
+        self._batch_window: float = batch_window
+        self._condition: Condition = Condition()
+        self._connection: sqlite3.Connection = sqlite3.connect(database=database, check_same_thread=False)
+        self._connection_lock: Lock = Lock()
+        self._pending: _Batch = _Batch()
+        self._writing: _Batch | None = None
+        with self._connection_lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                self._connection.executescript(SCHEMA)
+        self._reader: sqlite3.Connection = self._connection
+        self._reader_lock: Lock = self._connection_lock
+        if database != ":memory:":
+            for suffix in ("-wal", "-shm"):
+                with suppress(FileNotFoundError):
+                    os.chmod(path=f"{database}{suffix}", mode=0o600)
+            # Reads use their own connection so they see the last commit while a write is in progress
+            self._reader = sqlite3.connect(database=database, check_same_thread=False)
+            self._reader.execute("PRAGMA query_only=ON")
+            self._reader_lock = Lock()
+
+    def close(self) -> None:
+        """Close the database connections."""
+        with self._reader_lock:
+            self._reader.close()
+        with self._connection_lock:
+            self._connection.close()
+
+    def fetch(self, key: str) -> dict[str, int | str]:
+        """
+        Fetch the credentials stored for a key, including credentials waiting to be committed.
+
+        Args:
+            key: Key the credentials are stored under
+
+        Returns:
+            Dictionary containing access token, expiry and refresh token, empty if nothing is stored
+        """
+        with self._condition:
+            row = self._pending.rows.get(key) or (self._writing.rows.get(key) if self._writing else None)
+        if row is None:
+            with self._reader_lock:
+                row = self._reader.execute(
+                    "SELECT key, client_id, client_secret, access_token, expiry, refresh_token "
+                    "FROM credentials WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        if row is None:
+            return {}
+        _, client_id, client_secret, access_token, expiry, refresh_token = row
+        return {
+            "access_token": access_token,
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "expiry": expiry,
+            "refresh_token": refresh_token,
+        }
+
+    def keys(self, client_id: str) -> list[str]:
+        """
+        Fetch the keys holding credentials for a client ID.
+
+        Args:
+            client_id: Monzo client ID
+
+        Returns:
+            List of keys
+        """
+        with self._reader_lock:
+            rows = self._reader.execute("SELECT key FROM credentials WHERE client_id = ? ORDER BY key", (client_id,))
+            return [key for (key,) in rows]
+
+    def store(self, row: ROW_TYPE) -> None:
+        """
+        Store credentials, returning once they have been committed.
+
+        A writer finding no commit in progress waits up to the batch window and then commits every queued row in a
+        single transaction, writers arriving meanwhile queue their rows and wait for the transaction holding them.
+
+        Args:
+            row: Tuple of key, client ID, client secret, access token, expiry and refresh token
+
+        Raises:
+            MonzoGeneralError: If the transaction holding the row failed, for writers that did not commit it the
+                original exception is chained
+        """
+        with self._condition:
+            batch = self._pending
+            batch.rows[row[0]] = row
+            while self._writing and not batch.done:
+                self._condition.wait()
+            leader = not batch.done
+            if leader:
+                self._writing = batch
+                if self._batch_window:
+                    # Give concurrent writers a moment to join this transaction
+                    self._condition.wait(timeout=self._batch_window)
+                self._pending = _Batch()
+        if leader:
+            try:
+                with self._connection_lock, self._connection:
+                    self._connection.executemany(UPSERT, list(batch.rows.values()))
+            except BaseException as exc:
+                # Followers are told of any failure, the leader raises anything other than a database error as is
+                batch.error = exc
+                if not isinstance(exc, sqlite3.Error):
+                    raise
+            finally:
+                with self._condition:
+                    batch.done = True
+                    self._writing = None
+                    self._condition.notify_all()
+        if batch.error:
+            raise MonzoGeneralError("Unable to store credentials") from batch.error
+
+
+class SQLiteStorage(Storage):
+    """Class that will store credentials for a single key in a shared CredentialDatabase."""
+
+    __slots__ = ["_database", "_key"]
+
+    def __init__(self, database: CredentialDatabase, key: str):
+        """
+        Initialize SQLiteStorage.
+
+        Args:
+            database: Database shared by every key
+            key: Key the credentials are stored under, such as a user ID
+        """
+        self._database: CredentialDatabase = database
+        self._key: str = key
+
+    def fetch(self) -> dict[str, int | str]:
+        """
+        Fetch Monzo credentials previously stored.
+
+        Returns:
+            Dictionary containing access token, expiry and refresh token
+        """
+        return self._database.fetch(key=self._key)
+
+    def store(
+        self,
+        access_token: str,
+        client_id: str,
+        client_secret: str,
+        expiry: int,
+        refresh_token: str = "",
+    ) -> None:
+        """
+        Store the Monzo credentials.
+
+        Args:
+            access_token: New access token
+            client_id: Monzo client ID
+            client_secret: Monzo client secret
+            expiry: Access token expiry as a unix timestamp
+            refresh_token: Refresh token that can be used to renew an access token
+        """
+        self._database.store(row=(self._key, client_id, client_secret, access_token, expiry, refresh_token))
@@ -0,0 +1,35 @@
+"""Abstract class for transaction sync state storage."""
+
+from abc import ABC, abstractmethod
+
+
+class SyncState(ABC):
+    """
+    Abstract class that must be implemented to persist incremental sync progress.
+
+    Abstract class specifying the methods that need to be implemented to store the high-water mark, the created
+    timestamp and ID of the newest transaction seen, for each account.
+    """
+
+    @abstractmethod
+    def fetch(self, account_id: str) -> dict[str, str]:
+        """
+        Abstract method that needs to be implemented to fetch the high-water mark for an account.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            Dictionary containing the created timestamp in ISO 8601 format and transaction ID, empty if none is stored
+        """
+
+    @abstractmethod
+    def store(self, account_id: str, created: str, transaction_id: str) -> None:
+        """
+        Abstract method that needs to be implemented to store the high-water mark for an account.
+
+        Args:
+            account_id: ID of the account
+            created: Created timestamp of the newest transaction seen in ISO 8601 format
+            transaction_id: ID of the newest transaction seen
+        """
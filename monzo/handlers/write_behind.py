@@ -0,0 +1,220 @@
+"""Classes to store credentials on a background thread."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any
+
+from monzo.handlers.storage import Storage
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+_default_writer: BackgroundWriter | None = None
+
+_default_writer_lock = Lock()
+
+
+class BackgroundWriter:
+    """
+    Class to write credentials to storage on a background thread.
+
+    Writes are queued per storage handler, a write queued before an earlier one for the same handler has been made
+    replaces it so only the newest credentials are written. Queued writes are flushed when the interpreter exits.
+    """
+
+    __slots__ = ["_closed", "_condition", "_pending", "_thread", "_writing"]
+
+    def __init__(self):
+        """Initialize BackgroundWriter."""
+        self._closed: bool = False
+        self._condition: Condition = Condition()
+        self._pending: dict[Storage, dict[str, Any]] = {}
+        self._thread: Thread | None = None
+        self._writing: dict[Storage, dict[str, Any]] = {}
+        atexit.register(self.close)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Flush queued writes and stop the background thread.
+
+        Args:
+            timeout: Maximum seconds to wait for queued writes, None to wait as long as needed
+        """
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread:
+            thread.join(timeout=timeout)
+        atexit.unregister(self.close)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait for every queued write to be made.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait as long as needed
+
+        Returns:
+            True if every queued write was made, False if the timeout passed first
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+        return True
+
+    def pending(self, handler: Storage) -> dict[str, Any] | None:
+        """
+        Fetch credentials queued for a handler that have not been written yet.
+
+        Credentials being written remain pending until the handler's store method has returned, so they can be
+        fetched while the handler is part way through writing them.
+
+        Args:
+            handler: Storage handler
+
+        Returns:
+            Keyword arguments for the queued store call, None if nothing is queued
+        """
+        with self._condition:
+            credentials = self._pending.get(handler)
+            if credentials is None:
+                credentials = self._writing.get(handler)
+            return credentials
+
+    def submit(self, handler: Storage, credentials: dict[str, Any]) -> None:
+        """
+        Queue credentials to be written to a handler.
+
+        Args:
+            handler: Storage handler to write to
+            credentials: Keyword arguments for the handler's store method
+        """
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                # Replace any write still queued for the handler and move it to the back of the queue
+                self._pending.pop(handler, None)
+                self._pending[handler] = credentials
+                if self._thread is None:
+                    self._thread = Thread(target=self._run, name="monzo-storage-writer", daemon=True)
+                    self._thread.start()
+                self._condition.notify_all()
+        if closed:
+            # The writer has been closed, write on the calling thread instead
+            handler.store(**credentials)
+
+    def _run(self) -> None:
+        """Write queued credentials until closed."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                handler, credentials = next(iter(self._pending.items()))
+                del self._pending[handler]
+                self._writing[handler] = credentials
+            try:
+                handler.store(**credentials)
+            except Exception:
+                logger.exception(msg="Background credential store failed")
+            finally:
+                with self._condition:
+                    del self._writing[handler]
+                    self._condition.notify_all()
+
+
+class WriteBehindStorage(Storage):
+    """
+    Class wrapping a Storage handler so that credentials are written on a background thread.
+
+    Fetching returns credentials waiting to be written before falling back to the wrapped handler.
+    """
+
+    __slots__ = ["_handler", "_writer"]
+
+    def __init__(self, handler: Storage, writer: BackgroundWriter | None = None):
+        """
+        Initialize WriteBehindStorage.
+
+        Args:
+            handler: Storage handler to write to
+            writer: Background writer to queue writes on, by default a writer shared by the process
+        """
+        self._handler: Storage = handler
+        self._writer: BackgroundWriter = writer or default_writer()
+
+    @property
+    def handler(self) -> Storage:
+        """
+        Property for the wrapped handler.
+
+        Returns:
+            Storage handler written to
+        """
+        return self._handler
+
+    def fetch(self) -> dict[str, int | str]:
+        """
+        Fetch Monzo credentials, including credentials waiting to be written.
+
+        Returns:
+            Dictionary containing access token, expiry and refresh token
+        """
+        pending = self._writer.pending(handler=self._handler)
+        if pending is not None:
+            return dict(pending)
+        return self._handler.fetch()
+
+    def store(
+        self,
+        access_token: str,
+        client_id: str,
+        client_secret: str,
+        expiry: int,
+        refresh_token: str = "",
+    ) -> None:
+        """
+        Queue the Monzo credentials to be stored.
+
+        Args:
+            access_token: New access token
+            client_id: Monzo client ID
+            client_secret: Monzo client secret
+            expiry: Access token expiry as a unix timestamp
+            refresh_token: Refresh token that can be used to renew an access token
+        """
+        self._writer.submit(
+            handler=self._handler,
+            credentials={
+                "access_token": access_token,
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "expiry": expiry,
+                "refresh_token": refresh_token,
+            },
+        )
+
+
+def default_writer() -> BackgroundWriter:
+    """
+    Fetch the background writer shared by the process.
+
+    Returns:
+        Shared background writer, created on first use
+    """
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = BackgroundWriter()
+        return _default_writer
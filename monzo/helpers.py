@@ -1,19 +1,32 @@
 """Helper functions."""
 
 from datetime import UTC, datetime
+from functools import lru_cache
 
+DATE_CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def create_date(date_str: str) -> datetime:
     """
     Convert a date and time received from Monzo into a DateTime object.
 
+    Accepts ISO 8601 timestamps with or without fractional seconds and with a Z or numeric offset suffix, timestamps
+    without a suffix are assumed to be UTC. Results are memoized as the same timestamp is often repeated, for example,
+    the updated time of a batch of transactions.
+
     Args:
         date_str: Date and time as a string
 
     Returns:
-        Converted date and time
+        Converted date and time in UTC
     """
-    return datetime.strptime(date_str[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
+    date = datetime.fromisoformat(date_str)
+    if date.tzinfo is None:
+        return date.replace(tzinfo=UTC)
+    if date.tzinfo is not UTC:
+        return date.astimezone(UTC)
+    return date
 
 
 def format_date(date: datetime) -> str:
@@ -1,25 +1,42 @@
 """Class that handles HTTP requests."""
 
 import ssl
-from json import loads
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from copy import deepcopy
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode, urlsplit
 
+from monzo.codec import JsonCodec, default_codec
 from monzo.exceptions import (
     MonzoAuthenticationError,
+    MonzoError,
     MonzoGeneralError,
     MonzoHTTPError,
     MonzoPermissionsError,
     MonzoRateError,
     MonzoServerError,
 )
+from monzo.retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
 
 _SSL_CONTEXT = ssl.create_default_context()
 
 DEFAULT_TIMEOUT = 10
 
+DEFAULT_POOL_SIZE = 10
+
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+DEFAULT_CONDITIONAL_ENTRIES = 256
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+READ_SIZE = 65536
+
 REQUEST_RESPONSE_TYPE = dict[str, Any]
 
 MONZO_ERROR_MAP = {
@@ -31,10 +48,395 @@ MONZO_ERROR_MAP = {
     406: MonzoGeneralError,
     429: MonzoRateError,
     500: MonzoServerError,
+    502: MonzoServerError,
+    503: MonzoServerError,
     504: MonzoServerError,
 }
 
 
+CONNECTION_KEY_TYPE = tuple[str, str, int]
+
+CONDITIONAL_KEY_TYPE = tuple[str, str]
+
+
+def error_for_status(code: int, retry_after: float | None) -> MonzoError:
+    """
+    Create the exception for an unsuccessful response.
+
+    Args:
+        code: HTTP status code of the response
+        retry_after: Seconds the Retry-After header asked to wait, if any
+
+    Returns:
+        Exception to raise, rate and server errors carry the Retry-After value
+    """
+    exception_cls = MONZO_ERROR_MAP.get(code, MonzoGeneralError)
+    if exception_cls in (MonzoRateError, MonzoServerError):
+        return exception_cls(retry_after=retry_after)
+    return exception_cls()
+
+
+def _has_zlib_header(data: bytes) -> bool:
+    """
+    Identify if data starts with a zlib header.
+
+    Args:
+        data: Start of a deflate body
+
+    Returns:
+        True if the data starts with a valid zlib header, otherwise it is taken to be raw deflate data
+    """
+    return len(data) >= 2 and data[0] & 0x0F == 8 and int.from_bytes(data[:2], "big") % 31 == 0
+
+
+class ConnectionPool:
+    """
+    Class to manage persistent HTTP connections.
+
+    Keeps a bounded number of keep-alive connections per host so that consecutive requests avoid a fresh TCP connect
+    and TLS handshake. Connections are checked out by a single thread at a time and connections that have sat idle for
+    longer than the idle timeout are closed rather than reused.
+    """
+
+    __slots__ = ["_idle", "_idle_timeout", "_lock", "_max_size", "_semaphores", "_ssl_context"]
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """
+        Initialize ConnectionPool.
+
+        Args:
+            max_size: Maximum number of connections per host that may be checked out at once
+            idle_timeout: Seconds an idle connection is kept before being discarded
+            ssl_context: SSL context for HTTPS connections, defaults to the system trust store
+        """
+        self._idle: dict[CONNECTION_KEY_TYPE, deque[tuple[HTTPConnection, float]]] = {}
+        self._idle_timeout: float = idle_timeout
+        self._lock: Lock = Lock()
+        self._max_size: int = max_size
+        self._semaphores: dict[CONNECTION_KEY_TYPE, BoundedSemaphore] = {}
+        self._ssl_context: ssl.SSLContext = ssl_context or _SSL_CONTEXT
+
+    def acquire(self, key: CONNECTION_KEY_TYPE, timeout: float) -> tuple[HTTPConnection, bool]:
+        """
+        Check out a connection for the given host.
+
+        Args:
+            key: Tuple of scheme, host and port identifying the connection
+            timeout: Timeout in seconds for waiting on the pool and for the connection itself
+
+        Returns:
+            Tuple of the connection and True if it is a reused connection, otherwise False
+
+        Raises:
+            MonzoGeneralError: When no connection becomes available within the timeout
+        """
+        with self._lock:
+            semaphore = self._semaphores.setdefault(key, BoundedSemaphore(self._max_size))
+        if not semaphore.acquire(timeout=timeout):
+            raise MonzoGeneralError("Timed out waiting for a connection to the Monzo API")
+        connection = self._pop_idle(key=key)
+        if connection:
+            connection.timeout = timeout
+            if connection.sock:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        scheme, host, port = key
+        if scheme == "https":
+            return HTTPSConnection(host=host, port=port, timeout=timeout, context=self._ssl_context), False
+        return HTTPConnection(host=host, port=port, timeout=timeout), False
+
+    def close(self) -> None:
+        """Close all idle connections held by the pool."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def release(self, key: CONNECTION_KEY_TYPE, connection: HTTPConnection, reusable: bool) -> None:
+        """
+        Return a previously acquired connection to the pool.
+
+        Args:
+            key: Tuple of scheme, host and port the connection was acquired with
+            connection: Connection being returned
+            reusable: True if the connection can serve another request, otherwise it is closed
+        """
+        try:
+            if not reusable:
+                connection.close()
+                return
+            with self._lock:
+                self._idle.setdefault(key, deque()).append((connection, monotonic()))
+        finally:
+            self._semaphores[key].release()
+
+    def _pop_idle(self, key: CONNECTION_KEY_TYPE) -> HTTPConnection | None:
+        """
+        Fetch the most recently used idle connection, discarding any that have expired.
+
+        Args:
+            key: Tuple of scheme, host and port identifying the connection
+
+        Returns:
+            Idle connection if one is available, otherwise None
+        """
+        expired: list[HTTPConnection] = []
+        connection: HTTPConnection | None = None
+        cutoff = monotonic() - self._idle_timeout
+        with self._lock:
+            connections = self._idle.get(key)
+            while connections:
+                candidate, last_used = connections.pop()
+                if last_used >= cutoff:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+            while connections and connections[0][1] < cutoff:
+                expired.append(connections.popleft()[0])
+        for stale in expired:
+            stale.close()
+        return connection
+
+
+class BodyDecoder:
+    """
+    Class to decompress a response body as it is read.
+
+    Bodies sent with a gzip or deflate Content-Encoding are decompressed chunk by chunk so the compressed body is never
+    held in full, other bodies are passed through unchanged. The compressed and decompressed sizes are recorded for the
+    response metadata.
+    """
+
+    __slots__ = ["_chunks", "_decompressor", "_encoding", "_pending", "compressed_size", "size"]
+
+    def __init__(self, content_encoding: str | None):
+        """
+        Initialize BodyDecoder.
+
+        Args:
+            content_encoding: Content-Encoding header of the response
+        """
+        self._chunks: list[bytes] = []
+        self._encoding: str = (content_encoding or "identity").strip().lower()
+        self._decompressor = None
+        if self._encoding == "gzip":
+            self._decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        # A deflate decompressor is created once the first two bytes show whether the zlib wrapper is present
+        self._pending: bytes = b""
+        self.compressed_size: int = 0
+        self.size: int = 0
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """
+        Property for the response metadata.
+
+        Returns:
+            Dictionary of content encoding, size as transferred and size once decompressed
+        """
+        return {"content_encoding": self._encoding, "compressed_size": self.compressed_size, "size": self.size}
+
+    def decode(self, chunk: bytes) -> bytes:
+        """
+        Decompress a chunk of the body without holding it.
+
+        Args:
+            chunk: Chunk of the body as transferred
+
+        Returns:
+            Decompressed data, which may be empty until the decompressor has a complete block
+
+        Raises:
+            zlib.error: If the body is not valid for its Content-Encoding
+        """
+        if not chunk:
+            return b""
+        self.compressed_size += len(chunk)
+        if self._encoding == "deflate" and self._decompressor is None:
+            chunk = self._pending + chunk
+            if len(chunk) < 2:
+                self._pending = chunk
+                return b""
+            self._pending = b""
+            # Some servers send raw deflate data without the zlib wrapper the specification requires
+            wbits = zlib.MAX_WBITS if _has_zlib_header(data=chunk) else -zlib.MAX_WBITS
+            self._decompressor = zlib.decompressobj(wbits=wbits)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Decompress a chunk of the body.
+
+        Args:
+            chunk: Chunk of the body as transferred
+
+        Raises:
+            zlib.error: If the body is not valid for its Content-Encoding
+        """
+        if chunk:
+            self._chunks.append(self.decode(chunk=chunk))
+
+    def flush(self) -> bytes:
+        """
+        Complete decompression without holding the remaining data.
+
+        Returns:
+            Data still held by the decompressor
+
+        Raises:
+            zlib.error: If the body is not valid for its Content-Encoding
+            MonzoGeneralError: If a compressed body ends part way through
+        """
+        incomplete = self._decompressor is None or not self._decompressor.eof
+        if self.compressed_size and self._encoding in ("deflate", "gzip") and incomplete:
+            raise MonzoGeneralError("Incomplete response from Monzo API")
+        if self._decompressor is None:
+            return b""
+        tail = self._decompressor.flush()
+        self.size += len(tail)
+        return tail
+
+    def finish(self) -> bytes:
+        """
+        Complete the body.
+
+        Returns:
+            Decompressed body
+
+        Raises:
+            zlib.error: If the body is not valid for its Content-Encoding
+            MonzoGeneralError: If a compressed body ends part way through
+        """
+        self._chunks.append(self.flush())
+        return b"".join(self._chunks)
+
+
+class Validated:
+    """Class holding the validators and decoded body of a GET response."""
+
+    __slots__ = ["data", "etag", "last_modified", "status"]
+
+    def __init__(self, etag: str | None, last_modified: str | None, data: Any, status: int = 200):
+        """
+        Initialize Validated.
+
+        Args:
+            etag: ETag header of the response
+            last_modified: Last-Modified header of the response
+            data: Decoded body of the response
+            status: Status code of the response
+        """
+        self.data: Any = data
+        self.etag: str | None = etag
+        self.last_modified: str | None = last_modified
+        self.status: int = status
+
+    @property
+    def request_headers(self) -> dict[str, str]:
+        """
+        Property for the headers making a request conditional on the response having changed.
+
+        Returns:
+            Dictionary of If-None-Match and If-Modified-Since headers
+        """
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """
+    Class holding validators of GET responses so later requests can be made conditional.
+
+    Responses carrying an ETag or Last-Modified header are held with their decoded body, keyed on the request target
+    and Authorization header, so a 304 Not Modified response is served without transferring or decoding the body
+    again. Only the most recently used max_entries responses are held. A response served from the cache carries the
+    status code of the original response and its own copy of the body, as with ResponseCache.
+    """
+
+    __slots__ = ["_entries", "_lock", "_max_entries"]
+
+    def __init__(self, max_entries: int = DEFAULT_CONDITIONAL_ENTRIES):
+        """
+        Initialize ConditionalCache.
+
+        Args:
+            max_entries: Maximum number of responses held
+        """
+        self._entries: OrderedDict[CONDITIONAL_KEY_TYPE, Validated] = OrderedDict()
+        self._lock: Lock = Lock()
+        self._max_entries: int = max_entries
+
+    def __len__(self) -> int:
+        """
+        Number of responses held.
+
+        Returns:
+            Number of responses
+        """
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove every response."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, target: str, headers: dict[str, Any]) -> Validated | None:
+        """
+        Fetch the validated response for a request.
+
+        Args:
+            target: Path and query string for the request
+            headers: Headers for the request
+
+        Returns:
+            Validated response or None if none is held
+        """
+        key = (target, headers.get("Authorization", ""))
+        with self._lock:
+            validated = self._entries.get(key)
+            if validated:
+                self._entries.move_to_end(key)
+            return validated
+
+    def put(self, target: str, headers: dict[str, Any], response_headers: Any, data: Any, status: int = 200) -> None:
+        """
+        Hold a response if it carries a validator.
+
+        Args:
+            target: Path and query string for the request
+            headers: Headers for the request
+            response_headers: Headers of the response
+            data: Decoded body of the response
+            status: Status code of the response
+        """
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        key = (target, headers.get("Authorization", ""))
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = Validated(etag=etag, last_modified=last_modified, data=data, status=status)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
 class HttpIO:
     """
     Class to facilitate http requests.
@@ -43,15 +445,78 @@ class HttpIO:
     directly, instead the authentication make_request method should be used
     """
 
-    def __init__(self, url: str):
+    __slots__ = ["_base_path", "_codec", "_conditional_cache", "_key", "_pool", "_retry_policy", "_url"]
+
+    def __init__(
+        self,
+        url: str,
+        pool: ConnectionPool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        codec: JsonCodec | None = None,
+    ):
         """
         Initialize HttpIO.
 
         Args:
             url: Base URL for requests
+            pool: Connection pool to share, a new pool is created if one is not provided
+            retry_policy: Policy for retrying rate limited and failed requests, by default requests are not retried
+            conditional_cache: Cache of response validators for conditional GET requests, by default GET requests are
+                not conditional
+            codec: JSON codec for response bodies, by default the fastest installed codec
         """
+        parsed = urlsplit(url)
+        scheme = parsed.scheme or "https"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        self._base_path: str = parsed.path.rstrip("/")
+        self._codec: JsonCodec = codec or default_codec()
+        self._conditional_cache: ConditionalCache | None = conditional_cache
+        self._key: CONNECTION_KEY_TYPE = (scheme, parsed.hostname or "", port)
+        self._pool: ConnectionPool = pool or ConnectionPool()
+        self._retry_policy: RetryPolicy | None = retry_policy
         self._url = url
 
+    @property
+    def pool(self) -> ConnectionPool:
+        """
+        Property for the connection pool.
+
+        Returns:
+            Connection pool used for requests
+        """
+        return self._pool
+
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Property for the JSON codec.
+
+        Returns:
+            Codec used to decode response bodies
+        """
+        return self._codec
+
+    @property
+    def conditional_cache(self) -> ConditionalCache | None:
+        """
+        Property for the conditional request cache.
+
+        Returns:
+            Cache of response validators, None if GET requests are not conditional
+        """
+        return self._conditional_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """
+        Property for the retry policy.
+
+        Returns:
+            Policy used to retry failed requests, None if requests are not retried
+        """
+        return self._retry_policy
+
     def delete(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
         """
         Perform a DELETE request.
@@ -106,7 +571,7 @@ class HttpIO:
 
         Args:
             path: Path for the HTTP call
-            data: Data for the request to be passed as form data
+            data: Data for the request to be passed as form data, or an encoded body
             headers: Headers as a dictionary for the request
             timeout: Timeout in seconds for the request
 
@@ -118,7 +583,14 @@ class HttpIO:
         if data is None:
             data = {}
         parameters = urlencode(data).encode() if data else None
-        return self._perform_request(method="PATCH", path=path, data=parameters, headers=headers, timeout=timeout)
+        return self._perform_request(
+            method="PATCH",
+            path=path,
+            data=parameters,
+            headers=headers,
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
 
     def post(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
         """
@@ -138,7 +610,14 @@ class HttpIO:
         if data is None:
             data = {}
         parameters = urlencode(data).encode() if data else None
-        return self._perform_request(method="POST", path=path, data=parameters, headers=headers, timeout=timeout)
+        return self._perform_request(
+            method="POST",
+            path=path,
+            data=parameters,
+            headers=headers,
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
 
     def put(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> REQUEST_RESPONSE_TYPE:
         """
@@ -160,8 +639,77 @@ class HttpIO:
         if type(data) is dict:
             parameters = urlencode(data).encode() if data else None
         else:
-            parameters = data.encode("utf8")  # type: ignore
-        return self._perform_request(method="PUT", path=path, data=parameters, headers=headers, timeout=timeout)
+            parameters = data if isinstance(data, bytes) else data.encode("utf8")
+        return self._perform_request(
+            method="PUT",
+            path=path,
+            data=parameters,
+            headers=headers,
+            timeout=timeout,
+            dedupe=isinstance(data, dict) and "dedupe_id" in data,
+        )
+
+    def stream(self, path: str, data=None, headers=None, timeout: int = DEFAULT_TIMEOUT) -> Iterator[bytes]:
+        """
+        Perform a GET request, yielding the body as it arrives.
+
+        The request is sent when iteration starts. Error statuses are raised, and retried when the policy allows it,
+        before any of the body is yielded. The body is decompressed chunk by chunk and never held in full. Responses
+        bypass the conditional cache. A connection is only returned to the pool once its body has been read in full.
+
+        Args:
+            path: Path for the HTTP call
+            data: Data for the request to be passed as URL parameters
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+
+        Yields:
+            Decompressed chunks of the body
+
+        Raises:
+            MonzoGeneralError: On a network error or a body that cannot be decompressed
+        """
+        parameters = urlencode(data) if data else None
+        if parameters:
+            path += f"?{parameters}"
+        headers = {"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})}
+        target = f"{self._base_path}{path}"
+        attempt = 1
+        while True:
+            connection, response = self._open(
+                method="GET",
+                target=target,
+                data=None,
+                headers=headers,
+                timeout=timeout,
+                resend=True,
+            )
+            if response.status < 400:
+                break
+            try:
+                response.read()
+            except (HTTPException, OSError):
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+            else:
+                self._pool.release(key=self._key, connection=connection, reusable=not response.will_close)
+            sleep(self._retry_delay(method="GET", response=response, attempt=attempt, dedupe=False))
+            attempt += 1
+        complete = False
+        try:
+            decoder = BodyDecoder(content_encoding=response.headers.get("Content-Encoding"))
+            while chunk := response.read(READ_SIZE):
+                if decoded := decoder.decode(chunk=chunk):
+                    yield decoded
+            if tail := decoder.flush():
+                yield tail
+            complete = True
+        except zlib.error as error:
+            raise MonzoGeneralError("Unable to decompress response from Monzo API") from error
+        except (HTTPException, OSError) as error:
+            raise MonzoGeneralError("Network error communicating with Monzo API") from error
+        finally:
+            # A partly read connection is still carrying the rest of the body so cannot serve another request
+            self._pool.release(key=self._key, connection=connection, reusable=complete and not response.will_close)
 
     def _perform_request(
         self,
@@ -170,6 +718,7 @@ class HttpIO:
         data: bytes | None,
         headers: dict[str, Any],
         timeout,
+        dedupe: bool = False,
     ) -> REQUEST_RESPONSE_TYPE:
         """
         Perform a given request.
@@ -180,25 +729,171 @@ class HttpIO:
             data: Data for the request to be passed as form data
             headers: Headers as a dictionary for the request
             timeout: Timeout in seconds for the request
+            dedupe: True if the request carries a dedupe_id and may be retried when the policy allows it
 
         Returns:
-             Dictionary containing the response code, headers and content
+             Dictionary containing the response code, headers, content and metadata recording the content encoding
+             with the compressed and decompressed sizes of the body
+        """
+        if data is not None and "Content-Type" not in headers:
+            headers = {**headers, "Content-Type": "application/x-www-form-urlencoded"}
+        if "Accept-Encoding" not in headers:
+            headers = {**headers, "Accept-Encoding": ACCEPT_ENCODING}
+        target = f"{self._base_path}{path}"
+        conditional = self._conditional_cache if method == "GET" else None
+        validated = conditional.get(target=target, headers=headers) if conditional is not None else None
+        request_headers = {**headers, **validated.request_headers} if validated else headers
+        attempt = 1
+        while True:
+            response, content, metadata = self._send(
+                method=method,
+                target=target,
+                data=data,
+                headers=request_headers,
+                timeout=timeout,
+                resend=method in IDEMPOTENT_METHODS or dedupe,
+            )
+            if response.status < 400:
+                break
+            sleep(self._retry_delay(method=method, response=response, attempt=attempt, dedupe=dedupe))
+            attempt += 1
+        code = response.status
+        if validated and code == 304:
+            # Not modified, serve a copy of the body decoded for the earlier response
+            code = validated.status
+            decoded = deepcopy(validated.data)
+        else:
+            decoded = self._codec.loads(content) if len(content) > 0 else ""
+            if conditional is not None and code == 200:
+                conditional.put(
+                    target=target,
+                    headers=headers,
+                    response_headers=response.headers,
+                    data=deepcopy(decoded),
+                    status=code,
+                )
+        return {"code": code, "headers": response.headers, "data": decoded, "metadata": metadata}
+
+    def _retry_delay(self, method: str, response: HTTPResponse, attempt: int, dedupe: bool) -> float:
+        """
+        Decide how long to wait before retrying a failed request.
+
+        Args:
+            method: HTTP method of the request
+            response: Response with an error status
+            attempt: Number of attempts made so far
+            dedupe: True if the request carries a dedupe_id and may be retried when the policy allows it
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            MonzoError: The exception for the status when the request is not retried
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        policy = self._retry_policy
+        if not policy or not policy.should_retry(
+            method=method,
+            status=response.status,
+            attempt=attempt,
+            dedupe=dedupe,
+            retry_after=retry_after,
+        ):
+            raise error_for_status(code=response.status, retry_after=retry_after)
+        return policy.delay(attempt=attempt, retry_after=retry_after)
+
+    def _open(
+        self,
+        method: str,
+        target: str,
+        data: bytes | None,
+        headers: dict[str, Any],
+        timeout,
+        resend: bool,
+    ) -> tuple[HTTPConnection, HTTPResponse]:
+        """
+        Send a request over a pooled connection and read the response headers.
+
+        The caller must read the body and release the connection back to the pool.
+
+        Args:
+            method: HTTP method to use
+            target: Path and query string for the request
+            data: Body of the request
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+            resend: True if the request is safe to send again when a kept alive connection turns out to be closed
+
+        Returns:
+            Tuple of the connection and the response
+
+        Raises:
+            MonzoGeneralError: On a network error
+        """
+        for attempt in range(2):
+            connection, reused = self._pool.acquire(key=self._key, timeout=timeout)
+            try:
+                connection.request(method=method, url=target, body=data, headers=headers)
+                return connection, connection.getresponse()
+            except ConnectionError as error:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                if resend and reused and attempt == 0:
+                    # The server may have closed a kept alive connection, try once more on a fresh one. Other requests
+                    # may already have reached the server so are not sent twice.
+                    continue
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+            except (HTTPException, OSError) as error:
+                self._pool.release(key=self._key, connection=connection, reusable=False)
+                raise MonzoGeneralError("Network error communicating with Monzo API") from error
+        raise MonzoGeneralError("Network error communicating with Monzo API")
+
+    def _send(
+        self,
+        method: str,
+        target: str,
+        data: bytes | None,
+        headers: dict[str, Any],
+        timeout,
+        resend: bool,
+    ) -> tuple[HTTPResponse, bytes, dict[str, Any]]:
         """
-        full_url = f"{self._url}{path}"
+        Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method to use
+            target: Path and query string for the request
+            data: Body of the request
+            headers: Headers as a dictionary for the request
+            timeout: Timeout in seconds for the request
+            resend: True if the request is safe to send again when a kept alive connection turns out to be closed
+
+        Returns:
+            Tuple of the response, its decompressed body and metadata describing the body
+
+        Raises:
+            MonzoGeneralError: On a network error or a body that cannot be decompressed
+        """
+        connection, response = self._open(
+            method=method,
+            target=target,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            resend=resend,
+        )
         try:
-            request = Request(url=full_url, data=data, headers=headers)
-            request.method = method
-            content: str = ""
-            response = urlopen(request, timeout=timeout, context=_SSL_CONTEXT)
-            with response as fh:
-                content += fh.read().decode("utf-8")
-        except HTTPError as error:
-            exception_cls = MONZO_ERROR_MAP.get(error.code, MonzoGeneralError)
-            raise exception_cls() from error
-        except URLError as error:
+            decoder = BodyDecoder(content_encoding=response.headers.get("Content-Encoding"))
+            while chunk := response.read(READ_SIZE):
+                decoder.feed(chunk=chunk)
+            content = decoder.finish()
+        except zlib.error as error:
+            self._pool.release(key=self._key, connection=connection, reusable=False)
+            raise MonzoGeneralError("Unable to decompress response from Monzo API") from error
+        except MonzoGeneralError:
+            self._pool.release(key=self._key, connection=connection, reusable=False)
+            raise
+        except (HTTPException, OSError) as error:
+            self._pool.release(key=self._key, connection=connection, reusable=False)
             raise MonzoGeneralError("Network error communicating with Monzo API") from error
-        return {
-            "code": response.code,
-            "headers": response.headers,
-            "data": loads(content) if len(content) > 0 else "",
-        }
+        self._pool.release(key=self._key, connection=connection, reusable=not response.will_close)
+        return response, content, decoder.metadata
@@ -0,0 +1,99 @@
+"""Function to split a JSON array into its items as the document arrives."""
+
+import re
+from collections.abc import Iterable, Iterator
+
+from monzo.exceptions import MonzoGeneralError
+
+# Characters that change the nesting depth or start a string
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+
+# Characters that end a string or escape the next character
+_STRING_END = re.compile(rb'["\\]')
+
+_QUOTE = ord('"')
+
+_ARRAY_OPEN = ord("[")
+
+_OPENERS = frozenset(b"[{")
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[bytes]:
+    """
+    Split the array held under a key of a JSON object into its encoded items as the document arrives.
+
+    The document is scanned for structural characters only, the items are not decoded. Only the item being assembled
+    is held, so memory is bounded by the largest item rather than the document. Items must be objects or arrays, as
+    with the transactions endpoint.
+
+    Args:
+        chunks: JSON document in chunks of any size
+        key: Key of the top level object holding the array
+
+    Yields:
+        Each item of the array as encoded JSON
+
+    Raises:
+        MonzoGeneralError: If the document ends part way through
+    """
+    target = key.encode("utf-8")
+    buffer = bytearray()
+    pos = 0
+    depth = 0
+    array_depth = 0
+    item_start = -1
+    string_start = -1
+    last_string = b""
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if string_start >= 0:
+                match = _STRING_END.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if buffer[match.start()] != _QUOTE:
+                    if match.end() == len(buffer):
+                        # The escaped character is in the next chunk
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                if depth == 1:
+                    last_string = bytes(buffer[string_start : match.start()])
+                string_start = -1
+                pos = match.end()
+                continue
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = buffer[match.start()]
+            pos = match.end()
+            if char == _QUOTE:
+                string_start = pos
+            elif char in _OPENERS:
+                depth += 1
+                if not array_depth and depth == 2 and char == _ARRAY_OPEN and last_string == target:
+                    array_depth = depth
+                elif array_depth and depth == array_depth + 1:
+                    item_start = match.start()
+            else:
+                depth -= 1
+                if item_start >= 0 and depth == array_depth:
+                    yield bytes(buffer[item_start:pos])
+                    item_start = -1
+                elif array_depth and depth < array_depth:
+                    array_depth = 0
+                    last_string = b""
+        # Discard everything already scanned that no longer needs to be held
+        keep = item_start if item_start >= 0 else string_start if string_start >= 0 else pos
+        if keep:
+            del buffer[:keep]
+            pos -= keep
+            if item_start >= 0:
+                item_start -= keep
+            if string_start >= 0:
+                string_start -= keep
+    if depth or string_start >= 0:
+        raise MonzoGeneralError("Incomplete response from Monzo API")
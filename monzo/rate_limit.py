@@ -0,0 +1,256 @@
+"""Classes to pace requests made to the Monzo API."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+from threading import Lock
+from time import monotonic, sleep, time
+
+from monzo.exceptions import MonzoArgumentError, MonzoGeneralError, MonzoRateError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+_FILE_FORMAT = struct.Struct("dd")
+
+
+class TokenBucket:
+    """
+    Class implementing a token bucket shared between threads.
+
+    The bucket holds up to capacity tokens and refills at rate tokens per second, each request takes a token and waits
+    when none are available. Bursts of up to capacity requests are allowed after a quiet period.
+    """
+
+    __slots__ = ["_capacity", "_lock", "_rate", "_tokens", "_updated"]
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held, defaults to one second of tokens
+
+        Raises:
+            MonzoArgumentError: If the rate is not positive
+        """
+        if rate <= 0:
+            raise MonzoArgumentError("Rate must be greater than zero")
+        self._capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self._lock: Lock = Lock()
+        self._rate: float = rate
+        self._tokens: float = self._capacity
+        self._updated: float = monotonic()
+
+    def acquire(self, tokens: float = 1, timeout: float | None = None) -> bool:
+        """
+        Take tokens from the bucket, waiting for them to become available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, None to wait as long as needed
+
+        Returns:
+            True once the tokens have been taken, False if the timeout passed first
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            wait = self._take(tokens=tokens)
+            if not wait:
+                return True
+            if deadline is not None and monotonic() + wait > deadline:
+                return False
+            sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1, timeout: float | None = None) -> bool:
+        """
+        Take tokens from the bucket, waiting on the event loop for them to become available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, None to wait as long as needed
+
+        Returns:
+            True once the tokens have been taken, False if the timeout passed first
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            wait = self._take(tokens=tokens)
+            if not wait:
+                return True
+            if deadline is not None and monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        """
+        Calculate the tokens held after refilling since the last update.
+
+        Args:
+            tokens: Tokens held at the last update
+            updated: Time of the last update
+            now: Current time
+
+        Returns:
+            Tokens now held
+        """
+        return min(self._capacity, tokens + max(0.0, now - updated) * self._rate)
+
+    def _take(self, tokens: float) -> float:
+        """
+        Take tokens if they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds until they will be available
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = self._refill(tokens=self._tokens, updated=self._updated, now=now)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self._rate
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Class implementing a token bucket shared between processes.
+
+    The bucket state is kept in a small file locked with flock, so every process using the same file draws from the
+    same bucket. Only available on platforms providing fcntl.
+    """
+
+    __slots__ = ["_fd"]
+
+    def __init__(self, file: str, rate: float, capacity: float | None = None):
+        """
+        Initialize FileTokenBucket.
+
+        Args:
+            file: Path of the file holding the bucket state, created if it does not exist
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held, defaults to one second of tokens
+
+        Raises:
+            MonzoGeneralError: If file locking is not available on this platform
+        """
+        if fcntl is None:  # pragma: no cover
+            raise MonzoGeneralError("FileTokenBucket requires fcntl which is not available on this platform")
+        super().__init__(rate=rate, capacity=capacity)
+        self._fd: int = os.open(file, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def close(self) -> None:
+        """Close the state file."""
+        os.close(self._fd)
+
+    def _take(self, tokens: float) -> float:
+        """
+        Take tokens if they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds until they will be available
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                now = time()
+                state = os.pread(self._fd, _FILE_FORMAT.size, 0)
+                held, updated = _FILE_FORMAT.unpack(state) if len(state) == _FILE_FORMAT.size else (self._capacity, now)
+                held = self._refill(tokens=held, updated=updated, now=now)
+                wait = 0.0
+                if held >= tokens:
+                    held -= tokens
+                else:
+                    wait = (tokens - held) / self._rate
+                os.pwrite(self._fd, _FILE_FORMAT.pack(held, now), 0)
+                return wait
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """
+    Class to pace requests by endpoint.
+
+    Requests are matched to the bucket with the longest path prefix, for example "/transactions", falling back to a
+    default bucket. A limiter may be shared by many Authentication objects so that they draw from the same buckets.
+    """
+
+    __slots__ = ["_buckets", "_default", "_timeout"]
+
+    def __init__(
+        self,
+        default: TokenBucket | None = None,
+        buckets: dict[str, TokenBucket] | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            default: Bucket for paths without their own bucket, None to leave them unlimited
+            buckets: Dictionary of path prefix to bucket
+            timeout: Maximum seconds a request waits for a token, None to wait as long as needed
+        """
+        self._buckets: list[tuple[str, TokenBucket]] = sorted(
+            (buckets or {}).items(),
+            key=lambda bucket: len(bucket[0]),
+            reverse=True,
+        )
+        self._default: TokenBucket | None = default
+        self._timeout: float | None = timeout
+
+    def acquire(self, path: str) -> None:
+        """
+        Wait for a token for the given path.
+
+        Args:
+            path: Path of the request
+
+        Raises:
+            MonzoRateError: If no token became available within the timeout
+        """
+        bucket = self.bucket(path=path)
+        if bucket and not bucket.acquire(timeout=self._timeout):
+            raise MonzoRateError(f"Timed out waiting for the rate limit on {path}")
+
+    async def acquire_async(self, path: str) -> None:
+        """
+        Wait on the event loop for a token for the given path.
+
+        Args:
+            path: Path of the request
+
+        Raises:
+            MonzoRateError: If no token became available within the timeout
+        """
+        bucket = self.bucket(path=path)
+        if bucket and not await bucket.acquire_async(timeout=self._timeout):
+            raise MonzoRateError(f"Timed out waiting for the rate limit on {path}")
+
+    def bucket(self, path: str) -> TokenBucket | None:
+        """
+        Find the bucket for a path.
+
+        Args:
+            path: Path of the request
+
+        Returns:
+            Bucket with the longest matching prefix, otherwise the default bucket
+        """
+        for prefix, bucket in self._buckets:
+            if path.startswith(prefix):
+                return bucket
+        return self._default
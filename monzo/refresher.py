@@ -0,0 +1,348 @@
+"""Classes to refresh access tokens ahead of expiry."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from itertools import count
+from threading import Condition, Thread
+from time import time
+from typing import Self
+
+from monzo.async_authentication import AsyncAuthentication
+from monzo.authentication import Authentication
+from monzo.exceptions import MonzoArgumentError, MonzoError
+
+DEFAULT_MARGIN = 300
+
+DEFAULT_RETRY_INTERVAL = 30.0
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class _Schedule:
+    """
+    Class holding when each registered Authentication is next due a refresh.
+
+    Entries are kept in a heap ordered by due time, rescheduled entries are skipped when they reach the top. Removing an
+    Authentication drops its entries from the heap straight away so the schedule does not keep it alive.
+    """
+
+    __slots__ = ["_generations", "_heap", "_margin", "_sequence"]
+
+    def __init__(self, margin: int):
+        """
+        Initialize _Schedule.
+
+        Args:
+            margin: Seconds before expiry that a token is refreshed
+        """
+        self._generations: dict[Authentication, int] = {}
+        self._heap: list[tuple[float, int, Authentication]] = []
+        self._margin: int = margin
+        self._sequence = count()
+
+    @property
+    def margin(self) -> int:
+        """
+        Property for the refresh margin.
+
+        Returns:
+            Seconds before expiry that a token is refreshed
+        """
+        return self._margin
+
+    def add(self, auth: Authentication, due: float | None = None) -> None:
+        """
+        Register an Authentication or reschedule it.
+
+        Args:
+            auth: Authentication to refresh
+            due: Time the refresh is due, by default the margin before the token expires
+        """
+        if due is None:
+            due = auth.access_token_expiry - self._margin
+        sequence = next(self._sequence)
+        self._generations[auth] = sequence
+        heapq.heappush(self._heap, (due, sequence, auth))
+
+    def next_due(self) -> float | None:
+        """
+        Fetch when the next refresh is due.
+
+        Returns:
+            Time of the next refresh or None if nothing is registered
+        """
+        while self._heap and self._generations.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[Authentication]:
+        """
+        Remove and return every Authentication whose refresh is due.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Authentication objects to refresh, they remain registered and must be rescheduled
+        """
+        due: list[Authentication] = []
+        while (next_due := self.next_due()) is not None and next_due <= now:
+            _, sequence, auth = heapq.heappop(self._heap)
+            self._generations[auth] = -sequence - 1
+            due.append(auth)
+        return due
+
+    def remove(self, auth: Authentication) -> None:
+        """
+        Unregister an Authentication.
+
+        Args:
+            auth: Authentication to stop refreshing
+        """
+        if self._generations.pop(auth, None) is None:
+            return
+        self._heap = [entry for entry in self._heap if entry[2] is not auth]
+        heapq.heapify(self._heap)
+
+    def reschedule(self, auth: Authentication, refreshed: bool, retry_interval: float) -> None:
+        """
+        Schedule the next refresh after an attempt.
+
+        Args:
+            auth: Authentication that was refreshed
+            refreshed: True if the token was renewed or did not need renewing
+            retry_interval: Seconds to wait before retrying a failed refresh
+        """
+        if auth not in self._generations:
+            return
+        if refreshed and auth.access_token_expiry - self._margin > time():
+            self.add(auth=auth)
+        else:
+            self.add(auth=auth, due=time() + retry_interval)
+
+
+class TokenRefresher:
+    """
+    Class to refresh access tokens on a background thread.
+
+    Each registered Authentication is refreshed a margin before its token expires so requests do not wait on the token
+    endpoint. Refreshes use the same single-flight lock as make_request, which remains the fallback should a
+    background refresh fail.
+    """
+
+    __slots__ = ["_condition", "_retry_interval", "_running", "_schedule", "_thread"]
+
+    def __init__(self, margin: int = DEFAULT_MARGIN, retry_interval: float = DEFAULT_RETRY_INTERVAL):
+        """
+        Initialize TokenRefresher.
+
+        Args:
+            margin: Seconds before expiry that a token is refreshed
+            retry_interval: Seconds to wait before retrying a failed refresh
+        """
+        self._condition: Condition = Condition()
+        self._retry_interval: float = retry_interval
+        self._running: bool = False
+        self._schedule: _Schedule = _Schedule(margin=margin)
+        self._thread: Thread | None = None
+
+    def __enter__(self) -> Self:
+        """
+        Start refreshing on entering a with block.
+
+        Returns:
+            The refresher
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Stop refreshing on leaving a with block.
+
+        Args:
+            args: Exception details, unused
+        """
+        self.stop()
+
+    def add(self, auth: Authentication) -> None:
+        """
+        Register an Authentication to be refreshed.
+
+        Args:
+            auth: Authentication to refresh
+
+        Raises:
+            MonzoArgumentError: If given an AsyncAuthentication, which must be refreshed by AsyncTokenRefresher
+        """
+        if isinstance(auth, AsyncAuthentication):
+            raise MonzoArgumentError("AsyncAuthentication must be refreshed by AsyncTokenRefresher")
+        with self._condition:
+            self._schedule.add(auth=auth)
+            self._condition.notify()
+
+    def remove(self, auth: Authentication) -> None:
+        """
+        Stop refreshing an Authentication.
+
+        Args:
+            auth: Authentication to stop refreshing
+        """
+        with self._condition:
+            self._schedule.remove(auth=auth)
+
+    def start(self) -> None:
+        """Start the background thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = Thread(target=self._run, name="monzo-token-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for it to finish."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            thread = self._thread
+            self._thread = None
+        if thread:
+            thread.join()
+
+    def _run(self) -> None:
+        """Refresh tokens as they become due until stopped."""
+        while True:
+            with self._condition:
+                while self._running:
+                    next_due = self._schedule.next_due()
+                    if next_due is not None and next_due <= time():
+                        break
+                    self._condition.wait(timeout=None if next_due is None else next_due - time())
+                if not self._running:
+                    return
+                due = self._schedule.pop_due(now=time())
+            for auth in due:
+                refreshed = _refresh(auth=auth, margin=self._schedule.margin)
+                with self._condition:
+                    self._schedule.reschedule(auth=auth, refreshed=refreshed, retry_interval=self._retry_interval)
+
+
+class AsyncTokenRefresher:
+    """
+    Class to refresh access tokens in an asyncio task.
+
+    Behaves as TokenRefresher for AsyncAuthentication objects, the task runs on the event loop that starts it.
+    """
+
+    __slots__ = ["_retry_interval", "_schedule", "_task", "_wake"]
+
+    def __init__(self, margin: int = DEFAULT_MARGIN, retry_interval: float = DEFAULT_RETRY_INTERVAL):
+        """
+        Initialize AsyncTokenRefresher.
+
+        Args:
+            margin: Seconds before expiry that a token is refreshed
+            retry_interval: Seconds to wait before retrying a failed refresh
+        """
+        self._retry_interval: float = retry_interval
+        self._schedule: _Schedule = _Schedule(margin=margin)
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event = asyncio.Event()
+
+    def add(self, auth: AsyncAuthentication) -> None:
+        """
+        Register an AsyncAuthentication to be refreshed.
+
+        Args:
+            auth: AsyncAuthentication to refresh
+
+        Raises:
+            MonzoArgumentError: If given an Authentication, which must be refreshed by TokenRefresher
+        """
+        if not isinstance(auth, AsyncAuthentication):
+            raise MonzoArgumentError("Authentication must be refreshed by TokenRefresher")
+        self._schedule.add(auth=auth)
+        self._wake.set()
+
+    def remove(self, auth: AsyncAuthentication) -> None:
+        """
+        Stop refreshing an AsyncAuthentication.
+
+        Args:
+            auth: AsyncAuthentication to stop refreshing
+        """
+        self._schedule.remove(auth=auth)
+
+    def start(self) -> None:
+        """Start the refresh task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="monzo-token-refresher")
+
+    async def stop(self) -> None:
+        """Cancel the refresh task and wait for it to finish."""
+        task = self._task
+        self._task = None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        """Refresh tokens as they become due until cancelled."""
+        while True:
+            next_due = self._schedule.next_due()
+            if next_due is None or next_due > time():
+                self._wake.clear()
+                timeout = None if next_due is None else next_due - time()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+                continue
+            for auth in self._schedule.pop_due(now=time()):
+                refreshed = await _refresh_async(auth=auth, margin=self._schedule.margin)  # type: ignore[arg-type]
+                self._schedule.reschedule(auth=auth, refreshed=refreshed, retry_interval=self._retry_interval)
+
+
+def _refresh(auth: Authentication, margin: int) -> bool:
+    """
+    Refresh a token, logging rather than raising on failure.
+
+    Args:
+        auth: Authentication to refresh
+        margin: Seconds before expiry that a token is refreshed
+
+    Returns:
+        True if the token was renewed or did not need renewing
+    """
+    try:
+        auth.refresh_if_expiring(margin=margin)
+    except MonzoError:
+        logger.warning(msg="Background token refresh failed")
+        return False
+    return True
+
+
+async def _refresh_async(auth: AsyncAuthentication, margin: int) -> bool:
+    """
+    Refresh a token, logging rather than raising on failure.
+
+    Args:
+        auth: AsyncAuthentication to refresh
+        margin: Seconds before expiry that a token is refreshed
+
+    Returns:
+        True if the token was renewed or did not need renewing
+    """
+    try:
+        await auth.refresh_if_expiring(margin=margin)
+    except MonzoError:
+        logger.warning(msg="Background token refresh failed")
+        return False
+    return True
@@ -0,0 +1,194 @@
+"""Class to cache responses from read endpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any
+from urllib.parse import urlencode
+
+DEFAULT_MAX_ENTRIES = 1024
+
+DEFAULT_TTLS: dict[str, float] = {
+    "/accounts": 60.0,
+    "/balance": 5.0,
+    "/ping/whoami": 300.0,
+    "/pots": 30.0,
+    "/transactions/": 60.0,
+    "/webhooks": 300.0,
+}
+
+# Path prefixes of mutating requests and the cached path prefixes they make stale, the request path is always included
+RELATED_PATHS: dict[str, tuple[str, ...]] = {
+    "/attachment": ("/transactions/",),
+    "/pots/": ("/balance", "/pots"),
+    "/webhooks": ("/webhooks",),
+}
+
+CACHE_KEY_TYPE = tuple[str, str, str]
+
+
+class ResponseCache:
+    """
+    Class to cache responses from read endpoints.
+
+    Only GET requests for paths with a TTL are cached, the TTL for a path is taken from its longest matching prefix.
+    The cache holds at most max_entries responses, evicting the least recently used. Mutating requests made through an
+    Authentication using the cache invalidate the responses they make stale. Responses are keyed on the Authorization
+    header so a cache may be shared between users.
+    """
+
+    __slots__ = ["_entries", "_generation", "_lock", "_max_entries", "_ttls"]
+
+    def __init__(self, ttls: dict[str, float] | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            ttls: Dictionary of path prefix to seconds responses are cached for, by default DEFAULT_TTLS
+            max_entries: Maximum number of responses held
+        """
+        self._entries: OrderedDict[CACHE_KEY_TYPE, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._generation: int = 0
+        self._lock: Lock = Lock()
+        self._max_entries: int = max_entries
+        self._ttls: list[tuple[str, float]] = sorted(
+            (DEFAULT_TTLS if ttls is None else ttls).items(),
+            key=lambda ttl: len(ttl[0]),
+            reverse=True,
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of responses held, including any that have expired but not yet been evicted.
+
+        Returns:
+            Number of responses
+        """
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """
+        Property for the number of invalidations made.
+
+        Returns:
+            Invalidation counter, compared by put to discard responses fetched before an invalidation
+        """
+        return self._generation
+
+    def get(self, key: CACHE_KEY_TYPE) -> dict[str, Any] | None:
+        """
+        Fetch a cached response.
+
+        Args:
+            key: Key from the key method
+
+        Returns:
+            Copy of the response or None if it is not cached or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            response = entry[1]
+        return _copy_response(response=response)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Remove cached responses for paths starting with a prefix.
+
+        Args:
+            prefix: Path prefix, by default every response is removed
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[0].startswith(prefix)]:
+                del self._entries[key]
+
+    def invalidate_related(self, path: str) -> None:
+        """
+        Remove cached responses made stale by a mutating request.
+
+        Args:
+            path: Path of the mutating request
+        """
+        prefixes = {path}
+        for prefix, related in RELATED_PATHS.items():
+            if path.startswith(prefix):
+                prefixes.update(related)
+        for prefix in prefixes:
+            self.invalidate(prefix=prefix)
+
+    def key(self, path: str, data: dict[str, Any], authorization: str = "") -> CACHE_KEY_TYPE | None:
+        """
+        Build the cache key for a GET request.
+
+        Args:
+            path: Path of the request
+            data: URL parameters of the request
+            authorization: Authorization header of the request
+
+        Returns:
+            Cache key or None if responses for the path are not cached
+        """
+        if self.ttl(path=path) is None:
+            return None
+        return path, urlencode(sorted(data.items()), doseq=True), authorization
+
+    def put(self, key: CACHE_KEY_TYPE, response: dict[str, Any], generation: int) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Key from the key method
+            response: Response to cache
+            generation: Value of generation before the request was made, the response is discarded if an
+                invalidation has happened since
+        """
+        ttl = self.ttl(path=key[0])
+        if not ttl:
+            return
+        response = _copy_response(response=response)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def ttl(self, path: str) -> float | None:
+        """
+        Find the TTL for a path.
+
+        Args:
+            path: Path of the request
+
+        Returns:
+            Seconds responses for the path are cached for or None if they are not cached
+        """
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl
+        return None
+
+
+def _copy_response(response: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy a response so that callers cannot modify a cached response.
+
+    Args:
+        response: Response to copy
+
+    Returns:
+        Response with a copy of its data
+    """
+    return {**response, "data": deepcopy(response["data"])}
@@ -0,0 +1,133 @@
+"""Class to decide when and how long to wait before retrying a request."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+DEFAULT_BACKOFF = 0.5
+
+DEFAULT_MAX_DELAY = 30.0
+
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS"})
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(tz=UTC)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Class to decide when and how long to wait before retrying a request.
+
+    Requests that are rate limited or fail with a server error are retried with exponential backoff and full jitter,
+    waiting at least as long as the Retry-After header asks. Only idempotent methods are retried by default, requests
+    carrying a dedupe_id may also be retried when enabled as Monzo discards the duplicates.
+    """
+
+    __slots__ = ["_backoff", "_max_attempts", "_max_delay", "_methods", "_retry_dedupe", "_statuses"]
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+        statuses: frozenset[int] = RETRY_STATUSES,
+        retry_dedupe: bool = False,
+    ):
+        """
+        Initialize RetryPolicy.
+
+        Args:
+            max_attempts: Maximum number of attempts including the first
+            backoff: Upper bound in seconds of the wait before the first retry, doubled for each further retry
+            max_delay: Maximum seconds to wait between attempts, a longer Retry-After is not retried
+            methods: HTTP methods that may be retried
+            statuses: HTTP status codes that may be retried
+            retry_dedupe: True to also retry requests of other methods that carry a dedupe_id
+        """
+        self._backoff: float = backoff
+        self._max_attempts: int = max_attempts
+        self._max_delay: float = max_delay
+        self._methods: frozenset[str] = methods
+        self._retry_dedupe: bool = retry_dedupe
+        self._statuses: frozenset[int] = statuses
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        Property for the maximum number of attempts.
+
+        Returns:
+            Maximum number of attempts including the first
+        """
+        return self._max_attempts
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Calculate how long to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts already made, starting at 1
+            retry_after: Seconds the server asked to wait, if any
+
+        Returns:
+            Seconds to wait
+        """
+        delay = random.uniform(0, min(self._max_delay, self._backoff * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def should_retry(
+        self,
+        method: str,
+        status: int,
+        attempt: int,
+        dedupe: bool = False,
+        retry_after: float | None = None,
+    ) -> bool:
+        """
+        Decide whether a failed request should be retried.
+
+        Args:
+            method: HTTP method of the request
+            status: HTTP status code of the response
+            attempt: Number of attempts already made, starting at 1
+            dedupe: True if the request carries a dedupe_id
+            retry_after: Seconds the server asked to wait, if any
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self._max_attempts or status not in self._statuses:
+            return False
+        if retry_after is not None and retry_after > self._max_delay:
+            return False
+        return method.upper() in self._methods or (dedupe and self._retry_dedupe)
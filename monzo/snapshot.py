@@ -0,0 +1,142 @@
+"""Functions to fetch the accounts of a user with their balances and pots concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from monzo.async_authentication import AsyncAuthentication
+from monzo.authentication import Authentication
+from monzo.endpoints.account import Account
+from monzo.endpoints.balance import Balance
+from monzo.endpoints.pot import Pot
+from monzo.exceptions import MonzoArgumentError, MonzoHTTPError, MonzoPermissionsError
+
+DEFAULT_WORKERS = 8
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class AccountSnapshot:
+    """
+    Class holding an account with its balance and pots.
+
+    The balance is also held by the account, so reading account.balance does not make a further request.
+    """
+
+    __slots__ = ["account", "pots"]
+
+    def __init__(self, account: Account, pots: list[Pot] | None):
+        """
+        Initialize AccountSnapshot.
+
+        Args:
+            account: Account the snapshot is for
+            pots: Pots for the account, None if they could not be fetched
+        """
+        self.account: Account = account
+        self.pots: list[Pot] | None = pots
+
+    @property
+    def balance(self) -> Balance | None:
+        """
+        Property for the balance.
+
+        Returns:
+            Balance fetched with the snapshot, None if it could not be fetched
+        """
+        return self.account.balance
+
+
+def fetch_snapshot(
+    auth: Authentication,
+    account_type: str = "",
+    max_workers: int = DEFAULT_WORKERS,
+) -> list[AccountSnapshot]:
+    """
+    Fetch every account for a user with its balance and pots.
+
+    Once the accounts are fetched the balance and pots for every account are fetched concurrently, so the time taken
+    is close to that of the slowest request rather than the sum of them all. As with Account.fetch_balance, a balance
+    or list of pots the API refuses is left as None rather than failing the snapshot.
+
+    Args:
+        auth: Monzo authentication object
+        account_type: Optional type of account required, must be in ACCOUNT_TYPES
+        max_workers: Number of requests made concurrently
+
+    Returns:
+        List of snapshots in the order the accounts were returned
+
+    Raises:
+        MonzoArgumentError: On fewer than one worker
+    """
+    if max_workers < 1:
+        raise MonzoArgumentError("max_workers must be at least 1")
+    accounts = Account.fetch(auth=auth, account_type=account_type)
+    logger.info(msg=f"Fetching balances and pots for {len(accounts)} accounts")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        balances = [executor.submit(account.fetch_balance) for account in accounts]
+        pots = [executor.submit(_fetch_pots, auth=auth, account_id=account.account_id) for account in accounts]
+        for balance in balances:
+            balance.result()
+        return [
+            AccountSnapshot(account=account, pots=account_pots.result())
+            for account, account_pots in zip(accounts, pots, strict=True)
+        ]
+
+
+async def fetch_snapshot_async(auth: AsyncAuthentication, account_type: str = "") -> list[AccountSnapshot]:
+    """
+    Fetch every account for a user with its balance and pots using asyncio.
+
+    Behaves as fetch_snapshot with the balance and pots requests gathered on the event loop.
+
+    Args:
+        auth: Monzo asyncio authentication object
+        account_type: Optional type of account required, must be in ACCOUNT_TYPES
+
+    Returns:
+        List of snapshots in the order the accounts were returned
+    """
+    accounts = await Account.fetch_async(auth=auth, account_type=account_type)
+    logger.info(msg=f"Fetching balances and pots for {len(accounts)} accounts")
+    balances = asyncio.gather(*(account.fetch_balance_async() for account in accounts))
+    pots = asyncio.gather(*(_fetch_pots_async(auth=auth, account_id=account.account_id) for account in accounts))
+    _, account_pots = await asyncio.gather(balances, pots)
+    return [AccountSnapshot(account=account, pots=pots) for account, pots in zip(accounts, account_pots, strict=True)]
+
+
+def _fetch_pots(auth: Authentication, account_id: str) -> list[Pot] | None:
+    """
+    Fetch the pots for an account.
+
+    Args:
+        auth: Monzo authentication object
+        account_id: Account ID to fetch pots for
+
+    Returns:
+        List of pots, None if the API refused the request
+    """
+    try:
+        return Pot.fetch(auth=auth, account_id=account_id)
+    except (MonzoHTTPError, MonzoPermissionsError):
+        return None
+
+
+async def _fetch_pots_async(auth: AsyncAuthentication, account_id: str) -> list[Pot] | None:
+    """
+    Fetch the pots for an account using asyncio.
+
+    Args:
+        auth: Monzo asyncio authentication object
+        account_id: Account ID to fetch pots for
+
+    Returns:
+        List of pots, None if the API refused the request
+    """
+    try:
+        return await Pot.fetch_async(auth=auth, account_id=account_id)
+    except (MonzoHTTPError, MonzoPermissionsError):
+        return None
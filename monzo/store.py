@@ -0,0 +1,233 @@
+"""Class to keep a local copy of transactions in SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any
+
+from monzo.endpoints.transaction import Transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    account_id TEXT NOT NULL,
+    created TEXT NOT NULL,
+    updated TEXT,
+    settled TEXT,
+    amount INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    local_amount INTEGER,
+    local_currency TEXT,
+    category TEXT,
+    merchant TEXT,
+    description TEXT,
+    notes TEXT,
+    include_in_spending INTEGER NOT NULL,
+    amount_is_pending INTEGER NOT NULL,
+    decline_reason TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_account_id ON transactions (account_id);
+CREATE INDEX IF NOT EXISTS transactions_created ON transactions (created);
+CREATE INDEX IF NOT EXISTS transactions_category ON transactions (category);
+CREATE INDEX IF NOT EXISTS transactions_merchant ON transactions (merchant);
+"""
+
+COLUMNS = (
+    "id",
+    "account_id",
+    "created",
+    "updated",
+    "settled",
+    "amount",
+    "currency",
+    "local_amount",
+    "local_currency",
+    "category",
+    "merchant",
+    "description",
+    "notes",
+    "include_in_spending",
+    "amount_is_pending",
+    "decline_reason",
+)
+
+UPSERT = (
+    f"INSERT INTO transactions ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in COLUMNS[1:])}"
+)
+
+
+def _timestamp(date: datetime | None) -> str | None:
+    """
+    Convert a datetime into the sortable text stored in the database.
+
+    Timestamps are stored in UTC so they sort as text, a datetime without a timezone is assumed to be UTC as with
+    create_date.
+
+    Args:
+        date: Date and time to convert
+
+    Returns:
+        ISO 8601 timestamp in UTC or None
+    """
+    if not date:
+        return None
+    return (date.astimezone(UTC) if date.tzinfo else date.replace(tzinfo=UTC)).isoformat()
+
+
+class TransactionStore:
+    """
+    Class to store transactions locally.
+
+    Keeps transactions in an indexed SQLite database so that reporting queries can run locally instead of
+    fetching transactions from the API each time.
+    """
+
+    __slots__ = ["_connection", "_lock"]
+
+    def __init__(self, database: str):
+        """
+        Initialize TransactionStore.
+
+        Args:
+            database: Path to the SQLite database, ":memory:" may be used for a temporary store
+        """
+        self._connection: sqlite3.Connection = sqlite3.connect(database=database, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock: Lock = Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def fetch(
+        self,
+        account_id: str,
+        since: datetime | None = None,
+        before: datetime | None = None,
+        category: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch stored transactions for an account.
+
+        Args:
+            account_id: ID of the account to fetch transactions for
+            since: Only include transactions created at or after this time
+            before: Only include transactions created before this time
+            category: Only include transactions in this category
+
+        Returns:
+            List of transactions as dictionaries ordered by when they were created
+        """
+        query, parameters = self._filter(account_id=account_id, since=since, before=before)
+        if category:
+            query += " AND category = ?"
+            parameters.append(category)
+        with self._lock:
+            rows = self._connection.execute(f"SELECT * FROM transactions WHERE {query} ORDER BY created", parameters)
+            return [dict(row) for row in rows]
+
+    def spend_by_category(
+        self,
+        account_id: str,
+        since: datetime | None = None,
+        before: datetime | None = None,
+    ) -> dict[str, int]:
+        """
+        Total the spending for an account grouped by category.
+
+        Only transactions included in spending that were not declined are counted.
+
+        Args:
+            account_id: ID of the account to total
+            since: Only include transactions created at or after this time
+            before: Only include transactions created before this time
+
+        Returns:
+            Dictionary of category to total amount in pence/cents
+        """
+        query, parameters = self._filter(account_id=account_id, since=since, before=before)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT category, SUM(amount) FROM transactions "
+                f"WHERE {query} AND include_in_spending = 1 AND decline_reason = '' GROUP BY category",
+                parameters,
+            )
+            return {category: total for category, total in rows}
+
+    def upsert(self, transactions: Iterable[Transaction]) -> int:
+        """
+        Insert or update transactions in a single database transaction.
+
+        Args:
+            transactions: Transactions to store
+
+        Returns:
+            Number of transactions written
+        """
+        rows = [self._row(transaction=transaction) for transaction in transactions]
+        with self._lock, self._connection:
+            self._connection.executemany(UPSERT, rows)
+        return len(rows)
+
+    @staticmethod
+    def _filter(account_id: str, since: datetime | None, before: datetime | None) -> tuple[str, list[Any]]:
+        """
+        Build the WHERE clause shared by the queries.
+
+        Args:
+            account_id: ID of the account to filter on
+            since: Only include transactions created at or after this time
+            before: Only include transactions created before this time
+
+        Returns:
+            Tuple of the WHERE clause and its parameters
+        """
+        query = "account_id = ?"
+        parameters: list[Any] = [account_id]
+        if since:
+            query += " AND created >= ?"
+            parameters.append(_timestamp(since))
+        if before:
+            query += " AND created < ?"
+            parameters.append(_timestamp(before))
+        return query, parameters
+
+    @staticmethod
+    def _row(transaction: Transaction) -> tuple[Any, ...]:
+        """
+        Convert a transaction into a database row.
+
+        Args:
+            transaction: Transaction to convert
+
+        Returns:
+            Tuple of values in COLUMNS order
+        """
+        merchant: Any = transaction.merchant
+        if isinstance(merchant, dict):
+            merchant = merchant.get("id")
+        return (
+            transaction.transaction_id,
+            transaction.account_id,
+            _timestamp(transaction.created),
+            _timestamp(transaction.updated),
+            _timestamp(transaction.settled),
+            transaction.amount,
+            transaction.currency,
+            transaction.local_amount,
+            transaction.local_currency,
+            transaction.category,
+            merchant,
+            transaction.description,
+            transaction.notes,
+            int(transaction.include_in_spending),
+            int(transaction.amount_is_pending),
+            transaction.decline_reason or "",
+        )
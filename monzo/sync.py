@@ -0,0 +1,88 @@
+"""Class to incrementally sync transactions."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+from monzo.authentication import Authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.handlers.sync_state import SyncState
+
+DEFAULT_LOOK_BACK = timedelta(days=3)
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class TransactionSync:
+    """
+    Class to incrementally sync transactions.
+
+    Remembers the newest transaction seen for each account through a SyncState handler, ordered by created timestamp
+    and then transaction ID. Subsequent runs only fetch transactions created after that point, less a look-back window
+    so that pending transactions which have since settled or changed are fetched again.
+    """
+
+    __slots__ = ["_auth", "_expand", "_initial_since", "_look_back", "_state"]
+
+    def __init__(
+        self,
+        auth: Authentication,
+        state: SyncState,
+        look_back: timedelta = DEFAULT_LOOK_BACK,
+        initial_since: datetime | None = None,
+        expand=None,
+    ):
+        """
+        Initialize TransactionSync.
+
+        Args:
+            auth: Monzo authentication object
+            state: Handler used to persist the high-water mark for each account
+            look_back: Period before the high-water mark that is fetched again on each run
+            initial_since: Start of the range for accounts without a high-water mark, by default Monzo decides
+            expand: List if fields to expand on
+        """
+        self._auth: Authentication = auth
+        self._expand = expand
+        self._initial_since: datetime | None = initial_since
+        self._look_back: timedelta = look_back
+        self._state: SyncState = state
+
+    def run(self, account_id: str) -> list[Transaction]:
+        """
+        Fetch transactions for an account that are new since the last run.
+
+        The high-water mark is only stored once every page has been fetched, a failed run is repeated in full.
+
+        Args:
+            account_id: ID of the account to sync
+
+        Returns:
+            List of transactions created after the high-water mark less the look-back window
+        """
+        mark = self._state.fetch(account_id=account_id)
+        since = self._initial_since
+        if mark:
+            since = datetime.fromisoformat(mark["created"]) - self._look_back
+        logger.info(msg=f"Syncing transactions for {account_id} since {since}")
+        transactions = list(
+            Transaction.iter_all(auth=self._auth, account_id=account_id, since=since, expand=self._expand)
+        )
+        newest = max(
+            transactions,
+            key=lambda transaction: (transaction.created, transaction.transaction_id),
+            default=None,
+        )
+        # Transactions created in the same instant are ordered by ID so the mark moves on to the later one
+        if newest and (
+            not mark
+            or (newest.created, newest.transaction_id)
+            > (datetime.fromisoformat(mark["created"]), mark.get("transaction_id", ""))
+        ):
+            self._state.store(
+                account_id=account_id,
+                created=newest.created.isoformat(),
+                transaction_id=newest.transaction_id,
+            )
+        return transactions
@@ -0,0 +1,712 @@
+"""Class to hold transactions in a columnar layout."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from monzo.authentication import Authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.helpers import create_date
+
+EPOCH = datetime(year=1970, month=1, day=1, tzinfo=UTC)
+
+NOT_SETTLED = 0
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch(date: datetime) -> int:
+    """
+    Convert a datetime into microseconds since the epoch.
+
+    Args:
+        date: Date and time to convert
+
+    Returns:
+        Microseconds since the epoch
+    """
+    return (date - EPOCH) // _MICROSECOND
+
+
+def _from_epoch(value: int) -> datetime:
+    """
+    Convert microseconds since the epoch into a datetime.
+
+    Args:
+        value: Microseconds since the epoch
+
+    Returns:
+        Date and time in UTC
+    """
+    return EPOCH + timedelta(microseconds=value)
+
+
+class CodedColumn(Sequence[str]):
+    """
+    Class holding a column of strings with few distinct values.
+
+    Each distinct value is stored once and every row holds a 4 byte code into the table of values.
+    """
+
+    __slots__ = ["_codes", "_lookup", "_values"]
+
+    def __init__(self):
+        """Initialize CodedColumn."""
+        self._codes: array[int] = array("I")
+        self._lookup: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def __getitem__(self, index):
+        """
+        Fetch the value of a row.
+
+        Args:
+            index: Index of the row
+
+        Returns:
+            Value of the row
+        """
+        return self._values[self._codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the value of each row.
+
+        Returns:
+            Iterator over the values in row order
+        """
+        return map(self._values.__getitem__, self._codes)
+
+    def __len__(self) -> int:
+        """
+        Number of rows held.
+
+        Returns:
+            Number of rows
+        """
+        return len(self._codes)
+
+    @property
+    def codes(self) -> array[int]:
+        """
+        Property for the code of each row.
+
+        Returns:
+            Array of indexes into values
+        """
+        return self._codes
+
+    @property
+    def values(self) -> list[str]:
+        """
+        Property for the distinct values.
+
+        Returns:
+            List of distinct values in the order they were first appended
+        """
+        return self._values
+
+    def append(self, value: str) -> None:
+        """
+        Append a row.
+
+        Args:
+            value: Value of the row
+        """
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self._values)
+            self._values.append(value)
+        self._codes.append(code)
+
+    def code(self, value: str) -> int | None:
+        """
+        Fetch the code of a value.
+
+        Args:
+            value: Value to look up
+
+        Returns:
+            Code of the value, None if no row holds it
+        """
+        return self._lookup.get(value)
+
+
+class PackedColumn(Sequence[str]):
+    """
+    Class holding a column of mostly unique strings.
+
+    Values are packed end to end as UTF-8 in a single buffer with the offset of each row, so no string object is
+    held per row.
+    """
+
+    __slots__ = ["_data", "_offsets"]
+
+    def __init__(self):
+        """Initialize PackedColumn."""
+        self._data: bytearray = bytearray()
+        self._offsets: array[int] = array("Q", [0])
+
+    def __getitem__(self, index):
+        """
+        Fetch the value of a row.
+
+        Args:
+            index: Index of the row
+
+        Returns:
+            Value of the row
+        """
+        if index < 0:
+            index += len(self)
+        return self._data[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        """
+        Number of rows held.
+
+        Returns:
+            Number of rows
+        """
+        return len(self._offsets) - 1
+
+    def append(self, value: str) -> None:
+        """
+        Append a row.
+
+        Args:
+            value: Value of the row
+        """
+        self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+
+
+class TransactionRow:
+    """
+    Class providing a read only view of a single row in a TransactionBatch.
+
+    Properties share their names with Transaction for the fields held by the batch.
+    """
+
+    __slots__ = ["_batch", "_index"]
+
+    def __init__(self, batch: TransactionBatch, index: int):
+        """
+        Initialize TransactionRow.
+
+        Args:
+            batch: Batch the row belongs to
+            index: Index of the row within the batch
+        """
+        self._batch: TransactionBatch = batch
+        self._index: int = index
+
+    @property
+    def account_id(self) -> str:
+        """
+        Property for the account ID the transaction is associated with.
+
+        Returns:
+            Account ID
+        """
+        return self._batch._account_ids[self._index]
+
+    @property
+    def amount(self) -> int:
+        """
+        Property for the transaction amount.
+
+        Returns:
+            Transaction amount in pence/cents
+        """
+        return self._batch._amounts[self._index]
+
+    @property
+    def amount_is_pending(self) -> bool:
+        """
+        Property to identify if the amount is pending.
+
+        Returns:
+            True if a transaction is pending
+        """
+        return bool(self._batch._amount_is_pending[self._index])
+
+    @property
+    def category(self) -> str:
+        """
+        Property to identify the category a transaction is a member of.
+
+        Returns:
+            Category a transaction is a member of
+        """
+        return self._batch._categories[self._index]
+
+    @property
+    def created(self) -> datetime:
+        """
+        Property timestamp a transaction was created.
+
+        Returns:
+            Transaction time creation timestamp
+        """
+        return _from_epoch(self._batch._created[self._index])
+
+    @property
+    def currency(self) -> str:
+        """
+        Property to identify transaction currency.
+
+        Returns:
+            Currency a transaction is in
+        """
+        return self._batch._currencies[self._index]
+
+    @property
+    def decline_reason(self) -> str:
+        """
+        Property for the reason a transaction was declined.
+
+        Returns:
+            Decline reason for a transaction or an empty string
+        """
+        return self._batch._decline_reasons[self._index]
+
+    @property
+    def description(self) -> str:
+        """
+        Property for transaction description.
+
+        Returns:
+            Transaction description
+        """
+        return self._batch._descriptions[self._index]
+
+    @property
+    def include_in_spending(self) -> bool:
+        """
+        Property for to identify if a transaction should be included in spending.
+
+        Returns:
+            True if a transaction should be included in spending otherwise False
+        """
+        return bool(self._batch._include_in_spending[self._index])
+
+    @property
+    def local_amount(self) -> int:
+        """
+        Property for the local value of a transaction.
+
+        Returns:
+            Local value of a transaction in pence/cents
+        """
+        return self._batch._local_amounts[self._index]
+
+    @property
+    def local_currency(self) -> str:
+        """
+        Property for the local currency of a transaction.
+
+        Returns:
+            Local currency of a transaction
+        """
+        return self._batch._local_currencies[self._index]
+
+    @property
+    def merchant(self) -> str:
+        """
+        Property for the merchant ID of a transaction.
+
+        Returns:
+            Merchant ID or an empty string
+        """
+        return self._batch._merchants[self._index]
+
+    @property
+    def notes(self) -> str:
+        """
+        Property for notes associated with a transaction.
+
+        Returns:
+            Transaction notes
+        """
+        return self._batch._notes[self._index]
+
+    @property
+    def settled(self) -> datetime | None:
+        """
+        Property for when a transaction was settled.
+
+        Returns:
+            datetime of when the transaction was settled, if None transaction is not settled yet
+        """
+        settled = self._batch._settled[self._index]
+        return None if settled == NOT_SETTLED else _from_epoch(settled)
+
+    @property
+    def transaction_id(self) -> str:
+        """
+        Property for the transaction ID.
+
+        Returns:
+            ID for the transaction
+        """
+        return self._batch._ids[self._index]
+
+    @property
+    def updated(self) -> datetime:
+        """
+        Property for when a transaction was updated.
+
+        Returns:
+            datetime of when the transaction was last updated
+        """
+        return _from_epoch(self._batch._updated[self._index])
+
+    @property
+    def user_id(self) -> str:
+        """
+        Property for the user ID.
+
+        Returns:
+            User ID for the transaction
+        """
+        return self._batch._user_ids[self._index]
+
+    def to_transaction(self) -> Transaction:
+        """
+        Create a Transaction from the row.
+
+        Fields not held by the batch are set to empty values.
+
+        Returns:
+            Lazily decoded Transaction
+        """
+        settled = self.settled
+        merchant = self.merchant
+        transaction_data: dict[str, Any] = {
+            "account_id": self.account_id,
+            "amount": self.amount,
+            "amount_is_pending": self.amount_is_pending,
+            "atm_fees_detailed": None,
+            "attachments": None,
+            "can_add_to_tab": False,
+            "can_be_excluded_from_breakdown": False,
+            "can_be_made_subscription": False,
+            "can_match_transactions_in_categorization": False,
+            "can_split_the_bill": False,
+            "categories": {},
+            "category": self.category,
+            "counterparty": {},
+            "created": self.created.isoformat(),
+            "currency": self.currency,
+            "dedupe_id": "",
+            "decline_reason": self.decline_reason,
+            "description": self.description,
+            "fees": {},
+            "id": self.transaction_id,
+            "include_in_spending": self.include_in_spending,
+            "international": None,
+            "is_load": False,
+            "labels": None,
+            "local_amount": self.local_amount,
+            "local_currency": self.local_currency,
+            "merchant": merchant or None,
+            "metadata": {},
+            "notes": self.notes,
+            "originator": False,
+            "scheme": "",
+            "settled": settled.isoformat() if settled else "",
+            "updated": self.updated.isoformat(),
+            "user_id": self.user_id,
+        }
+        return Transaction(auth=self._batch._auth, transaction_data=transaction_data, lazy=True)
+
+
+class TransactionBatch:
+    """
+    Class to hold many transactions column by column.
+
+    Amounts, flags and timestamps (as microseconds since the epoch) are held in typed arrays. Strings with few distinct
+    values such as categories, currencies and merchant IDs are held as codes into a table of values, and IDs,
+    descriptions and notes are packed into a single buffer each, so a large history uses a fraction of the memory of a
+    list of Transaction objects. Rows can be viewed with indexing or iteration and converted back to Transaction.
+    """
+
+    __slots__ = [
+        "_account_ids",
+        "_amount_is_pending",
+        "_amounts",
+        "_auth",
+        "_categories",
+        "_created",
+        "_currencies",
+        "_decline_reasons",
+        "_descriptions",
+        "_ids",
+        "_include_in_spending",
+        "_local_amounts",
+        "_local_currencies",
+        "_merchants",
+        "_notes",
+        "_settled",
+        "_updated",
+        "_user_ids",
+    ]
+
+    def __init__(self, auth: Authentication):
+        """
+        Initialize TransactionBatch.
+
+        Args:
+            auth: Monzo authentication object used when converting rows back to Transaction
+        """
+        self._auth: Authentication = auth
+        self._account_ids: CodedColumn = CodedColumn()
+        self._amount_is_pending: array[int] = array("b")
+        self._amounts: array[int] = array("q")
+        self._categories: CodedColumn = CodedColumn()
+        self._created: array[int] = array("q")
+        self._currencies: CodedColumn = CodedColumn()
+        self._decline_reasons: CodedColumn = CodedColumn()
+        self._descriptions: PackedColumn = PackedColumn()
+        self._ids: PackedColumn = PackedColumn()
+        self._include_in_spending: array[int] = array("b")
+        self._local_amounts: array[int] = array("q")
+        self._local_currencies: CodedColumn = CodedColumn()
+        self._merchants: CodedColumn = CodedColumn()
+        self._notes: PackedColumn = PackedColumn()
+        self._settled: array[int] = array("q")
+        self._updated: array[int] = array("q")
+        self._user_ids: CodedColumn = CodedColumn()
+
+    def __getitem__(self, index: int) -> TransactionRow:
+        """
+        Fetch a view of a single row.
+
+        Args:
+            index: Index of the row, negative indexes count from the end
+
+        Returns:
+            View of the row
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TransactionBatch index out of range")
+        return TransactionRow(batch=self, index=index)
+
+    def __iter__(self) -> Iterator[TransactionRow]:
+        """
+        Iterate over views of each row.
+
+        Yields:
+            View of each row in order
+        """
+        for index in range(len(self)):
+            yield TransactionRow(batch=self, index=index)
+
+    def __len__(self) -> int:
+        """
+        Number of transactions held.
+
+        Returns:
+            Number of rows
+        """
+        return len(self._amounts)
+
+    @property
+    def amount_is_pending(self) -> array[int]:
+        """
+        Property for the pending flag column.
+
+        Returns:
+            Array of 1 for pending transactions, otherwise 0
+        """
+        return self._amount_is_pending
+
+    @property
+    def amounts(self) -> array[int]:
+        """
+        Property for the amount column.
+
+        Returns:
+            Array of amounts in pence/cents
+        """
+        return self._amounts
+
+    @property
+    def categories(self) -> CodedColumn:
+        """
+        Property for the category column.
+
+        Returns:
+            Column of categories
+        """
+        return self._categories
+
+    @property
+    def created(self) -> array[int]:
+        """
+        Property for the created column.
+
+        Returns:
+            Array of created timestamps as microseconds since the epoch
+        """
+        return self._created
+
+    @property
+    def currencies(self) -> CodedColumn:
+        """
+        Property for the currency column.
+
+        Returns:
+            Column of currencies
+        """
+        return self._currencies
+
+    @property
+    def decline_reasons(self) -> CodedColumn:
+        """
+        Property for the decline reason column.
+
+        Returns:
+            Column of decline reasons, empty strings for transactions that were not declined
+        """
+        return self._decline_reasons
+
+    @property
+    def include_in_spending(self) -> array[int]:
+        """
+        Property for the include in spending column.
+
+        Returns:
+            Array of 1 for transactions included in spending, otherwise 0
+        """
+        return self._include_in_spending
+
+    @property
+    def local_amounts(self) -> array[int]:
+        """
+        Property for the local amount column.
+
+        Returns:
+            Array of local amounts in pence/cents
+        """
+        return self._local_amounts
+
+    @property
+    def local_currencies(self) -> CodedColumn:
+        """
+        Property for the local currency column.
+
+        Returns:
+            Column of local currencies
+        """
+        return self._local_currencies
+
+    @property
+    def merchants(self) -> CodedColumn:
+        """
+        Property for the merchant ID column.
+
+        Returns:
+            Column of merchant IDs, empty strings for transactions without a merchant
+        """
+        return self._merchants
+
+    def append(self, transaction_data: dict[str, Any]) -> None:
+        """
+        Append a transaction as returned by the API.
+
+        Args:
+            transaction_data: Data for a single transaction returned from an API call
+        """
+        merchant = transaction_data["merchant"]
+        if isinstance(merchant, dict):
+            merchant = merchant.get("id")
+        settled = transaction_data["settled"]
+        self._ids.append(transaction_data["id"])
+        self._account_ids.append(transaction_data["account_id"])
+        self._amounts.append(transaction_data["amount"])
+        self._amount_is_pending.append(bool(transaction_data["amount_is_pending"]))
+        self._categories.append(transaction_data["category"] or "")
+        self._created.append(_to_epoch(create_date(transaction_data["created"])))
+        self._currencies.append(transaction_data["currency"])
+        self._decline_reasons.append(transaction_data.get("decline_reason", ""))
+        self._descriptions.append(transaction_data["description"])
+        self._include_in_spending.append(bool(transaction_data["include_in_spending"]))
+        self._local_amounts.append(transaction_data["local_amount"])
+        self._local_currencies.append(transaction_data["local_currency"])
+        self._merchants.append(merchant or "")
+        self._notes.append(transaction_data["notes"] or "")
+        self._settled.append(_to_epoch(create_date(settled)) if settled else NOT_SETTLED)
+        self._updated.append(_to_epoch(create_date(transaction_data["updated"])))
+        self._user_ids.append(transaction_data["user_id"])
+
+    def extend(self, transactions_data: Iterable[dict[str, Any]]) -> None:
+        """
+        Append many transactions as returned by the API.
+
+        Args:
+            transactions_data: Data for each transaction returned from an API call
+        """
+        for transaction_data in transactions_data:
+            self.append(transaction_data=transaction_data)
+
+    def transactions(self) -> Iterator[Transaction]:
+        """
+        Iterate over the rows as Transaction objects.
+
+        Yields:
+            Lazily decoded Transaction for each row
+        """
+        for row in self:
+            yield row.to_transaction()
+
+    @classmethod
+    def fetch(
+        cls,
+        auth: Authentication,
+        account_id: str,
+        since: datetime | str | None = None,
+        before: datetime | None = None,
+        expand=None,
+        page_size: int = 100,
+    ) -> TransactionBatch:
+        """
+        Fetch every transaction in a time range into a batch.
+
+        Pages are requested as with Transaction.iter_all, each page is added to the batch without creating
+        Transaction objects.
+
+        Args:
+            auth: Monzo authentication object
+            account_id: ID of the account to fetch transactions for
+            since: Datetime object or transaction ID to identify when returned transactions should be made from
+            before: Datetime object to identify when returned transactions should be made before
+            expand: List if fields to expand on
+            page_size: Number of transactions to request per page, max 100, default 100.
+
+        Returns:
+            Batch of transactions
+
+        Raises:
+            MonzoArgumentError: If the page size is not between 1 and 100
+        """
+        batch = cls(auth=auth)
+        for page in Transaction._iter_pages(
+            auth=auth,
+            account_id=account_id,
+            since=since,
+            before=before,
+            expand=expand,
+            page_size=page_size,
+        ):
+            batch.extend(transactions_data=page)
+        return batch
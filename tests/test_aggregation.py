@@ -0,0 +1,104 @@
+"""Tests for spending aggregation."""
+
+from datetime import date
+
+import pytest
+
+from monzo import aggregation, authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.transaction_batch import TransactionBatch
+from tests.helpers import load_data
+
+
+class TestAggregation:
+    """Tests for spending aggregation."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    @pytest.mark.parametrize("use_batch", [True, False], ids=["batch", "transactions"])
+    def test_spend(self, mocker, use_numpy: bool, use_batch: bool):
+        """
+        Test totals exclude declined, excluded and pending transactions for batches and transactions alike.
+
+        Args:
+            mocker: Pytest mocker fixture
+            use_numpy: True to use NumPy if it is installed
+            use_batch: True to aggregate a TransactionBatch rather than a list of Transaction
+        """
+        if not use_numpy:
+            mocker.patch.object(aggregation, "numpy", None)
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        transactions_data = [
+            {**template, "id": "tx_1", "amount": -100, "created": "2022-08-01T10:00:00Z", "merchant": "merch_1"},
+            {**template, "id": "tx_2", "amount": -250, "category": "eating_out", "created": "2022-08-09T14:15:01Z"},
+            {**template, "id": "tx_3", "amount": -50, "local_amount": -60, "local_currency": "EUR"},
+            {**template, "id": "tx_4", "amount": -999, "decline_reason": "INSUFFICIENT_FUNDS"},
+            {**template, "id": "tx_5", "amount": -999, "include_in_spending": False},
+            {**template, "id": "tx_6", "amount": -7, "amount_is_pending": True, "created": "2022-09-02T10:00:00Z"},
+        ]
+        if use_batch:
+            transactions = TransactionBatch(auth=auth)
+            transactions.extend(transactions_data=transactions_data)
+        else:
+            transactions = [Transaction(auth=auth, transaction_data=data) for data in transactions_data]
+        category = template["category"]
+
+        assert aggregation.spend_by_category(transactions=transactions) == {category: -150, "eating_out": -250}
+        assert aggregation.spend_by_category(transactions=transactions, include_pending=True) == {
+            category: -157,
+            "eating_out": -250,
+        }
+        assert aggregation.spend_by_merchant(transactions=transactions)["merch_1"] == -100
+        assert aggregation.spend_by_currency(transactions=transactions) == {
+            "GBP": 2 * template["local_amount"],
+            "EUR": -60,
+        }
+        assert aggregation.spend_by_period(transactions=transactions, period="month", include_pending=True) == {
+            date(year=2022, month=8, day=1): -400,
+            date(year=2022, month=9, day=1): -7,
+        }
+        assert aggregation.spend_by_period(transactions=transactions, period="week") == {
+            date(year=2022, month=8, day=1): -100,
+            date(year=2022, month=8, day=8): -300,
+        }
+        with pytest.raises(ValueError):
+            aggregation.spend_by_period(transactions=transactions, period="year")
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    def test_spend_exact(self, mocker, use_numpy: bool):
+        """
+        Test batch totals beyond the precision of a float are exact.
+
+        Args:
+            mocker: Pytest mocker fixture
+            use_numpy: True to use NumPy if it is installed
+        """
+        if not use_numpy:
+            mocker.patch.object(aggregation, "numpy", None)
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        transactions = TransactionBatch(auth=auth)
+        transactions.extend(
+            transactions_data=[
+                {**template, "id": "tx_1", "amount": 2**53 + 1, "category": "transfers"},
+                {**template, "id": "tx_2", "amount": 2**53 + 1, "category": "transfers"},
+                {**template, "id": "tx_3", "amount": -1, "category": "groceries"},
+            ]
+        )
+
+        assert aggregation.spend_by_category(transactions=transactions) == {"transfers": 2**54 + 2, "groceries": -1}
+
+        declined = TransactionBatch(auth=auth)
+        declined.extend(transactions_data=[{**template, "decline_reason": "INSUFFICIENT_FUNDS"}])
+
+        assert aggregation.spend_by_category(transactions=declined) == {}
@@ -0,0 +1,226 @@
+"""Tests for the asyncio request stack."""
+
+import asyncio
+import gzip
+from unittest.mock import AsyncMock
+
+import pytest
+
+from monzo.async_authentication import AsyncAuthentication
+from monzo.async_httpio import AsyncHttpIO
+from monzo.endpoints.account import Account
+from monzo.endpoints.balance import Balance
+from monzo.endpoints.transaction import Transaction
+from monzo.endpoints.webhooks import Webhook
+from monzo.endpoints.whoami import WhoAmI
+from monzo.exceptions import MonzoAuthenticationError, MonzoGeneralError, MonzoPermissionsError
+from tests.helpers import Handler, load_data
+
+
+async def _serve(responses: list[bytes], connections: list[int]) -> asyncio.Server:
+    """
+    Start a local HTTP server returning canned responses.
+
+    Args:
+        responses: Raw responses returned in order, one per request
+        connections: List appended to each time a new connection is accepted
+
+    Returns:
+        Running server
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(1)
+        while responses:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                break
+            writer.write(responses.pop(0))
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, host="127.0.0.1", port=0)
+
+
+class TestAsync:
+    """Tests for the asyncio request stack."""
+
+    def test_async_httpio_reuses_connection(self):
+        """Test AsyncHttpIO parses length delimited and chunked responses over one kept alive connection."""
+        responses = [
+            b'HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n{"a": true}',
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\n{"b":\r\n5\r\n true\r\n1\r\n}\r\n0\r\n\r\n',
+        ]
+        connections: list[int] = []
+
+        async def run():
+            server = await _serve(responses=responses, connections=connections)
+            port = server.sockets[0].getsockname()[1]
+            http = AsyncHttpIO(url=f"http://127.0.0.1:{port}")
+            first = await http.get(path="/first")
+            second = await http.get(path="/second")
+            http.pool.close()
+            server.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first["data"] == {"a": True}
+        assert second["data"] == {"b": True}
+        assert len(connections) == 1
+
+    def test_async_httpio_post_not_resent_on_stale_connection(self):
+        """Test a POST without a dedupe_id is not sent again when its kept alive connection was closed."""
+        responses = [b'HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n{"a": true}']
+        connections: list[int] = []
+
+        async def run():
+            server = await _serve(responses=responses, connections=connections)
+            port = server.sockets[0].getsockname()[1]
+            http = AsyncHttpIO(url=f"http://127.0.0.1:{port}")
+            try:
+                await http.get(path="/first")
+                # Let the server close the kept alive connection
+                await asyncio.sleep(0.05)
+                await http.post(path="/webhooks", data={"url": "https://example.com"})
+            finally:
+                http.pool.close()
+                server.close()
+
+        with pytest.raises(expected_exception=MonzoGeneralError):
+            asyncio.run(run())
+        assert len(connections) == 1
+
+    def test_async_httpio_decompresses_gzip(self):
+        """Test AsyncHttpIO negotiates gzip and decompresses a chunked gzip body."""
+        body = b'{"transactions": [' + b", ".join([b'{"merchant": "merch_123"}'] * 200) + b"]}"
+        compressed = gzip.compress(body)
+        middle = len(compressed) // 2
+        chunks = b"".join(
+            f"{len(part):x}\r\n".encode() + part + b"\r\n" for part in (compressed[:middle], compressed[middle:])
+        )
+        responses = [
+            b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n\r\n" + chunks + b"0\r\n\r\n",
+        ]
+
+        async def run():
+            server = await _serve(responses=responses, connections=[])
+            port = server.sockets[0].getsockname()[1]
+            http = AsyncHttpIO(url=f"http://127.0.0.1:{port}")
+            try:
+                return await http.get(path="/transactions")
+            finally:
+                http.pool.close()
+                server.close()
+
+        response = asyncio.run(run())
+
+        assert len(response["data"]["transactions"]) == 200
+        assert response["metadata"] == {
+            "content_encoding": "gzip",
+            "compressed_size": len(compressed),
+            "size": len(body),
+        }
+
+    def test_async_httpio_status_code_raises_exception(self):
+        """Test AsyncHttpIO maps error status codes onto Monzo exceptions."""
+        responses = [b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n"]
+
+        async def run():
+            server = await _serve(responses=responses, connections=[])
+            port = server.sockets[0].getsockname()[1]
+            http = AsyncHttpIO(url=f"http://127.0.0.1:{port}")
+            try:
+                await http.get(path="/test")
+            finally:
+                http.pool.close()
+                server.close()
+
+        with pytest.raises(expected_exception=MonzoPermissionsError):
+            asyncio.run(run())
+
+    @pytest.mark.parametrize(
+        "endpoint,data_filename,response_filename,extra_data",
+        [
+            (Account, "Accounts", "Accounts", {}),
+            (Balance, "Balance", "Balance", {"account_id": "acc_123ABC"}),
+            (Transaction, "Transaction", "Transaction", {"account_id": "acc_123ABC"}),
+            (Webhook, "Webhooks", "WebhooksOne", {"account_id": "acc_123ABC"}),
+            (WhoAmI, "WhoAmI", "WhoAmI", {}),
+        ],
+    )
+    def test_fetch_async_payload(
+        self,
+        endpoint,
+        data_filename: str,
+        response_filename: str,
+        extra_data: dict[str, str],
+        mocker,
+    ):
+        """
+        Test the payload AsyncHttpIO would send.
+
+        Args:
+            endpoint: Endpoint object being tested
+            data_filename: Filename of the request data
+            response_filename: Filename of the response data
+            extra_data: Extra parameters for the fetch request
+            mocker: Pytest mocker fixture
+        """
+        httpio_capture = mocker.patch.object(
+            AsyncHttpIO,
+            "get",
+            new_callable=AsyncMock,
+            return_value=load_data(path="mock_responses", filename=response_filename),
+        )
+
+        credentials = Handler().fetch()
+
+        auth = AsyncAuthentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+
+        asyncio.run(endpoint.fetch_async(auth=auth, **extra_data))
+
+        expected_data = load_data(path="mock_payloads", filename=data_filename)
+
+        httpio_capture.assert_awaited_with(
+            data=expected_data["data"],
+            headers=expected_data["headers"],
+            path=expected_data["path"],
+            timeout=expected_data["timeout"],
+        )
+
+    def test_sync_request_with_async_authentication(self, mocker):
+        """
+        Test objects fetched asynchronously raise an error rather than return a coroutine when used synchronously.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        mocker.patch.object(
+            AsyncHttpIO,
+            "get",
+            new_callable=AsyncMock,
+            return_value=load_data(path="mock_responses", filename="Accounts"),
+        )
+        credentials = Handler().fetch()
+        auth = AsyncAuthentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+        accounts = asyncio.run(Account.fetch_async(auth=auth))
+
+        with pytest.raises(MonzoAuthenticationError):
+            accounts[0].fetch_balance()
+        with pytest.raises(MonzoAuthenticationError):
+            next(Transaction.iter_all(auth=auth, account_id="acc_123ABC"))
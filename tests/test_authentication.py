@@ -1,5 +1,8 @@
 """Tests for authentication."""
 
+from threading import Barrier, Thread
+from time import sleep, time
+
 import pytest
 
 from monzo import authentication
@@ -45,6 +48,43 @@ class TestEndPoints:
                 state_token=f"{state_token}invalid",
             )
 
+    def test_state_token_cached_per_flow(self, tmp_path, mocker):
+        """
+        Test the state token is held in memory and separate flows use separate tokens.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+            mocker: Pytest mocker fixture.
+        """
+        mocker.patch("monzo.authentication.gettempdir", return_value=str(tmp_path))
+        first = authentication.Authentication(client_id="client_id", client_secret="secret", redirect_url="")
+        second = authentication.Authentication(
+            client_id="client_id",
+            client_secret="secret",
+            redirect_url="",
+            flow_id="flow-2",
+        )
+        state_token = first.state_token
+        (tmp_path / "monzo").unlink()
+
+        assert first.state_token == state_token
+        assert second.state_token != state_token
+        assert (tmp_path / "monzo_flow-2").read_text() == second.state_token
+        assert (
+            authentication.Authentication(
+                client_id="client_id",
+                client_secret="secret",
+                redirect_url="",
+                flow_id="flow-2",
+            ).state_token
+            == second.state_token
+        )
+        assert [path.name for path in tmp_path.iterdir()] == ["monzo_flow-2"]
+        with pytest.raises(MonzoArgumentError):
+            authentication.Authentication(
+                client_id="client_id", client_secret="secret", redirect_url="", flow_id="../x"
+            )
+
     def test_logout(self, mocker):
         """
         Test the logout functionality.
@@ -111,8 +151,6 @@ class TestEndPoints:
 
     def test_is_authenticated_with_expired_token(self):
         """Test is_authenticated returns False when the token has expired."""
-        from time import time
-
         auth = authentication.Authentication(
             client_id="client_id",
             client_secret="client_secret",
@@ -135,8 +173,6 @@ class TestEndPoints:
 
     def test_is_authenticated_with_valid_token(self):
         """Test is_authenticated returns True when a token exists and has not expired."""
-        from time import time
-
         auth = authentication.Authentication(
             client_id="client_id",
             client_secret="client_secret",
@@ -146,3 +182,87 @@ class TestEndPoints:
         )
 
         assert auth.is_authenticated is True
+
+    def test_concurrent_refresh_single_flight(self, mocker):
+        """
+        Test concurrent requests with an expiring token make a single refresh request.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+
+        def refresh(**kwargs):
+            sleep(0.05)
+            return {"code": 200, "headers": {}, "data": {"access_token": "new", "expires_in": 3600}}
+
+        refresh_capture = mocker.patch.object(authentication.HttpIO, "post", side_effect=refresh)
+        mocker.patch.object(authentication.HttpIO, "get", return_value={"code": 200, "headers": {}, "data": {}})
+        handler = mocker.MagicMock()
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="old",
+            access_token_expiry=int(time()),
+            refresh_token="refresh_token",
+        )
+        auth.register_callback_handler(handler)
+        barrier = Barrier(parties=8)
+
+        def request():
+            barrier.wait()
+            auth.make_request(path="/ping/whoami")
+
+        threads = [Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert refresh_capture.call_count == 1
+        assert handler.store.call_count == 1
+        assert auth.access_token == "new"
+
+    def test_concurrent_refresh_failure_single_flight(self, mocker):
+        """
+        Test threads waiting on a failed refresh raise its error without sending the refresh token again.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+
+        def refresh(**kwargs):
+            sleep(0.2)
+            raise MonzoAuthenticationError("invalid_grant")
+
+        refresh_capture = mocker.patch.object(authentication.HttpIO, "post", side_effect=refresh)
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="old",
+            access_token_expiry=int(time()),
+            refresh_token="refresh_token",
+        )
+        barrier = Barrier(parties=8)
+        errors: list[Exception] = []
+
+        def refresh_if_expiring():
+            barrier.wait()
+            try:
+                auth.refresh_if_expiring()
+            except MonzoAuthenticationError as exc:
+                errors.append(exc)
+
+        threads = [Thread(target=refresh_if_expiring) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert refresh_capture.call_count == 1
+        assert len(errors) == 8
+
+        with pytest.raises(MonzoAuthenticationError):
+            auth.refresh_if_expiring()
+        assert refresh_capture.call_count == 2
@@ -0,0 +1,151 @@
+"""Tests for the multi-tenant authentication pool."""
+
+import gc
+from weakref import ref
+
+import pytest
+
+from monzo import authentication
+from monzo.authentication_pool import AuthenticationPool
+from monzo.exceptions import MonzoAuthenticationError
+from monzo.handlers.filesystem import FileSystem
+from monzo.refresher import TokenRefresher
+
+
+class TestAuthenticationPool:
+    """Tests for the multi-tenant authentication pool."""
+
+    def test_lazy_load_and_eviction(self, tmp_path, mocker):
+        """
+        Test tenants are loaded on first use, share one HttpIO and the least recently used is evicted.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+            mocker: Pytest mocker fixture
+        """
+        for user in ("alice", "bob", "carol"):
+            FileSystem(file=str(tmp_path / user)).store(
+                access_token=f"{user}_token",
+                client_id="client_id",
+                client_secret="client_secret",
+                expiry=2**40,
+                refresh_token="refresh_token",
+            )
+        factory = mocker.MagicMock(side_effect=lambda key: FileSystem(file=str(tmp_path / key)))
+        refresher = mocker.MagicMock(spec=TokenRefresher)
+        pool = AuthenticationPool(storage_factory=factory, max_tenants=2, refresher=refresher)
+
+        alice = pool.get(key="alice")
+        bob = pool.get(key="bob")
+
+        assert alice.access_token == "alice_token"
+        assert alice._http is bob._http
+        assert pool.get(key="alice") is alice
+        assert factory.call_count == 2
+
+        pool.get(key="carol")
+
+        assert "bob" not in pool
+        assert "alice" in pool
+        assert len(pool) == 2
+        refresher.remove.assert_called_once_with(auth=bob)
+        assert refresher.add.call_count == 3
+
+    def test_evicted_tenant_in_use_reused(self, tmp_path, mocker):
+        """
+        Test a tenant evicted while a caller still holds it is reused rather than loaded a second time.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+            mocker: Pytest mocker fixture
+        """
+        for user in ("alice", "bob"):
+            FileSystem(file=str(tmp_path / user)).store(
+                access_token=f"{user}_token",
+                client_id="client_id",
+                client_secret="client_secret",
+                expiry=2**40,
+                refresh_token="refresh_token",
+            )
+        factory = mocker.MagicMock(side_effect=lambda key: FileSystem(file=str(tmp_path / key)))
+        pool = AuthenticationPool(storage_factory=factory, max_tenants=1)
+
+        alice = pool.get(key="alice")
+        pool.get(key="bob")
+
+        assert "alice" not in pool
+        assert pool.get(key="alice") is alice
+        assert "alice" in pool
+        assert factory.call_count == 2
+
+        del alice
+        pool.evict(key="alice")
+        pool.get(key="alice")
+
+        assert factory.call_count == 3
+
+    def test_evicted_tenants_freed(self, tmp_path):
+        """
+        Test tenants evicted from a pool with a refresher are garbage collected once nothing else holds them.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        for user in range(50):
+            FileSystem(file=str(tmp_path / str(user))).store(
+                access_token=f"{user}_token",
+                client_id="client_id",
+                client_secret="client_secret",
+                expiry=2**40,
+                refresh_token="refresh_token",
+            )
+        pool = AuthenticationPool(
+            storage_factory=lambda key: FileSystem(file=str(tmp_path / key)),
+            max_tenants=5,
+            refresher=TokenRefresher(),
+        )
+
+        tenants = [ref(pool.get(key=str(user))) for user in range(50)]
+        gc.collect()
+
+        assert len(pool) == 5
+        assert sum(tenant() is not None for tenant in tenants) == 5
+
+    def test_missing_credentials(self, tmp_path):
+        """
+        Test a tenant without stored credentials raises an error.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        pool = AuthenticationPool(storage_factory=lambda key: FileSystem(file=str(tmp_path / key)))
+
+        with pytest.raises(MonzoAuthenticationError):
+            pool.get(key="nobody")
+
+    def test_refresh_stored_for_tenant(self, tmp_path, mocker):
+        """
+        Test a refreshed token is written back to the tenant's storage.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+            mocker: Pytest mocker fixture
+        """
+        mocker.patch.object(
+            authentication.HttpIO,
+            "post",
+            return_value={"code": 200, "headers": {}, "data": {"access_token": "new", "expires_in": 3600}},
+        )
+        storage = FileSystem(file=str(tmp_path / "alice"))
+        storage.store(
+            access_token="old",
+            client_id="client_id",
+            client_secret="client_secret",
+            expiry=1,
+            refresh_token="refresh_token",
+        )
+        pool = AuthenticationPool(storage_factory=lambda key: FileSystem(file=str(tmp_path / key)))
+
+        pool.get(key="alice").refresh_access()
+
+        assert storage.fetch()["access_token"] == "new"
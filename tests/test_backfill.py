@@ -0,0 +1,76 @@
+"""Tests for the transaction backfill."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from monzo import authentication
+from monzo.backfill import TransactionBackfill
+from monzo.exceptions import MonzoArgumentError
+from tests.helpers import Handler, load_data
+
+
+class TestTransactionBackfill:
+    """Tests for the transaction backfill."""
+
+    def test_windows(self):
+        """Test a range is split into consecutive windows with a shorter final window."""
+        backfill = TransactionBackfill(auth=None, window=timedelta(days=10))  # type: ignore[arg-type]
+        since = datetime(year=2022, month=1, day=1, tzinfo=UTC)
+
+        windows = backfill.windows(since=since, before=since + timedelta(days=25))
+
+        assert windows == [
+            (since, since + timedelta(days=10)),
+            (since + timedelta(days=10), since + timedelta(days=20)),
+            (since + timedelta(days=20), since + timedelta(days=25)),
+        ]
+
+    def test_windows_invalid_range(self):
+        """Test an empty range is rejected."""
+        backfill = TransactionBackfill(auth=None)  # type: ignore[arg-type]
+        since = datetime(year=2022, month=1, day=1, tzinfo=UTC)
+
+        with pytest.raises(expected_exception=MonzoArgumentError):
+            backfill.windows(since=since, before=since)
+
+    def test_run_merges_windows(self, mocker):
+        """
+        Test windows are fetched concurrently then merged, deduplicated and ordered by created.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        by_window = {
+            "2022-01-01T00:00:00Z": [
+                {**template, "id": "tx_2", "created": "2022-01-05T00:00:00Z"},
+                {**template, "id": "tx_1", "created": "2022-01-02T00:00:00Z"},
+            ],
+            "2022-01-11T00:00:00Z": [
+                {**template, "id": "tx_2", "created": "2022-01-05T00:00:00Z"},
+                {**template, "id": "tx_3", "created": "2022-01-12T00:00:00Z"},
+            ],
+        }
+
+        def get(path, data, headers, timeout):
+            return {"code": 200, "headers": {}, "data": {"transactions": by_window[data["since"]]}}
+
+        mocker.patch.object(authentication.HttpIO, "get", side_effect=get)
+
+        credentials = Handler().fetch()
+
+        auth = authentication.Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+        backfill = TransactionBackfill(auth=auth, window=timedelta(days=10), max_workers=2)
+        since = datetime(year=2022, month=1, day=1, tzinfo=UTC)
+
+        transactions = backfill.run(account_id="acc_123ABC", since=since, before=since + timedelta(days=20))
+
+        assert [transaction.transaction_id for transaction in transactions] == ["tx_1", "tx_2", "tx_3"]
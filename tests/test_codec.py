@@ -0,0 +1,79 @@
+"""Tests for the JSON codecs."""
+
+import pytest
+
+from monzo.authentication import Authentication
+from monzo.codec import OrjsonCodec, StdlibCodec, UjsonCodec, default_codec
+from monzo.exceptions import MonzoArgumentError
+from monzo.httpio import HttpIO
+
+
+def _codecs() -> list:
+    """
+    Build the codecs whose library is installed.
+
+    Returns:
+        List of codecs
+    """
+    codecs = [StdlibCodec()]
+    for codec_cls in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_cls())
+        except MonzoArgumentError:
+            pass
+    return codecs
+
+
+class _OtherCodec(StdlibCodec):
+    """Standard library codec under a different name."""
+
+    __slots__ = ()
+
+    name = "other"
+
+
+class TestCodec:
+    """Tests for the JSON codecs."""
+
+    @pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+    def test_round_trip(self, codec):
+        """
+        Test a codec decodes bytes and encodes to bytes.
+
+        Args:
+            codec: Codec being tested
+        """
+        data = {"description": "Café £1", "amount": -150, "items": [{"quantity": 1.5}], "settled": None}
+
+        encoded = codec.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == data
+        assert codec.loads('{"description": "Café £1"}'.encode()) == {"description": "Café £1"}
+
+    def test_default_codec_prefers_orjson(self):
+        """Test the default codec is orjson when it is installed."""
+        pytest.importorskip("orjson")
+
+        assert default_codec().name == "orjson"
+
+    def test_codec_selected_per_authentication(self):
+        """Test an Authentication uses the codec it is given for the HttpIO it creates."""
+        codec = StdlibCodec()
+
+        auth = Authentication(client_id="id", client_secret="secret", redirect_url="", codec=codec)
+
+        assert auth.codec is codec
+
+    def test_codec_must_match_shared_http(self):
+        """Test a codec that differs from the codec of a shared HttpIO is rejected."""
+        http = HttpIO(url="https://example.com", codec=StdlibCodec())
+
+        with pytest.raises(expected_exception=MonzoArgumentError):
+            Authentication(
+                client_id="id",
+                client_secret="secret",
+                redirect_url="",
+                http=http,
+                codec=_OtherCodec(),
+            )
@@ -1,11 +1,13 @@
 """Tests for endpoints."""
 
 from datetime import UTC, datetime
+from json import dumps
 from typing import Any
 
 import pytest
 
 from monzo import authentication
+from monzo.endpoints import transaction as transaction_module
 from monzo.endpoints.account import Account
 from monzo.endpoints.balance import Balance
 from monzo.endpoints.receipt import MERCHANT_TYPE, PAYMENT_TYPE, TAX_TYPE, Receipt
@@ -226,7 +228,7 @@ class TestEndPoints:
                 {"bills": -2775},
                 "bills",
                 {},
-                datetime(year=2022, month=8, day=9, hour=14, minute=15, second=1, tzinfo=UTC),
+                datetime(year=2022, month=8, day=9, hour=14, minute=15, second=1, microsecond=328000, tzinfo=UTC),
                 "GBP",
                 "123ABC",
                 "",
@@ -251,9 +253,9 @@ class TestEndPoints:
                 "",
                 False,
                 "mastercard",
-                datetime(year=2022, month=8, day=10, hour=0, minute=30, second=40, tzinfo=UTC),
+                datetime(year=2022, month=8, day=10, hour=0, minute=30, second=40, microsecond=295000, tzinfo=UTC),
                 "tx_123ABC1",
-                datetime(year=2022, month=8, day=10, hour=0, minute=30, second=40, tzinfo=UTC),
+                datetime(year=2022, month=8, day=10, hour=0, minute=30, second=40, microsecond=449000, tzinfo=UTC),
                 "user_ABC123",
             ),
         ],
@@ -562,3 +564,137 @@ class TestEndPoints:
         assert whoami.authenticated == expected_authenticated
         assert whoami.client_id == expected_client_id
         assert whoami.user_id == expected_user_id
+
+    def test_transaction_iter_all(self, mocker):
+        """
+        Test iter_all pages through transactions lazily using the last transaction ID as the cursor.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        transaction_data = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        pages = [
+            [{**transaction_data, "id": "tx_1"}, {**transaction_data, "id": "tx_2"}],
+            [{**transaction_data, "id": "tx_3"}],
+        ]
+        httpio_capture = mocker.patch.object(
+            authentication.HttpIO,
+            "get",
+            side_effect=[{"code": 200, "headers": {}, "data": {"transactions": page}} for page in pages],
+        )
+
+        credentials = Handler().fetch()
+
+        auth = authentication.Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+
+        transactions = Transaction.iter_all(auth=auth, account_id="acc_123ABC", page_size=2)
+
+        assert next(transactions).transaction_id == "tx_1"
+        assert httpio_capture.call_count == 1
+        assert [transaction.transaction_id for transaction in transactions] == ["tx_2", "tx_3"]
+        assert httpio_capture.call_count == 2
+        assert httpio_capture.call_args.kwargs["data"] == {"account_id": "acc_123ABC", "since": "tx_2", "limit": 2}
+
+    @pytest.mark.parametrize("page_size", [0, -1, 101])
+    @pytest.mark.parametrize("stream", [False, True], ids=["pages", "stream"])
+    def test_transaction_iter_all_page_size_invalid(self, mocker, page_size: int, stream: bool):
+        """
+        Test iter_all rejects a page size outside 1 to 100 before making a request.
+
+        Args:
+            mocker: Pytest mocker fixture
+            page_size: Invalid number of transactions per page
+            stream: True to stream each page
+        """
+        get = mocker.patch.object(authentication.HttpIO, "get")
+        stream_capture = mocker.patch.object(authentication.HttpIO, "stream")
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+
+        with pytest.raises(MonzoArgumentError):
+            next(Transaction.iter_all(auth=auth, account_id="acc_123ABC", page_size=page_size, stream=stream))
+
+        get.assert_not_called()
+        stream_capture.assert_not_called()
+
+    def test_transaction_stream(self, mocker):
+        """
+        Test stream yields each transaction before the rest of the page has arrived and iter_all pages on the stream.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        transaction_data = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        pages = [
+            [{**transaction_data, "id": "tx_1"}, {**transaction_data, "id": "tx_2"}],
+            [{**transaction_data, "id": "tx_3"}],
+        ]
+        bodies = iter([dumps({"transactions": page}).encode() for page in pages])
+        received: list[bytes] = []
+
+        def stream(**kwargs):
+            body = next(bodies)
+            for start in range(0, len(body), 64):
+                received.append(body[start : start + 64])
+                yield received[-1]
+
+        httpio_capture = mocker.patch.object(authentication.HttpIO, "stream", side_effect=stream)
+
+        credentials = Handler().fetch()
+
+        auth = authentication.Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+
+        transactions = Transaction.iter_all(auth=auth, account_id="acc_123ABC", page_size=2, stream=True)
+
+        assert next(transactions).transaction_id == "tx_1"
+        assert 0 < sum(map(len, received)) < len(dumps({"transactions": pages[0]}))
+        assert [transaction.transaction_id for transaction in transactions] == ["tx_2", "tx_3"]
+        assert httpio_capture.call_count == 2
+        assert httpio_capture.call_args.kwargs["data"] == {"account_id": "acc_123ABC", "since": "tx_2", "limit": 2}
+        assert httpio_capture.call_args.kwargs["headers"]["Authorization"] == f"Bearer {credentials['access_token']}"
+
+    def test_lazy_transaction(self, mocker):
+        """
+        Test a lazy transaction decodes fields on first access and matches an eagerly decoded transaction.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+        transaction_data = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        eager = Transaction(auth=auth, transaction_data=transaction_data)
+        create_date_spy = mocker.spy(transaction_module, "create_date")
+
+        lazy = Transaction(auth=auth, transaction_data=transaction_data, lazy=True)
+
+        assert lazy.amount == eager.amount
+        assert create_date_spy.call_count == 0
+        assert lazy.created == eager.created
+        assert lazy.created == eager.created
+        assert create_date_spy.call_count == 1
+        for name in dir(Transaction):
+            if isinstance(getattr(Transaction, name), property):
+                assert getattr(lazy, name) == getattr(eager, name)
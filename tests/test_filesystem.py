@@ -0,0 +1,61 @@
+"""Tests for the file system credential storage."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from monzo.handlers.filesystem import FileSystem
+
+
+class TestFileSystem:
+    """Tests for the file system credential storage."""
+
+    def test_fetch_is_cached_until_the_file_changes(self, mocker, tmp_path):
+        """
+        Test the file is only parsed again once it has been replaced.
+
+        Args:
+            mocker: Pytest mocker fixture
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        path = tmp_path / "credentials.json"
+        assert FileSystem(file=str(path)).fetch() == {}
+
+        writer = FileSystem(file=str(path))
+        writer.store(access_token="first", client_id="id", client_secret="secret", expiry=1, refresh_token="refresh")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert os.listdir(tmp_path) == ["credentials.json"]
+
+        reader = FileSystem(file=str(path))
+        loads = mocker.patch("monzo.handlers.filesystem.loads", wraps=json.loads)
+        assert reader.fetch()["access_token"] == "first"
+        reader.fetch()["access_token"] = "mutated"
+        assert reader.fetch()["access_token"] == "first"
+        assert loads.call_count == 1
+
+        writer.store(access_token="second", client_id="id", client_secret="secret", expiry=2)
+        assert reader.fetch()["access_token"] == "second"
+        assert loads.call_count == 2
+
+        os.remove(path)
+        assert reader.fetch() == {}
+
+    def test_failed_store_leaves_original(self, mocker, tmp_path):
+        """
+        Test a failed write removes the temporary file and leaves the stored credentials intact.
+
+        Args:
+            mocker: Pytest mocker fixture
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        path = tmp_path / "credentials.json"
+        storage = FileSystem(file=str(path))
+        storage.store(access_token="first", client_id="id", client_secret="secret", expiry=1)
+
+        mocker.patch("monzo.handlers.filesystem.os.replace", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            storage.store(access_token="second", client_id="id", client_secret="secret", expiry=2)
+        assert os.listdir(tmp_path) == ["credentials.json"]
+        assert FileSystem(file=str(path)).fetch()["access_token"] == "first"
@@ -0,0 +1,34 @@
+"""Tests for helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from monzo.helpers import create_date
+
+
+class TestHelpers:
+    """Tests for the helper functions."""
+
+    @pytest.mark.parametrize(
+        "date_str,expected_date",
+        [
+            ("2022-08-09T14:15:01Z", datetime(2022, 8, 9, 14, 15, 1, tzinfo=UTC)),
+            ("2022-08-09T14:15:01.328Z", datetime(2022, 8, 9, 14, 15, 1, 328000, tzinfo=UTC)),
+            ("2022-08-09T14:15:01.328123456Z", datetime(2022, 8, 9, 14, 15, 1, 328123, tzinfo=UTC)),
+            ("2022-08-09T15:15:01.5+01:00", datetime(2022, 8, 9, 14, 15, 1, 500000, tzinfo=UTC)),
+            ("2022-08-09T14:15:01", datetime(2022, 8, 9, 14, 15, 1, tzinfo=UTC)),
+        ],
+    )
+    def test_create_date(self, date_str: str, expected_date: datetime):
+        """
+        Test create_date parses the timestamp shapes Monzo sends into UTC datetimes.
+
+        Args:
+            date_str: Timestamp to parse
+            expected_date: Expected datetime
+        """
+        date = create_date(date_str)
+
+        assert date == expected_date
+        assert date.tzinfo is UTC
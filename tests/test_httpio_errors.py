@@ -1,6 +1,6 @@
-from email.message import Message
-from unittest.mock import patch
-from urllib.error import HTTPError, URLError
+import gzip
+import zlib
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -9,39 +9,381 @@ from monzo.exceptions import (
     MonzoGeneralError,
     MonzoHTTPError,
     MonzoPermissionsError,
+    MonzoRateError,
     MonzoServerError,
 )
-from monzo.httpio import HttpIO
+from monzo.httpio import ConditionalCache, ConnectionPool, HttpIO
+from monzo.retry import RetryPolicy
+
+
+def _mock_response(status: int = 200, body: bytes = b"", will_close: bool = False, headers=None) -> MagicMock:
+    """
+    Create a mock response.
+
+    Args:
+        status: HTTP status code for the response
+        body: Body of the response
+        will_close: True if the server requested the connection be closed
+        headers: Headers for the response
+
+    Returns:
+        Mock response
+    """
+    response = MagicMock(status=status, will_close=will_close, headers=headers or {})
+    response.read.side_effect = [body, b""]
+    return response
+
+
+def _mock_connection(status: int = 200, body: bytes = b"", will_close: bool = False) -> MagicMock:
+    """
+    Create a mock connection class returning a response with the given status.
+
+    Args:
+        status: HTTP status code for the response
+        body: Body of the response
+        will_close: True if the server requested the connection be closed
+
+    Returns:
+        Mock to patch in place of HTTPSConnection
+    """
+    connection_cls = MagicMock()
+    connection_cls.return_value.getresponse.side_effect = lambda: _mock_response(
+        status=status,
+        body=body,
+        will_close=will_close,
+    )
+    return connection_cls
 
 
 class TestHttpIO:
     """Test cases for the HttpIO class."""
 
     @pytest.mark.parametrize(
-        "url, path, code, expected_exception, message",
+        "url, path, code, expected_exception",
         [
-            ("https://example.com", "/test", 400, MonzoHTTPError, "Bad Request"),
-            ("https://example.com", "/test", 401, MonzoAuthenticationError, "Unauthorized"),
-            ("https://example.com", "/test", 403, MonzoPermissionsError, "Forbidden"),
-            ("https://example.com", "/test", 418, MonzoGeneralError, "teapot"),
-            ("https://example.com", "/test", 500, MonzoServerError, "Internal Server Error"),
+            ("https://example.com", "/test", 400, MonzoHTTPError),
+            ("https://example.com", "/test", 401, MonzoAuthenticationError),
+            ("https://example.com", "/test", 403, MonzoPermissionsError),
+            ("https://example.com", "/test", 418, MonzoGeneralError),
+            ("https://example.com", "/test", 500, MonzoServerError),
         ],
     )
-    def test_status_code_raises_exception(self, url, path, code, expected_exception, message):
+    def test_status_code_raises_exception(self, url, path, code, expected_exception):
         """Test that specific HTTP status codes raise the expected exceptions."""
         http = HttpIO(url=url)
-        error = HTTPError(url=f"{url}{path}", code=code, msg=message, hdrs=Message(), fp=None)
         with (
-            patch(target="monzo.httpio.urlopen", side_effect=error),
+            patch(target="monzo.httpio.HTTPSConnection", new=_mock_connection(status=code)),
             pytest.raises(expected_exception=expected_exception),
         ):
             http.get(path=path)
 
     def test_url_error_raises_monzogeneralerror(self):
-        """Test that a URLError raises a MonzoGeneralError."""
+        """Test that a network error raises a MonzoGeneralError."""
         http = HttpIO(url="https://example.com")
+        connection_cls = _mock_connection()
+        connection_cls.return_value.request.side_effect = ConnectionRefusedError("connection refused")
         with (
-            patch(target="monzo.httpio.urlopen", side_effect=URLError("connection refused")),
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
             pytest.raises(expected_exception=MonzoGeneralError),
         ):
             http.get(path="/test")
+
+    def test_connection_reused(self):
+        """Test that consecutive requests share a single kept alive connection."""
+        http = HttpIO(url="https://example.com")
+        connection_cls = _mock_connection(body=b'{"ok": true}')
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            first = http.get(path="/test")
+            second = http.get(path="/test")
+
+        assert first["data"] == second["data"] == {"ok": True}
+        assert connection_cls.call_count == 1
+        assert connection_cls.return_value.request.call_count == 2
+
+    def test_connection_not_reused_when_closed(self):
+        """Test that a connection the server asked to close is not returned to the pool."""
+        http = HttpIO(url="https://example.com")
+        connection_cls = _mock_connection(will_close=True)
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            http.get(path="/test")
+            http.get(path="/test")
+
+        assert connection_cls.call_count == 2
+
+    def test_stale_connection_retried(self):
+        """Test that a request on a dropped kept alive connection is retried on a new connection."""
+        stale = MagicMock()
+        stale.request.side_effect = ConnectionResetError("reset")
+        pool = ConnectionPool()
+        key = ("https", "example.com", 443)
+        pool.acquire(key=key, timeout=1)
+        pool.release(key=key, connection=stale, reusable=True)
+        http = HttpIO(url="https://example.com", pool=pool)
+        connection_cls = _mock_connection()
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            response = http.get(path="/test")
+
+        assert response["code"] == 200
+        stale.close.assert_called_once()
+
+    @pytest.mark.parametrize("data, resent", [({"url": "https://example.com"}, False), ({"dedupe_id": "abc"}, True)])
+    def test_stale_connection_post_only_resent_with_dedupe_id(self, data, resent):
+        """
+        Test a POST on a dropped kept alive connection is only sent again when it carries a dedupe_id.
+
+        Args:
+            data: Data for the request
+            resent: True if the request is expected to be sent again on a new connection
+        """
+        stale = MagicMock()
+        stale.getresponse.side_effect = ConnectionResetError("reset")
+        pool = ConnectionPool()
+        key = ("https", "example.com", 443)
+        pool.acquire(key=key, timeout=1)
+        pool.release(key=key, connection=stale, reusable=True)
+        http = HttpIO(url="https://example.com", pool=pool)
+        connection_cls = _mock_connection()
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            if resent:
+                http.post(path="/webhooks", data=data)
+            else:
+                with pytest.raises(expected_exception=MonzoGeneralError):
+                    http.post(path="/webhooks", data=data)
+
+        assert connection_cls.return_value.request.call_count == int(resent)
+
+    def test_idle_connection_evicted(self):
+        """Test that connections idle for longer than the idle timeout are closed rather than reused."""
+        pool = ConnectionPool(idle_timeout=-1)
+        key = ("https", "example.com", 443)
+        idle = MagicMock()
+        pool.acquire(key=key, timeout=1)
+        pool.release(key=key, connection=idle, reusable=True)
+        with patch(target="monzo.httpio.HTTPSConnection", new=_mock_connection()):
+            connection, reused = pool.acquire(key=key, timeout=1)
+
+        assert reused is False
+        assert connection is not idle
+        idle.close.assert_called_once()
+
+    def test_pool_bounded(self):
+        """Test that checking out more connections than the pool size times out."""
+        pool = ConnectionPool(max_size=1)
+        key = ("https", "example.com", 443)
+        with patch(target="monzo.httpio.HTTPSConnection", new=_mock_connection()):
+            pool.acquire(key=key, timeout=1)
+            with pytest.raises(expected_exception=MonzoGeneralError):
+                pool.acquire(key=key, timeout=0.01)
+
+    def test_rate_limited_get_retried_after_delay(self):
+        """Test that a rate limited GET is retried after waiting at least the Retry-After period."""
+        http = HttpIO(url="https://example.com", retry_policy=RetryPolicy(max_attempts=3))
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.side_effect = [
+            _mock_response(status=429, headers={"Retry-After": "2"}),
+            _mock_response(status=503),
+            _mock_response(body=b'{"ok": true}'),
+        ]
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            patch(target="monzo.httpio.sleep") as sleep,
+        ):
+            response = http.get(path="/test")
+
+        assert response["data"] == {"ok": True}
+        assert sleep.call_count == 2
+        assert sleep.call_args_list[0].args[0] >= 2
+
+    def test_retry_exhausted_raises_with_retry_after(self):
+        """Test that the error raised once attempts run out carries the Retry-After period."""
+        http = HttpIO(url="https://example.com", retry_policy=RetryPolicy(max_attempts=2))
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.side_effect = [
+            _mock_response(status=429, headers={"Retry-After": "1"}),
+            _mock_response(status=429, headers={"Retry-After": "5"}),
+        ]
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            patch(target="monzo.httpio.sleep"),
+            pytest.raises(expected_exception=MonzoRateError) as error,
+        ):
+            http.get(path="/test")
+
+        assert error.value.retry_after == 5
+
+    @pytest.mark.parametrize(
+        "data, retry_dedupe, attempts",
+        [
+            ({"amount": 1}, True, 1),
+            ({"amount": 1, "dedupe_id": "abc"}, False, 1),
+            ({"amount": 1, "dedupe_id": "abc"}, True, 2),
+        ],
+    )
+    def test_put_only_retried_with_dedupe_id(self, data, retry_dedupe, attempts):
+        """
+        Test that non idempotent requests are only retried when they carry a dedupe_id and retries are enabled.
+
+        Args:
+            data: Data for the request
+            retry_dedupe: True to allow requests carrying a dedupe_id to be retried
+            attempts: Expected number of requests made
+        """
+        http = HttpIO(url="https://example.com", retry_policy=RetryPolicy(retry_dedupe=retry_dedupe))
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.side_effect = [_mock_response(status=500), _mock_response()]
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            patch(target="monzo.httpio.sleep"),
+        ):
+            try:
+                http.put(path="/test", data=data)
+            except MonzoServerError:
+                pass
+
+        assert connection_cls.return_value.request.call_count == attempts
+
+    def test_conditional_get_serves_cached_body(self):
+        """Test validators are sent on later GET requests and a 304 serves a copy of the earlier body as a 200."""
+        http = HttpIO(url="https://example.com", conditional_cache=ConditionalCache())
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.side_effect = [
+            _mock_response(body=b'{"balance": 1}', headers={"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024"}),
+            _mock_response(status=304, headers={"ETag": '"v1"'}),
+            _mock_response(body=b'{"balance": 1}'),
+        ]
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            patch.object(target=type(http.codec), attribute="loads", return_value={"balance": 1}) as loads,
+        ):
+            first = http.get(path="/balance", headers={"Authorization": "Bearer a"})
+            first["data"]["balance"] = 2
+            second = http.get(path="/balance", headers={"Authorization": "Bearer a"})
+            http.get(path="/balance", headers={"Authorization": "Bearer b"})
+
+        request_headers = [call.kwargs["headers"] for call in connection_cls.return_value.request.call_args_list]
+        assert "If-None-Match" not in request_headers[0]
+        assert request_headers[1]["If-None-Match"] == '"v1"'
+        assert request_headers[1]["If-Modified-Since"] == "Tue, 01 Oct 2024"
+        assert "If-None-Match" not in request_headers[2]
+        assert second["code"] == 200
+        assert second["data"] == {"balance": 1}
+        assert loads.call_count == 2
+        assert len(http.conditional_cache) == 1
+
+    @pytest.mark.parametrize(
+        "encoding, compress",
+        [
+            ("gzip", gzip.compress),
+            ("deflate", zlib.compress),
+            ("deflate", lambda data: zlib.compress(data)[2:-4]),
+        ],
+    )
+    def test_compressed_body_decoded(self, encoding, compress):
+        """
+        Test compressed bodies are negotiated, decompressed chunk by chunk and their sizes reported.
+
+        The first chunk holds a single byte so the zlib wrapper is only identified once a second byte arrives.
+
+        Args:
+            encoding: Content-Encoding of the response
+            compress: Function compressing the body
+        """
+        body = b'{"transactions": [' + b", ".join([b'{"merchant": "merch_123"}'] * 200) + b"]}"
+        compressed = compress(body)
+        response = _mock_response(headers={"Content-Encoding": encoding})
+        response.read.side_effect = [compressed[:1], compressed[1:10], compressed[10:], b""]
+        http = HttpIO(url="https://example.com")
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.return_value = response
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            result = http.get(path="/transactions")
+
+        assert connection_cls.return_value.request.call_args.kwargs["headers"]["Accept-Encoding"] == "gzip, deflate"
+        assert len(result["data"]["transactions"]) == 200
+        assert result["metadata"] == {
+            "content_encoding": encoding,
+            "compressed_size": len(compressed),
+            "size": len(body),
+        }
+
+    def test_corrupt_body_raises_monzogeneralerror(self):
+        """Test a body that cannot be decompressed raises a MonzoGeneralError and discards the connection."""
+        http = HttpIO(url="https://example.com")
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.return_value = _mock_response(
+            body=b"not gzip data",
+            headers={"Content-Encoding": "gzip"},
+        )
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            pytest.raises(expected_exception=MonzoGeneralError),
+        ):
+            http.get(path="/test")
+
+        connection_cls.return_value.close.assert_called_once()
+
+    @pytest.mark.parametrize("encoding, compress", [("gzip", gzip.compress), ("deflate", zlib.compress)])
+    def test_truncated_body_raises_monzogeneralerror(self, encoding, compress):
+        """
+        Test a compressed body that ends part way through raises a MonzoGeneralError and discards the connection.
+
+        Args:
+            encoding: Content-Encoding of the response
+            compress: Function compressing the body
+        """
+        body = b'{"transactions": [' + b", ".join([b'{"merchant": "merch_123"}'] * 200) + b"]}"
+        http = HttpIO(url="https://example.com")
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.return_value = _mock_response(
+            body=compress(body)[:-10],
+            headers={"Content-Encoding": encoding},
+        )
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=connection_cls),
+            pytest.raises(expected_exception=MonzoGeneralError, match="Incomplete"),
+        ):
+            http.get(path="/transactions")
+
+        connection_cls.return_value.close.assert_called_once()
+
+    def test_stream_yields_body_as_it_arrives(self):
+        """Test a streamed body is decompressed chunk by chunk and the connection is only reused once fully read."""
+        body = b'{"transactions": [' + b", ".join([b'{"merchant": "merch_123"}'] * 200) + b"]}"
+        compressed = gzip.compress(body)
+        response = _mock_response(headers={"Content-Encoding": "gzip"})
+        response.read.side_effect = [compressed[:20], compressed[20:], b""]
+        http = HttpIO(url="https://example.com")
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.return_value = response
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            chunks = http.stream(path="/transactions", data={"account_id": "acc_123"})
+            first = next(chunks)
+            assert response.read.call_count <= 2
+            content = first + b"".join(chunks)
+
+        assert content == body
+        assert connection_cls.return_value.request.call_args.kwargs["url"] == "/transactions?account_id=acc_123"
+        connection_cls.return_value.close.assert_not_called()
+
+    def test_stream_abandoned_connection_discarded(self):
+        """Test a connection is closed rather than reused when a streamed body is not read in full."""
+        response = _mock_response()
+        response.read.side_effect = [b'{"transactions": [', b"{}]}", b""]
+        http = HttpIO(url="https://example.com")
+        connection_cls = MagicMock()
+        connection_cls.return_value.getresponse.return_value = response
+        with patch(target="monzo.httpio.HTTPSConnection", new=connection_cls):
+            chunks = http.stream(path="/transactions")
+            next(chunks)
+            chunks.close()
+
+        connection_cls.return_value.close.assert_called_once()
+
+    def test_stream_error_status_raises_before_body(self):
+        """Test an error status on a streamed request raises the mapped exception."""
+        http = HttpIO(url="https://example.com")
+        with (
+            patch(target="monzo.httpio.HTTPSConnection", new=_mock_connection(status=403)),
+            pytest.raises(expected_exception=MonzoPermissionsError),
+        ):
+            next(http.stream(path="/transactions"))
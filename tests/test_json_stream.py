@@ -0,0 +1,31 @@
+"""Tests for splitting streamed JSON arrays."""
+
+from json import dumps, loads
+
+import pytest
+
+from monzo.exceptions import MonzoGeneralError
+from monzo.json_stream import iter_array_items
+
+
+class TestJsonStream:
+    """Tests for splitting streamed JSON arrays."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 100_000])
+    def test_items_split_across_chunks(self, chunk_size: int):
+        """
+        Test items are split correctly whatever the chunk boundaries, including inside strings and escapes.
+
+        Args:
+            chunk_size: Size of the chunks the document arrives in
+        """
+        items = [{"id": f"tx_{index}", "notes": 'a "}]" \\ é', "merchant": {"tags": ["[", "{"]}} for index in range(5)]
+        document = dumps({"meta": {"transactions": [1]}, "transactions": items, "after": [{}]}).encode()
+        chunks = [document[start : start + chunk_size] for start in range(0, len(document), chunk_size)]
+
+        assert [loads(item) for item in iter_array_items(chunks=chunks, key="transactions")] == items
+
+    def test_truncated_document_raises(self):
+        """Test a document that ends part way through raises a MonzoGeneralError."""
+        with pytest.raises(expected_exception=MonzoGeneralError):
+            list(iter_array_items(chunks=[b'{"transactions": [{"id": "tx_1"}, {"id": "tx'], key="transactions"))
@@ -1,7 +1,5 @@
 """Tests for HttpIO."""
 
-from json import dumps
-
 import pytest
 
 from monzo import authentication
@@ -393,7 +391,7 @@ class TestHttpIO:
         expected_data = load_data(path="mock_payloads", filename=data_filename)
 
         httpio_capture.assert_called_with(
-            data=dumps(expected_data["data"]),
+            data=auth.codec.dumps(expected_data["data"]),
             headers=expected_data["headers"],
             path=expected_data["path"],
             timeout=expected_data["timeout"],
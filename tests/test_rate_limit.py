@@ -0,0 +1,65 @@
+"""Tests for client side rate limiting."""
+
+import pytest
+
+from monzo import authentication
+from monzo.exceptions import MonzoRateError
+from monzo.rate_limit import FileTokenBucket, RateLimiter, TokenBucket
+
+
+class TestRateLimit:
+    """Tests for client side rate limiting."""
+
+    def test_token_bucket(self):
+        """Test a bucket allows a burst of its capacity and then paces requests."""
+        bucket = TokenBucket(rate=100, capacity=2)
+
+        assert bucket.acquire(timeout=0)
+        assert bucket.acquire(timeout=0)
+        assert not bucket.acquire(timeout=0)
+        assert bucket.acquire(timeout=1)
+
+    def test_file_token_bucket_shared(self, tmp_path):
+        """
+        Test buckets using the same file draw from the same tokens.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        file = str(tmp_path / "bucket")
+        first = FileTokenBucket(file=file, rate=0.1, capacity=2)
+        second = FileTokenBucket(file=file, rate=0.1, capacity=2)
+
+        assert first.acquire(timeout=0)
+        assert second.acquire(timeout=0)
+        assert not first.acquire(timeout=0)
+        assert not second.acquire(timeout=0)
+        first.close()
+        second.close()
+
+    def test_make_request_paced_by_endpoint(self, mocker):
+        """
+        Test requests draw from the bucket with the longest matching prefix.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        mocker.patch.object(authentication.HttpIO, "get", return_value={"code": 200, "headers": {}, "data": {}})
+        limiter = RateLimiter(
+            default=TokenBucket(rate=1000),
+            buckets={"/transactions": TokenBucket(rate=0.1, capacity=1)},
+            timeout=0,
+        )
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+            access_token_expiry=2**40,
+            rate_limiter=limiter,
+        )
+
+        auth.make_request(path="/transactions/tx_1")
+        auth.make_request(path="/balance")
+        with pytest.raises(expected_exception=MonzoRateError):
+            auth.make_request(path="/transactions")
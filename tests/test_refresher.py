@@ -0,0 +1,93 @@
+"""Tests for background token refresh."""
+
+import asyncio
+from time import sleep, time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from monzo import authentication
+from monzo.async_authentication import AsyncAuthentication
+from monzo.async_httpio import AsyncHttpIO
+from monzo.exceptions import MonzoArgumentError
+from monzo.refresher import AsyncTokenRefresher, TokenRefresher
+
+TOKEN_RESPONSE = {"code": 200, "headers": {}, "data": {"access_token": "new", "expires_in": 3600}}
+
+
+class TestTokenRefresher:
+    """Tests for background token refresh."""
+
+    def test_refresh_before_expiry(self, mocker):
+        """
+        Test a token inside the margin is refreshed in the background and not again on the request path.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        refresh_capture = mocker.patch.object(authentication.HttpIO, "post", return_value=TOKEN_RESPONSE)
+        mocker.patch.object(authentication.HttpIO, "get", return_value={"code": 200, "headers": {}, "data": {}})
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="old",
+            access_token_expiry=int(time()) + 120,
+            refresh_token="refresh_token",
+        )
+
+        with TokenRefresher(margin=300) as refresher:
+            refresher.add(auth=auth)
+            deadline = time() + 2
+            while auth.access_token == "old" and time() < deadline:
+                sleep(0.01)
+
+        auth.make_request(path="/ping/whoami")
+
+        assert auth.access_token == "new"
+        assert refresh_capture.call_count == 1
+
+    def test_async_refresh_before_expiry(self, mocker):
+        """
+        Test the asyncio refresher renews a token inside the margin.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        refresh_capture = mocker.patch.object(AsyncHttpIO, "post", new_callable=AsyncMock, return_value=TOKEN_RESPONSE)
+
+        async def run() -> str:
+            auth = AsyncAuthentication(
+                client_id="client_id",
+                client_secret="client_secret",
+                redirect_url="",
+                access_token="old",
+                access_token_expiry=int(time()) + 120,
+                refresh_token="refresh_token",
+            )
+            refresher = AsyncTokenRefresher(margin=300)
+            refresher.start()
+            refresher.add(auth=auth)
+            for _ in range(100):
+                if auth.access_token != "old":
+                    break
+                await asyncio.sleep(0.01)
+            await refresher.stop()
+            return auth.access_token
+
+        assert asyncio.run(run()) == "new"
+        assert refresh_capture.await_count == 1
+
+    def test_wrong_refresher_rejected(self):
+        """Test each refresher rejects the authentication class the other one refreshes."""
+        arguments = {
+            "client_id": "client_id",
+            "client_secret": "client_secret",
+            "redirect_url": "",
+            "access_token": "access_token",
+        }
+
+        with pytest.raises(MonzoArgumentError):
+            TokenRefresher().add(auth=AsyncAuthentication(**arguments))
+        with pytest.raises(MonzoArgumentError):
+            AsyncTokenRefresher().add(auth=authentication.Authentication(**arguments))
@@ -0,0 +1,98 @@
+"""Tests for the response cache."""
+
+from monzo import authentication
+from monzo.endpoints.balance import Balance
+from monzo.response_cache import ResponseCache
+from tests.helpers import load_data
+
+
+def _auth(cache: ResponseCache, access_token: str = "access_token") -> authentication.Authentication:
+    """
+    Create an Authentication using a response cache.
+
+    Args:
+        cache: Response cache
+        access_token: Access token for the user
+
+    Returns:
+        Authentication with a long lived token
+    """
+    return authentication.Authentication(
+        client_id="client_id",
+        client_secret="client_secret",
+        redirect_url="",
+        access_token=access_token,
+        access_token_expiry=2**40,
+        response_cache=cache,
+    )
+
+
+class TestResponseCache:
+    """Tests for the response cache."""
+
+    def test_reads_cached_until_mutated(self, mocker):
+        """
+        Test repeated reads are served from the cache and a pot deposit invalidates the balance.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        get = mocker.patch.object(
+            authentication.HttpIO,
+            "get",
+            return_value=load_data(path="mock_responses", filename="Balance"),
+        )
+        put = mocker.patch.object(authentication.HttpIO, "put", return_value={"code": 200, "headers": {}, "data": {}})
+        cache = ResponseCache()
+        auth = _auth(cache=cache)
+
+        first = Balance.fetch(auth=auth, account_id="123ABC")
+        second = Balance.fetch(auth=auth, account_id="123ABC")
+        assert second.balance == first.balance
+        assert get.call_count == 1
+
+        Balance.fetch(auth=auth, account_id="456DEF")
+        Balance.fetch(auth=_auth(cache=cache, access_token="other"), account_id="123ABC")
+        assert get.call_count == 3
+
+        auth.make_request(path="/pots/pot_1/deposit", method="PUT", data={"amount": 1})
+        assert put.call_count == 1
+        Balance.fetch(auth=auth, account_id="123ABC")
+        assert get.call_count == 4
+
+        auth.make_request(path="/transactions", data={"account_id": "123ABC"})
+        auth.make_request(path="/transactions", data={"account_id": "123ABC"})
+        assert get.call_count == 6
+
+    def test_ttl_and_eviction(self, mocker):
+        """
+        Test responses expire after the TTL for their longest prefix and the least recently used are evicted.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        monotonic = mocker.patch("monzo.response_cache.monotonic", return_value=100.0)
+        cache = ResponseCache(ttls={"/pots": 30, "/pots/special": 5}, max_entries=2)
+        response = {"code": 200, "headers": {}, "data": {"pots": []}}
+
+        assert cache.key(path="/accounts", data={}) is None
+        first = cache.key(path="/pots", data={"current_account_id": "1"})
+        second = cache.key(path="/pots", data={"current_account_id": "2"})
+        special = cache.key(path="/pots/special", data={})
+        cache.put(key=first, response=response, generation=cache.generation)
+        cache.put(key=second, response=response, generation=cache.generation)
+        cache.get(key=first)["data"]["pots"].append("mutated")
+        assert cache.get(key=first) == response
+
+        cache.put(key=special, response=response, generation=cache.generation)
+        assert len(cache) == 2
+        assert cache.get(key=second) is None
+
+        monotonic.return_value = 110.0
+        assert cache.get(key=special) is None
+        assert cache.get(key=first) == response
+
+        stale = cache.generation
+        cache.invalidate(prefix="/pots")
+        cache.put(key=first, response=response, generation=stale)
+        assert len(cache) == 0
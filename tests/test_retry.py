@@ -0,0 +1,52 @@
+"""Tests for the retry policy."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from monzo.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy:
+    """Tests for the retry policy."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, None),
+            ("", None),
+            ("120", 120.0),
+            ("not a date", None),
+            (format_datetime(datetime(year=2000, month=1, day=1, tzinfo=UTC), usegmt=True), 0.0),
+        ],
+    )
+    def test_parse_retry_after(self, value, expected):
+        """
+        Test Retry-After headers in seconds and as HTTP dates are parsed.
+
+        Args:
+            value: Header value
+            expected: Expected number of seconds
+        """
+        assert parse_retry_after(value=value) == expected
+
+    def test_parse_retry_after_future_date(self):
+        """Test a Retry-After date in the future gives the seconds until that date."""
+        retry_at = datetime.now(tz=UTC) + timedelta(seconds=60)
+        seconds = parse_retry_after(value=format_datetime(retry_at, usegmt=True))
+
+        assert seconds is not None
+        assert 55 < seconds <= 60
+
+    def test_delay_and_should_retry(self):
+        """Test backoff is bounded by the policy and a Retry-After beyond the maximum delay is not retried."""
+        policy = RetryPolicy(max_attempts=4, backoff=1, max_delay=5)
+
+        assert all(0 <= policy.delay(attempt=attempt) <= min(5, 2 ** (attempt - 1)) for attempt in range(1, 6))
+        assert policy.delay(attempt=1, retry_after=3) >= 3
+        assert policy.should_retry(method="get", status=503, attempt=3)
+        assert not policy.should_retry(method="GET", status=503, attempt=4)
+        assert not policy.should_retry(method="GET", status=404, attempt=1)
+        assert not policy.should_retry(method="GET", status=429, attempt=1, retry_after=10)
+        assert not policy.should_retry(method="POST", status=429, attempt=1, dedupe=True)
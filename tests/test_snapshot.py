@@ -0,0 +1,130 @@
+"""Tests for fetching account snapshots."""
+
+import asyncio
+from threading import Barrier
+from time import time
+from unittest.mock import AsyncMock
+
+from monzo import authentication
+from monzo.async_authentication import AsyncAuthentication
+from monzo.async_httpio import AsyncHttpIO
+from monzo.exceptions import MonzoPermissionsError
+from monzo.snapshot import fetch_snapshot, fetch_snapshot_async
+from tests.helpers import load_data
+
+POT = {
+    "id": "pot_123ABC",
+    "name": "Savings",
+    "style": "",
+    "balance": 1000,
+    "currency": "GBP",
+    "created": "2018-01-01T01:01:01.000Z",
+    "updated": "2018-01-01T01:01:01.000Z",
+    "deleted": False,
+    "round_up_multiplier": None,
+    "round_up": False,
+    "type": "default",
+    "locked": False,
+}
+
+
+def _responses() -> dict[str, dict]:
+    """
+    Build the responses for a user with two accounts.
+
+    Returns:
+        Dictionary of path to response
+    """
+    accounts = load_data(path="mock_responses", filename="Accounts")
+    account = accounts["data"]["accounts"][0]
+    accounts["data"]["accounts"] = [account, {**account, "id": "acc_456DEF", "description": "monzoflex_456DEF"}]
+    return {
+        "/accounts": accounts,
+        "/balance": load_data(path="mock_responses", filename="Balance"),
+        "/pots": {"code": 200, "headers": {}, "data": {"pots": [POT]}},
+    }
+
+
+def _respond(responses: dict[str, dict], path: str, data: dict[str, str]) -> dict:
+    """
+    Answer a request, refusing balance and pots requests for the Flex account.
+
+    Args:
+        responses: Dictionary of path to response
+        path: Path of the request
+        data: Parameters of the request
+
+    Returns:
+        Response for the request
+    """
+    if data.get("account_id", data.get("current_account_id")) == "acc_456DEF":
+        raise MonzoPermissionsError()
+    return responses[path]
+
+
+class TestSnapshot:
+    """Tests for fetching account snapshots."""
+
+    def test_fetch_snapshot(self, mocker):
+        """
+        Test balances and pots are fetched concurrently and a refused request only affects its own account.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        responses = _responses()
+        # Every balance and pots request must be in flight at once for the barrier to release
+        barrier = Barrier(parties=4, timeout=5)
+
+        def get(path, data, headers, timeout):
+            if path != "/accounts":
+                barrier.wait()
+            return _respond(responses=responses, path=path, data=data)
+
+        httpio_capture = mocker.patch.object(authentication.HttpIO, "get", side_effect=get)
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+            access_token_expiry=int(time()) + 3600,
+        )
+
+        snapshots = fetch_snapshot(auth=auth)
+
+        assert [snapshot.account.account_id for snapshot in snapshots] == ["acc_123ABC", "acc_456DEF"]
+        assert snapshots[0].balance.balance == 40000
+        assert snapshots[0].account.balance is snapshots[0].balance
+        assert [pot.pot_id for pot in snapshots[0].pots] == ["pot_123ABC"]
+        assert snapshots[1].balance is None
+        assert snapshots[1].pots is None
+        assert httpio_capture.call_count == 5
+
+    def test_fetch_snapshot_async(self, mocker):
+        """
+        Test the asyncio snapshot gathers balances and pots with the same error isolation.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        responses = _responses()
+
+        async def get(path, data, headers, timeout):
+            return _respond(responses=responses, path=path, data=data)
+
+        httpio_capture = mocker.patch.object(AsyncHttpIO, "get", new_callable=AsyncMock, side_effect=get)
+        auth = AsyncAuthentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+            access_token_expiry=int(time()) + 3600,
+        )
+
+        snapshots = asyncio.run(fetch_snapshot_async(auth=auth))
+
+        assert snapshots[0].balance.total_balance == 60000
+        assert len(snapshots[0].pots) == 1
+        assert snapshots[1].balance is None
+        assert snapshots[1].pots is None
+        assert httpio_capture.await_count == 5
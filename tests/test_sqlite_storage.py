@@ -0,0 +1,131 @@
+"""Tests for the SQLite credential storage."""
+
+import os
+import sqlite3
+import stat
+from threading import Event, Thread
+from unittest.mock import MagicMock
+
+import pytest
+
+from monzo.exceptions import MonzoGeneralError
+from monzo.handlers.sqlite import CredentialDatabase, SQLiteStorage
+
+
+class TestSQLiteStorage:
+    """Tests for the SQLite credential storage."""
+
+    def test_store_and_fetch(self, tmp_path):
+        """
+        Test credentials for many keys are stored in one WAL database and found by client ID.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        path = str(tmp_path / "credentials.db")
+        database = CredentialDatabase(database=path)
+        storages = [SQLiteStorage(database=database, key=f"user_{index:02d}") for index in range(20)]
+
+        threads = [
+            Thread(
+                target=storage.store,
+                kwargs={
+                    "access_token": f"token_{index}",
+                    "client_id": "client_a" if index % 2 else "client_b",
+                    "client_secret": "secret",
+                    "expiry": 1000 + index,
+                    "refresh_token": "refresh",
+                },
+            )
+            for index, storage in enumerate(storages)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        storages[3].store(access_token="new", client_id="client_a", client_secret="secret", expiry=5000)
+
+        assert storages[0].fetch() == {
+            "access_token": "token_0",
+            "client_id": "client_b",
+            "client_secret": "secret",
+            "expiry": 1000,
+            "refresh_token": "refresh",
+        }
+        assert storages[3].fetch()["access_token"] == "new"
+        assert SQLiteStorage(database=database, key="missing").fetch() == {}
+        assert len(database.keys(client_id="client_a")) == 10
+        for suffix in ("", "-wal", "-shm"):
+            assert stat.S_IMODE(os.stat(f"{path}{suffix}").st_mode) == 0o600
+        database.close()
+
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert connection.execute("SELECT COUNT(*) FROM credentials").fetchone()[0] == 20
+
+    def test_leader_failure_releases_followers(self, tmp_path):
+        """
+        Test writers waiting on a transaction are released with an error when the writer committing it fails.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        database = CredentialDatabase(database=str(tmp_path / "credentials.db"), batch_window=0.2)
+        connection = MagicMock()
+        connection.__exit__.return_value = False
+        connection.executemany.side_effect = RuntimeError("failed")
+        database._connection = connection
+        errors: list[Exception] = []
+
+        def store(key: str):
+            try:
+                database.store(row=(key, "client", "secret", "token", 1000, "refresh"))
+            except (MonzoGeneralError, RuntimeError) as exc:
+                errors.append(exc)
+
+        threads = [Thread(target=store, args=(f"user_{index}",)) for index in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert sorted(type(error).__name__ for error in errors) == [
+            "MonzoGeneralError",
+            "MonzoGeneralError",
+            "RuntimeError",
+        ]
+        assert all(
+            isinstance(error.__cause__, RuntimeError) for error in errors if isinstance(error, MonzoGeneralError)
+        )
+        with pytest.raises(expected_exception=RuntimeError):
+            database.store(row=("user_0", "client", "secret", "token", 1000, "refresh"))
+
+    def test_read_during_write(self, tmp_path):
+        """
+        Test reads are answered from the last commit while a write is being committed.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+        """
+        database = CredentialDatabase(database=str(tmp_path / "credentials.db"), batch_window=0)
+        database.store(row=("user_0", "client", "secret", "token", 1000, "refresh"))
+        writing = Event()
+        release = Event()
+        connection = MagicMock()
+        connection.__exit__.return_value = False
+        connection.executemany.side_effect = lambda *args: writing.set() or release.wait(timeout=5)
+        database._connection = connection
+        writer = Thread(target=database.store, kwargs={"row": ("user_1", "client", "secret", "new", 2000, "refresh")})
+        writer.start()
+
+        assert writing.wait(timeout=5)
+        reader = Thread(target=lambda: (database.fetch(key="user_0"), database.keys(client_id="client")))
+        reader.start()
+        reader.join(timeout=1)
+        alive = reader.is_alive()
+        release.set()
+        writer.join(timeout=5)
+
+        assert not alive
+        assert database.fetch(key="user_0")["access_token"] == "token"
@@ -0,0 +1,70 @@
+"""Tests for the local transaction store."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from monzo import authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.store import TransactionStore
+from tests.helpers import load_data
+
+
+class TestTransactionStore:
+    """Tests for the local transaction store."""
+
+    def test_upsert_and_spend_by_category(self):
+        """Test transactions are upserted by ID and totalled by category excluding declined transactions."""
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        transactions = [
+            Transaction(auth=auth, transaction_data={**template, "id": "tx_1", "amount": -100}),
+            Transaction(
+                auth=auth, transaction_data={**template, "id": "tx_2", "amount": -250, "category": "eating_out"}
+            ),
+            Transaction(auth=auth, transaction_data={**template, "id": "tx_3", "decline_reason": "INSUFFICIENT_FUNDS"}),
+        ]
+        store = TransactionStore(database=":memory:")
+
+        assert store.upsert(transactions=transactions) == 3
+        store.upsert(transactions=[Transaction(auth=auth, transaction_data={**template, "id": "tx_1", "amount": -300})])
+
+        assert store.spend_by_category(account_id="acc_123ABC") == {"bills": -300, "eating_out": -250}
+        assert (
+            store.spend_by_category(
+                account_id="acc_123ABC",
+                since=datetime(year=2022, month=9, day=1, tzinfo=UTC),
+            )
+            == {}
+        )
+        assert [row["id"] for row in store.fetch(account_id="acc_123ABC", category="bills")] == ["tx_1", "tx_3"]
+        store.close()
+
+    def test_filter_with_offset(self):
+        """Test since and before with a non-UTC offset are compared in UTC."""
+        auth = authentication.Authentication(
+            client_id="client_id",
+            client_secret="client_secret",
+            redirect_url="",
+            access_token="access_token",
+        )
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        store = TransactionStore(database=":memory:")
+        store.upsert(transactions=[Transaction(auth=auth, transaction_data={**template, "id": "tx_1"})])
+        paris = timezone(timedelta(hours=2))
+
+        assert store.spend_by_category(
+            account_id="acc_123ABC",
+            since=datetime(year=2022, month=8, day=9, hour=16, tzinfo=paris),
+        ) == {"bills": template["amount"]}
+        assert (
+            store.spend_by_category(
+                account_id="acc_123ABC",
+                before=datetime(year=2022, month=8, day=9, hour=16, minute=15, tzinfo=paris),
+            )
+            == {}
+        )
+        store.close()
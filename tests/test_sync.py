@@ -0,0 +1,71 @@
+"""Tests for incremental transaction sync."""
+
+from datetime import timedelta
+
+from monzo import authentication
+from monzo.handlers.filesystem_sync_state import FileSystemSyncState
+from monzo.sync import TransactionSync
+from tests.helpers import Handler, load_data
+
+
+class TestTransactionSync:
+    """Tests for incremental transaction sync."""
+
+    def test_run_resumes_from_high_water_mark(self, tmp_path, mocker):
+        """
+        Test later runs only request transactions after the stored mark less the look-back window.
+
+        A transaction created in the same instant as the mark with a later ID moves the mark on.
+
+        Args:
+            tmp_path: Pytest fixture for temporary directory.
+            mocker: Pytest mocker fixture
+        """
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        httpio_capture = mocker.patch.object(
+            authentication.HttpIO,
+            "get",
+            side_effect=[
+                {
+                    "code": 200,
+                    "headers": {},
+                    "data": {
+                        "transactions": [
+                            {**template, "id": "tx_1", "created": "2022-08-01T10:00:00Z"},
+                            {**template, "id": "tx_2", "created": "2022-08-09T14:15:01Z"},
+                        ]
+                    },
+                },
+                {"code": 200, "headers": {}, "data": {"transactions": []}},
+                {
+                    "code": 200,
+                    "headers": {},
+                    "data": {"transactions": [{**template, "id": "tx_3", "created": "2022-08-09T14:15:01Z"}]},
+                },
+            ],
+        )
+
+        credentials = Handler().fetch()
+
+        auth = authentication.Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+        state = FileSystemSyncState(file=str(tmp_path / "sync.json"))
+        sync = TransactionSync(auth=auth, state=state, look_back=timedelta(days=1))
+
+        assert len(sync.run(account_id="acc_123ABC")) == 2
+        assert "since" not in httpio_capture.call_args.kwargs["data"]
+        assert state.fetch(account_id="acc_123ABC")["transaction_id"] == "tx_2"
+
+        assert sync.run(account_id="acc_123ABC") == []
+        assert httpio_capture.call_args.kwargs["data"]["since"] == "2022-08-08T14:15:01Z"
+        assert state.fetch(account_id="acc_123ABC")["transaction_id"] == "tx_2"
+
+        assert len(sync.run(account_id="acc_123ABC")) == 1
+        assert state.fetch(account_id="acc_123ABC")["transaction_id"] == "tx_3"
+        assert [path.name for path in tmp_path.iterdir()] == ["sync.json"]
@@ -0,0 +1,86 @@
+"""Tests for the columnar transaction batch."""
+
+import tracemalloc
+from datetime import UTC, datetime
+
+from monzo import authentication
+from monzo.endpoints.transaction import Transaction
+from monzo.transaction_batch import TransactionBatch
+from tests.helpers import Handler, load_data
+
+
+class TestTransactionBatch:
+    """Tests for the columnar transaction batch."""
+
+    def test_fetch(self, mocker):
+        """
+        Test pages are loaded into columns and rows convert back to transactions.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        page = [
+            {**template, "id": "tx_1", "amount": -100, "settled": ""},
+            {**template, "id": "tx_22", "amount": -250, "merchant": {"id": "merch_1"}, "category": "eating_out"},
+        ]
+        mocker.patch.object(
+            authentication.HttpIO,
+            "get",
+            return_value={"code": 200, "headers": {}, "data": {"transactions": page}},
+        )
+        credentials = Handler().fetch()
+        auth = authentication.Authentication(
+            client_id=str(credentials["client_id"]),
+            client_secret=str(credentials["client_secret"]),
+            redirect_url="",
+            access_token=str(credentials["access_token"]),
+            access_token_expiry=int(credentials["expiry"]),
+            refresh_token=str(credentials["refresh_token"]),
+        )
+
+        batch = TransactionBatch.fetch(auth=auth, account_id="acc_123ABC", page_size=100)
+
+        assert len(batch) == 2
+        assert list(batch.amounts) == [-100, -250]
+        assert list(batch.categories) == [template["category"], "eating_out"]
+        assert batch.categories.values == [template["category"], "eating_out"]
+        assert batch.merchants[1] == "merch_1"
+        assert batch.categories[0] is batch[0].category
+        assert batch[-1].transaction_id == "tx_22"
+        assert batch[0].settled is None
+        assert batch[1].created == datetime(
+            year=2022, month=8, day=9, hour=14, minute=15, second=1, microsecond=328000, tzinfo=UTC
+        )
+        assert [row.transaction_id for row in batch] == ["tx_1", "tx_22"]
+
+        transactions = list(batch.transactions())
+        eager = Transaction(auth=auth, transaction_data=page[1])
+        assert transactions[1].created == eager.created
+        assert transactions[1].settled == eager.settled
+        assert transactions[1].amount == eager.amount
+        assert transactions[1].merchant == "merch_1"
+        assert transactions[0].settled is None
+
+    def test_memory_per_row(self):
+        """Test rows with unique IDs, descriptions and notes are held without a string object per row."""
+        template = load_data(path="mock_responses", filename="Transaction")["data"]["transactions"][0]
+        rows = [
+            {**template, "id": f"tx_{index:024d}", "description": f"CARD PAYMENT {index}", "notes": f"note {index}"}
+            for index in range(20_000)
+        ]
+        auth = authentication.Authentication(client_id="client_id", client_secret="client_secret", redirect_url="")
+
+        tracemalloc.start()
+        try:
+            batch = TransactionBatch(auth=auth)
+            batch.extend(transactions_data=rows)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert batch[-1].description == "CARD PAYMENT 19999"
+        assert batch[-1].notes == "note 19999"
+        assert batch[-1].transaction_id == f"tx_{19_999:024d}"
+        # 42 bytes of fixed width columns, 28 of codes, 24 of offsets and about 60 of packed text per row
+        assert size / len(rows) < 200
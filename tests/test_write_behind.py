@@ -0,0 +1,126 @@
+"""Tests for the write-behind credential storage."""
+
+from threading import Event
+from time import monotonic
+
+from monzo.authentication import Authentication
+from monzo.handlers.storage import Storage
+from monzo.handlers.write_behind import BackgroundWriter, WriteBehindStorage
+
+
+class SlowStorage(Storage):
+    """Storage that blocks until released and records every write."""
+
+    def __init__(self):
+        """Initialize SlowStorage."""
+        self.release = Event()
+        self.started = Event()
+        self.writes: list[dict] = []
+
+    def fetch(self) -> dict[str, int | str]:
+        """
+        Fetch the last credentials written.
+
+        Returns:
+            Dictionary containing access token, expiry and refresh token
+        """
+        return self.writes[-1] if self.writes else {}
+
+    def store(
+        self,
+        access_token: str,
+        client_id: str,
+        client_secret: str,
+        expiry: int,
+        refresh_token: str = "",
+    ) -> None:
+        """
+        Record the credentials once released.
+
+        Args:
+            access_token: New access token
+            client_id: Monzo client ID
+            client_secret: Monzo client secret
+            expiry: Access token expiry as a unix timestamp
+            refresh_token: Refresh token that can be used to renew an access token
+        """
+        self.started.set()
+        self.release.wait(timeout=5)
+        self.writes.append(
+            {
+                "access_token": access_token,
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "expiry": expiry,
+                "refresh_token": refresh_token,
+            }
+        )
+
+
+class TestWriteBehindStorage:
+    """Tests for the write-behind credential storage."""
+
+    def test_store_coalesces_and_flushes(self):
+        """Test stores return without waiting on the backend and queued writes are coalesced."""
+        backend = SlowStorage()
+        writer = BackgroundWriter()
+        storage = WriteBehindStorage(handler=backend, writer=writer)
+
+        started = monotonic()
+        for expiry in range(5):
+            storage.store(access_token=f"token_{expiry}", client_id="id", client_secret="secret", expiry=expiry)
+        assert monotonic() - started < 1
+        assert storage.fetch()["access_token"] == "token_4"
+        assert not writer.flush(timeout=0.05)
+
+        backend.release.set()
+        writer.close()
+        assert len(backend.writes) <= 2
+        assert backend.writes[-1]["access_token"] == "token_4"
+        assert storage.fetch()["expiry"] == 4
+
+        storage.store(access_token="closed", client_id="id", client_secret="secret", expiry=10)
+        assert backend.writes[-1]["access_token"] == "closed"
+
+    def test_fetch_during_write(self):
+        """Test credentials being written are still fetched until the backend has stored them."""
+        backend = SlowStorage()
+        writer = BackgroundWriter()
+        storage = WriteBehindStorage(handler=backend, writer=writer)
+
+        storage.store(access_token="in_flight", client_id="id", client_secret="secret", expiry=1)
+
+        assert backend.started.wait(timeout=5)
+        assert storage.fetch()["access_token"] == "in_flight"
+
+        backend.release.set()
+        writer.close()
+        assert storage.fetch()["access_token"] == "in_flight"
+        assert writer.pending(handler=backend) is None
+
+    def test_failed_store_is_logged(self, mocker):
+        """
+        Test a failing backend does not stop later writes.
+
+        Args:
+            mocker: Pytest mocker fixture
+        """
+        backend = SlowStorage()
+        backend.release.set()
+        store = mocker.patch.object(backend, "store", side_effect=[OSError("disk full"), None])
+        writer = BackgroundWriter()
+        storage = WriteBehindStorage(handler=backend, writer=writer)
+
+        storage.store(access_token="first", client_id="id", client_secret="secret", expiry=1)
+        assert writer.flush(timeout=5)
+        storage.store(access_token="second", client_id="id", client_secret="secret", expiry=2)
+        writer.close(timeout=5)
+        assert store.call_count == 2
+
+    def test_register_background_handler(self):
+        """Test registering a handler in the background wraps it in write-behind storage."""
+        auth = Authentication(client_id="id", client_secret="secret", redirect_url="", access_token="token")
+        backend = SlowStorage()
+        auth.register_callback_handler(handler=backend, background=True)
+        assert isinstance(auth._handlers[0], WriteBehindStorage)
+        assert auth._handlers[0].handler is backend